@@ -0,0 +1,106 @@
+import math
+import pygame
+
+class AssetManager:
+    """
+    Process-wide image cache.
+
+    Every file is decoded once. Scaled and rotated variants are cached by
+    (path, size, rotation), so every Pacman, ghost and end screen of every
+    game shares the same surfaces. The cached variants can be packed into
+    a single atlas surface, in which case get_image returns subsurfaces of
+    the atlas.
+    """
+    def __init__(self):
+        self.originals = {}  # {path: decoded Surface}
+        self.variants = {}  # {(path, size, rotation): Surface}
+        self.atlas = None
+        self.decoded = 0  # Number of files decoded, for measurements
+
+    def load(self, path):
+        """
+        Decode an image file once
+
+        Args:
+            path (str): Image file
+
+        Returns:
+            pygame.Surface: The decoded image, converted for fast blitting
+        """
+        image = self.originals.get(path)
+        if image is None:
+            image = pygame.image.load(path).convert_alpha()
+            self.originals[path] = image
+            self.decoded += 1
+        return image
+
+    def get_image(self, path, size=None, rotation=0):
+        """
+        Get an image scaled and then rotated, creating the variant on first use
+
+        Args:
+            path (str): Image file
+            size (tuple): (width, height) to scale to, None keeps the file's size
+            rotation (int): Counter-clockwise rotation in degrees
+
+        Returns:
+            pygame.Surface: The cached variant, shared by every caller
+        """
+        key = (path, size, rotation)
+        image = self.variants.get(key)
+        if image is None:
+            image = self.load(path)
+            if size is not None and size != image.get_size():
+                image = pygame.transform.scale(image, size)
+            if rotation % 360:
+                image = pygame.transform.rotate(image, rotation)
+            self.variants[key] = image
+        return image
+
+    def pack_atlas(self):
+        """
+        Pack every cached variant into one surface with a simple shelf
+        packer and replace the variants with subsurfaces of it. Only images
+        requested after packing come from the atlas.
+
+        Returns:
+            pygame.Surface: The atlas
+        """
+        keys = sorted(self.variants, key=lambda key: self.variants[key].get_height(), reverse=True)
+        if not keys:
+            return None
+
+        # Shelves as wide as a square holding the total area
+        area = sum(self.variants[key].get_width() * self.variants[key].get_height() for key in keys)
+        width = max(int(math.ceil(math.sqrt(area))), max(self.variants[key].get_width() for key in keys))
+
+        positions = {}
+        x = y = shelf_height = 0
+        for key in keys:
+            image_width, image_height = self.variants[key].get_size()
+            if x + image_width > width:
+                x, y = 0, y + shelf_height
+                shelf_height = 0
+            positions[key] = (x, y)
+            x += image_width
+            shelf_height = max(shelf_height, image_height)
+
+        atlas = pygame.Surface((width, y + shelf_height), pygame.SRCALPHA).convert_alpha()
+        atlas.fill((0, 0, 0, 0))
+        for key, position in positions.items():
+            image = self.variants[key]
+            # RGBA_MAX onto a transparent surface copies pixels and alpha unchanged
+            atlas.blit(image, position, special_flags=pygame.BLEND_RGBA_MAX)
+            self.variants[key] = atlas.subsurface(pygame.Rect(position, image.get_size()))
+
+        self.atlas = atlas
+        return atlas
+
+    def clear(self):
+        """Drop every cached image"""
+        self.originals.clear()
+        self.variants.clear()
+        self.atlas = None
+
+# Shared by the whole process
+ASSETS = AssetManager()
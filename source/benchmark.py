@@ -0,0 +1,797 @@
+"""
+Benchmarks for the maze and ghost pathfinding code.
+
+Run from the repository root, for example:
+    python source/benchmark.py collision --sizes 81x61 161x121
+"""
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import argparse
+import json
+import platform
+import random
+import tempfile
+import time
+import tracemalloc
+import pygame
+import config
+from maze import Maze
+from pacman import Pacman
+from mazeGenerator import generate_maze, write_maze
+from mazeFile import write_maze_file
+from flowField import FlowField
+from pathTable import PathTable
+from landmarks import Landmarks
+from gridBFS import GridBFS
+from headless import init_headless_display, RandomPacmanPolicy
+from world import World
+from engine import GameEngine
+from ghostGrid import GhostGrid
+from main import draw_full_frame, draw_dirty_frame, SCORE_POSITION
+
+# Fixed cell size so that large mazes are not scaled down to nothing
+BENCHMARK_CELL_SIZE = 24
+
+# Sizes of the generated mazes used next to input/maze.txt
+DEFAULT_SIZES = ['81x61', '161x121']
+
+def parse_size(text):
+    """Parse a 'COLSxROWS' string into a (cols, rows) tuple"""
+    cols, rows = text.lower().split('x')
+    return int(cols), int(rows)
+
+def benchmark_mazes(sizes, seed, loop_density=0.1):
+    """
+    Build the list of mazes to benchmark
+
+    Args:
+        sizes (list): Generated maze sizes as 'COLSxROWS' strings
+        seed (int): Seed for the maze generator
+        loop_density (float): Loop density of the generated mazes
+
+    Returns:
+        list: (name, layout) pairs, starting with input/maze.txt
+    """
+    mazes = [('input/maze.txt', config.load_maze_layout())]
+    for size in sizes:
+        cols, rows = parse_size(size)
+        mazes.append((f'generated {cols}x{rows}', generate_maze(cols, rows, seed=seed, loop_density=loop_density)))
+    return mazes
+
+def time_call(func, repeats):
+    """Return the mean wall time of func() in seconds over several runs"""
+    start = time.perf_counter()
+    for _ in range(repeats):
+        func()
+    return (time.perf_counter() - start) / repeats
+
+def spawn_ghost(ghost_type, maze, pacman):
+    """
+    Create a single ghost of the given type on the spawn cell of its color
+    (variants such as 'red-incremental' use the 'red' spawn), falling back
+    to Pacman's spawn.
+    """
+    positions = maze.get_initial_entity_positions()
+    color = ghost_type.split('-')[0]
+    symbol = next((symbol for symbol, spawn_type in config.GHOST_SPAWNS.items() if spawn_type == color), 'M')
+    return config.GHOST_TYPES[ghost_type](positions.get(symbol, positions['M']), maze.cell_size, maze, pacman)
+
+def bench_collision(args):
+    """
+    Compare the grid lookup in Maze.check_collision against a linear scan over
+    one rect per wall cell, then time a full path recompute for each ghost type.
+    """
+    rng = random.Random(args.seed)
+    for name, layout in benchmark_mazes(args.sizes, args.seed, args.loop_density):
+        maze = Maze(BENCHMARK_CELL_SIZE, layout)
+        pacman = Pacman(maze.get_initial_entity_positions()['M'], maze.cell_size, maze)
+
+        # Random Pacman-sized query rects spread over the whole maze
+        size = pacman.radius * 2
+        rects = [
+            pygame.Rect(rng.randrange(maze.cols * maze.cell_size), rng.randrange(maze.rows * maze.cell_size), size, size)
+            for _ in range(args.queries)
+        ]
+        # Per-cell rects even with MERGE_WALL_RECTS, which changes maze.walls
+        walls = [maze.get_cells_rect(index % maze.cols, index // maze.cols, 1, 1)
+                 for index in maze.iter_set_indices(maze.wall_grid)]
+        linear_hits = [any(rect.colliderect(wall) for wall in walls) for rect in rects]
+        grid_hits = [maze.check_collision(rect) for rect in rects]
+        assert linear_hits == grid_hits, "grid lookup disagrees with the linear scan"
+
+        linear_time = time_call(lambda: [any(rect.colliderect(wall) for wall in walls) for rect in rects], 1)
+        grid_time = time_call(lambda: [maze.check_collision(rect) for rect in rects], 1)
+
+        print(f"{name}: {maze.cols}x{maze.rows} cells, {len(walls)} walls")
+        print(f"  check_collision  linear {linear_time / len(rects) * 1e6:8.2f} us/query"
+              f"   grid {grid_time / len(rects) * 1e6:8.2f} us/query")
+
+        for ghost_type in config.GHOST_TYPES:
+            ghost = spawn_ghost(ghost_type, maze, pacman)
+            path = run_full_search(ghost)
+            elapsed = time_call(lambda: run_full_search(ghost), args.repeats)
+            print(f"  {ghost_type:16s} recompute {elapsed * 1e3:10.3f} ms   path length {len(path)}")
+
+def get_open_cells(maze):
+    """List every open grid cell of a maze"""
+    return [(x, y) for y in range(maze.rows) for x in range(maze.cols) if not maze.is_wall(x, y)]
+
+def cell_center(maze, cell):
+    """Pixel position of the center of a grid cell"""
+    return cell[0] * maze.cell_size + maze.cell_size // 2, cell[1] * maze.cell_size + maze.cell_size // 2
+
+def bench_flowfield(args):
+    """
+    Compare the chase cost per Pacman move: every ghost running its own
+    search against one shared flow field that every ghost walks down.
+    """
+    rng = random.Random(args.seed)
+    ghost_types = list(config.GHOST_TYPES)
+    for name, layout in benchmark_mazes(args.sizes, args.seed, args.loop_density):
+        maze = Maze(BENCHMARK_CELL_SIZE, layout)
+        pacman = Pacman(maze.get_initial_entity_positions()['M'], maze.cell_size, maze)
+        open_cells = get_open_cells(maze)
+        print(f"{name}: {maze.cols}x{maze.rows} cells")
+
+        for ghost_count in args.ghosts:
+            ghosts = GhostGrid()
+            for index, cell in enumerate(rng.sample(open_cells, ghost_count)):
+                ghost_class = config.GHOST_TYPES[ghost_types[index % len(ghost_types)]]
+                ghost = ghost_class(cell_center(maze, cell), maze.cell_size, maze, pacman)
+                ghost.peers = ghosts  # The ghosts see each other, as in a game
+                ghosts.add(ghost)
+            targets = rng.sample(open_cells, args.repeats)
+
+            def move_pacman(cell):
+                pacman.x, pacman.y = cell_center(maze, cell)
+
+            def run_searches():
+                for cell in targets:
+                    move_pacman(cell)
+                    for ghost in ghosts:
+                        ghost.calculate_path()
+
+            flow_field = FlowField(maze, pacman)
+
+            def run_flow_field():
+                for cell in targets:
+                    move_pacman(cell)
+                    for ghost in ghosts:
+                        flow_field.get_path(ghost.get_grid_position(ghost.x, ghost.y))
+
+            search_time = time_call(run_searches, 1) / len(targets)
+            flow_time = time_call(run_flow_field, 1) / len(targets)
+            print(f"  {ghost_count:4d} ghosts   per-ghost search {search_time * 1e3:10.3f} ms/move"
+                  f"   flow field {flow_time * 1e3:8.3f} ms/move")
+
+def bench_pathtable(args):
+    """
+    Time building and loading the all-pairs path table, then compare a live
+    search with a table lookup for the BFS, UCS and A* ghosts.
+    """
+    rng = random.Random(args.seed)
+    cache_dir = os.path.join(config.CACHE_DIR, 'benchmark')
+    for name, layout in benchmark_mazes(args.sizes, args.seed, args.loop_density):
+        maze = Maze(BENCHMARK_CELL_SIZE, layout)
+        open_cells = get_open_cells(maze)
+        if len(open_cells) > args.max_table_cells:
+            print(f"{name}: skipped, {len(open_cells)} walkable cells (limit {args.max_table_cells})")
+            continue
+
+        cache_path = os.path.join(cache_dir, f'pathTable-{PathTable.get_maze_key(maze)}.npy')
+        if os.path.exists(cache_path):
+            os.remove(cache_path)
+        build_time = time_call(lambda: PathTable.load_or_build(maze, cache_dir), 1)
+        load_time = time_call(lambda: PathTable.load_or_build(maze, cache_dir), args.repeats)
+        path_table = PathTable.load_or_build(maze, cache_dir)
+        print(f"{name}: {len(open_cells)} walkable cells, build {build_time:.3f} s,"
+              f" cached load {load_time * 1e3:.3f} ms")
+
+        pacman = Pacman(maze.get_initial_entity_positions()['M'], maze.cell_size, maze)
+        queries = [rng.sample(open_cells, 2) for _ in range(args.repeats * 10)]
+        for ghost_type in ['blue', 'orange', 'red']:
+            ghost = config.GHOST_TYPES[ghost_type](cell_center(maze, queries[0][0]), maze.cell_size, maze, pacman)
+
+            def run_queries():
+                for start, goal in queries:
+                    ghost.x, ghost.y = cell_center(maze, start)
+                    pacman.x, pacman.y = cell_center(maze, goal)
+                    ghost.calculate_path()
+
+            ghost.path_table = None
+            search_time = time_call(run_queries, 1) / len(queries)
+            ghost.path_table = path_table
+            table_time = time_call(run_queries, 1) / len(queries)
+            print(f"  {ghost_type:8s} live search {search_time * 1e3:8.3f} ms/query"
+                  f"   table lookup {table_time * 1e3:8.3f} ms/query")
+
+def bench_junction(args):
+    """
+    Time building the junction graph, then compare cell-level searches with
+    junction graph searches for the BFS, UCS and A* ghosts on the same
+    random queries, checking that both find paths of the same length.
+    """
+    rng = random.Random(args.seed)
+    for name, layout in benchmark_mazes(args.sizes, args.seed, args.loop_density):
+        maze = Maze(BENCHMARK_CELL_SIZE, layout)
+        open_cells = get_open_cells(maze)
+        build_time = time_call(maze.get_junction_graph, 1)
+        junction_graph = maze.get_junction_graph()
+        print(f"{name}: {len(open_cells)} walkable cells, {len(junction_graph.nodes)} nodes,"
+              f" {len(junction_graph.corridors)} corridors, build {build_time * 1e3:.2f} ms")
+
+        pacman = Pacman(maze.get_initial_entity_positions()['M'], maze.cell_size, maze)
+        queries = [rng.sample(open_cells, 2) for _ in range(args.repeats * 10)]
+        for ghost_type in ['blue', 'orange', 'red']:
+            ghost = config.GHOST_TYPES[ghost_type](cell_center(maze, queries[0][0]), maze.cell_size, maze, pacman)
+
+            def run_queries():
+                lengths, expanded = [], 0
+                for start, goal in queries:
+                    ghost.x, ghost.y = cell_center(maze, start)
+                    pacman.x, pacman.y = cell_center(maze, goal)
+                    lengths.append(len(ghost.calculate_path()))
+                    expanded += ghost.expanded_nodes
+                return lengths, expanded
+
+            ghost.junction_graph = None
+            cell_lengths, cell_expanded = run_queries()
+            cell_time = time_call(run_queries, 1) / len(queries)
+            ghost.junction_graph = junction_graph
+            graph_lengths, graph_expanded = run_queries()
+            graph_time = time_call(run_queries, 1) / len(queries)
+            assert cell_lengths == graph_lengths, "junction graph path is not as short"
+            print(f"  {ghost_type:8s} cells {cell_time * 1e3:8.3f} ms/query {cell_expanded / len(queries):8.1f} expanded"
+                  f"   junctions {graph_time * 1e3:8.3f} ms/query {graph_expanded / len(queries):8.1f} expanded")
+
+def bench_jps(args):
+    """
+    Compare the red ghost's A* with its Jump Point Search variant on the
+    same random queries: time and expanded nodes per query, checking that
+    both find paths of the same length. Raise --loop-density for more open
+    mazes.
+    """
+    rng = random.Random(args.seed)
+    for name, layout in benchmark_mazes(args.sizes, args.seed, args.loop_density):
+        maze = Maze(BENCHMARK_CELL_SIZE, layout)
+        open_cells = get_open_cells(maze)
+        pacman = Pacman(maze.get_initial_entity_positions()['M'], maze.cell_size, maze)
+        queries = [rng.sample(open_cells, 2) for _ in range(args.repeats * 10)]
+        print(f"{name}: {len(open_cells)} walkable cells")
+
+        lengths = {}
+        for ghost_type in ['red', 'red-jps']:
+            ghost = spawn_ghost(ghost_type, maze, pacman)
+
+            def run_queries():
+                query_lengths, expanded = [], 0
+                for start, goal in queries:
+                    ghost.x, ghost.y = cell_center(maze, start)
+                    pacman.x, pacman.y = cell_center(maze, goal)
+                    query_lengths.append(len(ghost.calculate_path()))
+                    expanded += ghost.expanded_nodes
+                return query_lengths, expanded
+
+            lengths[ghost_type], expanded = run_queries()
+            elapsed = time_call(run_queries, 1) / len(queries)
+            print(f"  {ghost_type:8s} {elapsed * 1e3:8.3f} ms/query   {expanded / len(queries):8.1f} expanded/query")
+        assert lengths['red'] == lengths['red-jps'], "jump point path is not optimal"
+
+def bench_landmarks(args):
+    """
+    Compare the Manhattan heuristic with the landmark (ALT) heuristic for
+    --landmarks landmark counts: build time, then time and expanded nodes
+    per query of the A* and JPS red ghosts on the same random queries,
+    checking that every heuristic finds paths of the same length.
+    """
+    rng = random.Random(args.seed)
+    for name, layout in benchmark_mazes(args.sizes, args.seed, args.loop_density):
+        maze = Maze(BENCHMARK_CELL_SIZE, layout)
+        open_cells = get_open_cells(maze)
+        pacman = Pacman(maze.get_initial_entity_positions()['M'], maze.cell_size, maze)
+        queries = [rng.sample(open_cells, 2) for _ in range(args.repeats * 10)]
+        print(f"{name}: {len(open_cells)} walkable cells")
+
+        for ghost_type in ['red', 'red-jps']:
+            ghost = spawn_ghost(ghost_type, maze, pacman)
+
+            def run_queries():
+                lengths, expanded = [], 0
+                for start, goal in queries:
+                    ghost.x, ghost.y = cell_center(maze, start)
+                    pacman.x, pacman.y = cell_center(maze, goal)
+                    lengths.append(len(ghost.calculate_path()))
+                    expanded += ghost.expanded_nodes
+                return lengths, expanded
+
+            baseline = None
+            for count in [0] + args.landmarks:
+                build_time = 0.0
+                ghost.landmarks = None
+                if count:
+                    build_time = time_call(lambda: Landmarks(maze, count), 1)
+                    ghost.landmarks = Landmarks(maze, count)
+                lengths, expanded = run_queries()
+                elapsed = time_call(run_queries, 1) / len(queries)
+                if baseline is None:
+                    baseline = (lengths, expanded)
+                assert lengths == baseline[0], "landmark heuristic path is not optimal"
+                label = f"{count} landmarks" if count else "Manhattan"
+                print(f"  {ghost_type:8s} {label:13s} {elapsed * 1e3:8.3f} ms/query"
+                      f"   {expanded / len(queries):8.1f} expanded/query"
+                      f" ({expanded / baseline[1]:6.1%})   build {build_time * 1e3:8.2f} ms")
+
+def bench_grid_bfs(args):
+    """
+    Compare the blue ghost's BFS, one query at a time, with the bit-packed
+    NumPy BFS kernel answering the same random queries in batches of each
+    --batch size, checking that both find the same path lengths. The
+    kernel's real user is PathTable.build_table, see the pathtable benchmark.
+    """
+    rng = random.Random(args.seed)
+    query_count = max(args.batch)
+    for name, layout in benchmark_mazes(args.sizes, args.seed, args.loop_density):
+        maze = Maze(BENCHMARK_CELL_SIZE, layout)
+        open_cells = get_open_cells(maze)
+        pacman = Pacman(maze.get_initial_entity_positions()['M'], maze.cell_size, maze)
+        ghost = spawn_ghost('blue', maze, pacman)
+        queries = [tuple(rng.sample(open_cells, 2)) for _ in range(query_count)]
+        print(f"{name}: {maze.cols}x{maze.rows} cells, {len(open_cells)} walkable")
+
+        start = time.perf_counter()
+        expected = []
+        for query_start, goal in queries:
+            ghost.x, ghost.y = cell_center(maze, query_start)
+            pacman.x, pacman.y = cell_center(maze, goal)
+            path = ghost.calculate_path()
+            expected.append(len(path) - 1 if path[-1] == goal else -1)
+        ghost_time = (time.perf_counter() - start) / query_count
+        print(f"  blue ghost BFS       {ghost_time * 1e3:10.3f} ms/query")
+
+        kernel = GridBFS(maze)
+        for batch in args.batch:
+            start = time.perf_counter()
+            lengths = []
+            for first in range(0, query_count, batch):
+                lengths.extend(kernel.path_lengths(queries[first:first + batch]))
+            kernel_time = (time.perf_counter() - start) / query_count
+            assert lengths == expected, "BFS kernel path length differs from the ghost's BFS"
+            print(f"  kernel batch {batch:5d}   {kernel_time * 1e3:10.3f} ms/query"
+                  f"   {ghost_time / kernel_time:6.2f}x")
+
+def bench_incremental(args):
+    """
+    Replay a chase where Pacman wanders randomly and the ghost follows its
+    path, replanning with plain A* and with the incremental red ghost, and
+    compare the work per replan.
+    """
+    for name, layout in benchmark_mazes(args.sizes, args.seed, args.loop_density):
+        rng = random.Random(args.seed)
+        maze = Maze(BENCHMARK_CELL_SIZE, layout)
+        pacman = Pacman(maze.get_initial_entity_positions()['M'], maze.cell_size, maze)
+        # Without shared peers the two ghosts plan independently
+        ghosts = {ghost_type: spawn_ghost(ghost_type, maze, pacman) for ghost_type in ['red', 'red-incremental']}
+
+        ghost_cell = ghosts['red'].get_grid_position(ghosts['red'].x, ghosts['red'].y)
+        pacman_cell = ghosts['red'].get_grid_position(pacman.x, pacman.y)
+        totals = {ghost_type: [0, 0.0] for ghost_type in ghosts}
+        replans = args.repeats * 40
+        for _ in range(replans):
+            # Pacman moves a few cells between replans, the ghost one step
+            for _ in range(rng.randint(1, 4)):
+                pacman_cell = rng.choice(maze.get_adjacent_cells(*pacman_cell) or [pacman_cell])
+            pacman.x, pacman.y = cell_center(maze, pacman_cell)
+
+            paths = {}
+            for ghost_type, ghost in ghosts.items():
+                ghost.x, ghost.y = cell_center(maze, ghost_cell)
+                start = time.perf_counter()
+                paths[ghost_type] = ghost.calculate_path()
+                totals[ghost_type][0] += ghost.expanded_nodes
+                totals[ghost_type][1] += time.perf_counter() - start
+            assert len(paths['red']) == len(paths['red-incremental']), "incremental path is not optimal"
+            if len(paths['red']) > 1:
+                ghost_cell = paths['red'][1]
+
+        print(f"{name}: {replans} replans")
+        for ghost_type, (expanded, elapsed) in totals.items():
+            print(f"  {ghost_type:16s} {expanded / replans:8.1f} expanded/replan   {elapsed / replans * 1e3:8.3f} ms/replan")
+
+def run_full_search(ghost):
+    """Run a search from scratch, dropping any state kept by incremental ghosts"""
+    if hasattr(ghost, 'reset_search'):
+        ghost.reset_search()
+    return ghost.calculate_path()
+
+def bench_search_memory(args):
+    """
+    Time each ghost search and measure its peak allocation with tracemalloc.
+    Run with --loop-density 0 to get perfect mazes with long paths.
+    """
+    for name, layout in benchmark_mazes(args.sizes, args.seed, args.loop_density):
+        maze = Maze(BENCHMARK_CELL_SIZE, layout)
+        pacman = Pacman(maze.get_initial_entity_positions()['M'], maze.cell_size, maze)
+        print(f"{name}: {maze.cols}x{maze.rows} cells")
+        for ghost_type in config.GHOST_TYPES:
+            ghost = spawn_ghost(ghost_type, maze, pacman)
+            run_full_search(ghost)  # Warm up the maze's adjacency cache first
+            tracemalloc.start()
+            path = run_full_search(ghost)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            elapsed = time_call(lambda: run_full_search(ghost), args.repeats)
+            print(f"  {ghost_type:16s} {elapsed * 1e3:10.3f} ms   peak {peak / 1024:10.1f} KiB   path length {len(path)}")
+
+def bench_render(args):
+    """
+    Compare the frame time of redrawing the whole screen with dirty-rect
+    rendering on the maze's cached background. Each mode replays a headless
+    game with the same Pacman seed; only the drawing is timed.
+    """
+    frames = args.repeats * 100
+    for name, layout in benchmark_mazes(args.sizes, args.seed, args.loop_density):
+        size = (len(layout[0]) * BENCHMARK_CELL_SIZE, len(layout) * BENCHMARK_CELL_SIZE + 50)
+        screen = pygame.display.set_mode(size)
+        font = pygame.font.SysFont(None, config.SCORE_FONT['SIZE'])
+        print(f"{name}: {size[0]}x{size[1]} pixels")
+
+        for mode in ['full', 'dirty']:
+            world = World(layout, BENCHMARK_CELL_SIZE)
+            engine = world.engine
+            policy = RandomPacmanPolicy(args.seed)
+            if mode == 'dirty':
+                screen.blit(world.maze.render_background(size), (0, 0))
+                pygame.display.flip()
+            score_rect = pygame.Rect(SCORE_POSITION, (0, 0))
+
+            elapsed = 0.0
+            drawn = 0
+            while drawn < frames:
+                policy.act(engine.pacman, engine.ticks)
+                if engine.step() != GameEngine.RUNNING:
+                    break
+                start = time.perf_counter()
+                score_text = font.render(f"Score: {engine.score}", True, config.SCORE_FONT['COLOR'])
+                if mode == 'dirty':
+                    score_rect = draw_dirty_frame(screen, world, score_text, score_rect)
+                else:
+                    draw_full_frame(screen, world, score_text)
+                elapsed += time.perf_counter() - start
+                drawn += 1
+            print(f"  {mode:6s} {elapsed / drawn * 1e3:8.3f} ms/frame over {drawn} frames")
+
+def bench_walls(args):
+    """
+    Compare one wall rect per wall cell with greedy-merged wall rectangles
+    and with the pre-rendered wall layer: rect count, build time, the time
+    of a full-screen Maze.draw and of a linear rect scan for collisions.
+    """
+    rng = random.Random(args.seed)
+    modes = [('per cell', False, False), ('merged', True, False), ('layer', True, True)]
+    saved = config.MERGE_WALL_RECTS, config.PRERENDER_WALLS
+    for name, layout in benchmark_mazes(args.sizes, args.seed, args.loop_density):
+        print(f"{name}:")
+        pixels = {}
+        for label, merge, prerender in modes:
+            config.MERGE_WALL_RECTS, config.PRERENDER_WALLS = merge, prerender
+            try:
+                maze = Maze(BENCHMARK_CELL_SIZE, layout)
+                surface = pygame.Surface((maze.cols * maze.cell_size, maze.rows * maze.cell_size)).convert()
+                build_time = time_call(lambda: maze.get_wall_layer() if prerender else maze.walls, 1)
+                maze.draw(surface)
+                draw_time = time_call(lambda: maze.draw(surface), args.repeats * 4)
+            finally:
+                config.MERGE_WALL_RECTS, config.PRERENDER_WALLS = saved
+            pixels[label] = pygame.image.tobytes(surface, 'RGB')
+
+            size = maze.cell_size // 2
+            rects = [pygame.Rect(rng.randrange(maze.cols * maze.cell_size), rng.randrange(maze.rows * maze.cell_size),
+                                 size, size) for _ in range(200)]
+            scan_time = time_call(lambda: [rect.collidelist(maze.walls) for rect in rects], 1) / len(rects)
+            print(f"  {label:9s} {len(maze.walls):7d} rects   build {build_time * 1e3:8.3f} ms"
+                  f"   draw {draw_time * 1e3:8.3f} ms   linear scan {scan_time * 1e6:8.2f} us/query")
+        assert len(set(pixels.values())) == 1, "wall modes draw different pixels"
+
+def bench_dots(args):
+    """
+    Time eating dots: a Pacman-sized rect visits every walkable cell in a
+    random order and eats the dots it overlaps, then the remaining dots of a
+    fresh maze are drawn once.
+    """
+    rng = random.Random(args.seed)
+    for name, layout in benchmark_mazes(args.sizes, args.seed, args.loop_density):
+        maze = Maze(BENCHMARK_CELL_SIZE, layout)
+        dot_count = maze.dots_remaining
+        cells = get_open_cells(maze)
+        rng.shuffle(cells)
+        rects = [pygame.Rect(0, 0, maze.cell_size, maze.cell_size) for _ in cells]
+        for rect, cell in zip(rects, cells):
+            rect.center = cell_center(maze, cell)
+
+        start = time.perf_counter()
+        eaten = sum(maze.check_dot_collision(rect) for rect in rects)
+        eat_time = (time.perf_counter() - start) / len(rects)
+        assert eaten == dot_count and maze.are_all_dots_eaten()
+
+        maze = Maze(BENCHMARK_CELL_SIZE, layout)
+        surface = pygame.Surface((maze.cols * maze.cell_size, maze.rows * maze.cell_size))
+        draw_time = time_call(lambda: maze.draw(surface), args.repeats)
+        print(f"{name}: {dot_count} dots   check_dot_collision {eat_time * 1e6:10.2f} us/call"
+              f"   draw {draw_time * 1e3:8.3f} ms")
+
+def load_maze(path):
+    """Load a maze file the way the game does and build its Maze"""
+    return Maze(BENCHMARK_CELL_SIZE, config.load_maze_layout(path))
+
+def bench_maze_file(args):
+    """
+    Compare loading each maze from its text file with loading it from a
+    memory-mapped binary maze file: time and peak traced memory to build
+    the Maze, and the same for a first BFS on it.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        for name, layout in benchmark_mazes(args.sizes, args.seed, args.loop_density):
+            text_path = os.path.join(directory, 'maze.txt')
+            binary_path = os.path.join(directory, 'maze.maze')
+            write_maze(layout, text_path)
+            write_maze_file(layout, binary_path)
+            print(f"{name}: text {os.path.getsize(text_path) / 1024:8.1f} KiB"
+                  f"   binary {os.path.getsize(binary_path) / 1024:8.1f} KiB")
+
+            for label, path in [('text', text_path), ('binary', binary_path)]:
+                load_time = time_call(lambda: load_maze(path), args.repeats)
+                tracemalloc.start()
+                maze = load_maze(path)
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+
+                pacman = Pacman(maze.get_initial_entity_positions()['M'], maze.cell_size, maze)
+                ghost = spawn_ghost('blue', maze, pacman)
+                pacman.x, pacman.y = cell_center(maze, get_open_cells(maze)[-1])
+                search_time = time_call(lambda: run_full_search(ghost), 1)
+                print(f"  {label:6s} load {load_time * 1e3:10.3f} ms   peak {peak / 1024:10.1f} KiB"
+                      f"   first BFS {search_time * 1e3:10.3f} ms")
+
+def bench_snapshot(args):
+    """
+    Time capturing and restoring a mid-game snapshot of a World, resetting
+    it to the first tick, and building a new World from scratch.
+    """
+    for name, layout in benchmark_mazes(args.sizes, args.seed, args.loop_density):
+        build_time = time_call(lambda: World(layout, BENCHMARK_CELL_SIZE), 1)
+        world = World(layout, BENCHMARK_CELL_SIZE)
+        policy = RandomPacmanPolicy(args.seed)
+        while world.engine.ticks < args.repeats * 100:
+            policy.act(world.pacman, world.engine.ticks)
+            if world.engine.step() != GameEngine.RUNNING:
+                break
+        state = world.snapshot()
+
+        repeats = args.repeats * 200
+        snapshot_time = time_call(world.snapshot, repeats)
+        restore_time = time_call(lambda: world.restore(state), repeats)
+        reset_time = time_call(world.reset, repeats)
+        print(f"{name}: snapshot at tick {state['engine'][1]}   snapshot {snapshot_time * 1e6:8.1f} us"
+              f"   restore {restore_time * 1e6:8.1f} us   reset {reset_time * 1e6:8.1f} us"
+              f"   new World {build_time * 1e3:8.2f} ms")
+
+def time_ticks(layout, ticks, seed, frame_time=0.0, **ghost_config):
+    """
+    Play a headless game and time every engine step
+
+    Args:
+        layout (list): Maze layout
+        ticks (int): Maximum number of ticks
+        seed (int): Seed of the random Pacman policy
+        frame_time (float): Pad every tick to this many seconds, like the frame rate cap
+        **ghost_config: GHOST_CONFIG entries to override while the World is built
+
+    Returns:
+        tuple: (sorted step times in seconds, final game state, World)
+    """
+    saved_config = dict(config.GHOST_CONFIG)
+    config.GHOST_CONFIG.update(ghost_config)
+    try:
+        world = World(layout, BENCHMARK_CELL_SIZE)
+    finally:
+        config.GHOST_CONFIG.update(saved_config)
+    engine = world.engine
+    policy = RandomPacmanPolicy(seed)
+
+    times = []
+    while engine.ticks < ticks:
+        policy.act(engine.pacman, engine.ticks)
+        start = time.perf_counter()
+        state = engine.step()
+        elapsed = time.perf_counter() - start
+        times.append(elapsed)
+        if state != GameEngine.RUNNING:
+            break
+        if elapsed < frame_time:
+            time.sleep(frame_time - elapsed)
+    times.sort()
+    return times, state, world
+
+def format_tick_times(times, state):
+    """Summarize sorted step times: mean, 99th percentile and maximum"""
+    mean = sum(times) / len(times)
+    p99 = times[min(len(times) - 1, int(len(times) * 0.99))]
+    return (f"mean {mean * 1e3:7.3f} ms   p99 {p99 * 1e3:7.3f} ms"
+            f"   max {times[-1] * 1e3:7.3f} ms   over {len(times)} ticks ({state})")
+
+def bench_slicing(args):
+    """
+    Compare per-tick step time of headless games with every search run
+    within its frame and with time-sliced searches expanding at most
+    --node-budget nodes per ghost per frame. Both modes replay the same
+    Pacman moves; the slowest ticks show the frame spikes.
+    """
+    ticks = args.repeats * 200
+    for name, layout in benchmark_mazes(args.sizes, args.seed, args.loop_density):
+        print(f"{name}:")
+        for budget in [None, args.node_budget]:
+            times, state, world = time_ticks(layout, ticks, args.seed, SEARCH_NODE_BUDGET=budget)
+            mode = 'synchronous' if budget is None else f'budget {budget}'
+            print(f"  {mode:12s} {format_tick_times(times, state)}")
+
+def bench_planner(args):
+    """
+    Compare per-tick step time on the game thread with searches run in the
+    frame and with searches on --workers planner threads. Ticks are paced
+    to config.FRAME_RATE, the workers run while the game thread waits for
+    the next frame. Only the game thread is timed; the workers share the
+    interpreter lock with it.
+    """
+    ticks = args.repeats * 200
+    frame_time = 1.0 / config.FRAME_RATE
+    for name, layout in benchmark_mazes(args.sizes, args.seed, args.loop_density):
+        print(f"{name}:")
+        for workers in [0, args.workers]:
+            times, state, world = time_ticks(layout, ticks, args.seed, frame_time, PLANNER_WORKERS=workers)
+            mode = 'synchronous' if not workers else f'{workers} workers'
+            line = f"  {mode:12s} {format_tick_times(times, state)}"
+            if world.planner is not None:
+                line += f"   delivered {world.planner.delivered} discarded {world.planner.discarded}"
+                world.close()
+            print(line)
+
+def bench_crowd(args):
+    """
+    Time headless game ticks with --crowd ghosts per maze symbol (four
+    symbols per maze). Ghost collisions and search obstacles go through the
+    ghosts' cell hash, so the cost per ghost should stay flat as the crowd
+    grows.
+    """
+    ticks = args.repeats * 20
+    for name, layout in benchmark_mazes(args.sizes, args.seed, args.loop_density):
+        print(f"{name}:")
+        for per_type in args.crowd:
+            times, state, world = time_ticks(layout, ticks, args.seed, GHOSTS_PER_TYPE=per_type)
+            ghost_count = len(world.ghosts)
+            mean = sum(times) / len(times)
+            print(f"  {ghost_count:5d} ghosts   {mean * 1e3:9.3f} ms/tick   {mean / ghost_count * 1e6:8.2f} us/ghost"
+                  f"   over {len(times)} ticks ({state})")
+
+def measure_suite(name, layout, args):
+    """
+    Time one maze for the scaling suite
+
+    Returns:
+        dict: Seconds per metric: Maze construction, one search per ghost
+        type, one check_dot_collision call and one headless tick
+    """
+    rng = random.Random(args.seed)
+    results = {'maze_construction': time_call(lambda: Maze(BENCHMARK_CELL_SIZE, layout), args.repeats)}
+
+    maze = Maze(BENCHMARK_CELL_SIZE, layout)
+    open_cells = get_open_cells(maze)
+    pacman = Pacman(maze.get_initial_entity_positions()['M'], maze.cell_size, maze)
+    queries = [rng.sample(open_cells, 2) for _ in range(args.repeats * 4)]
+    for ghost_type in config.GHOST_TYPES:
+        ghost = spawn_ghost(ghost_type, maze, pacman)
+        start = time.perf_counter()
+        for query_start, goal in queries:
+            ghost.x, ghost.y = cell_center(maze, query_start)
+            pacman.x, pacman.y = cell_center(maze, goal)
+            run_full_search(ghost)
+        results[f'search_{ghost_type}'] = (time.perf_counter() - start) / len(queries)
+
+    # Pacman-sized rects visiting every walkable cell and eating its dot
+    rng.shuffle(open_cells)
+    rects = [pygame.Rect(0, 0, maze.cell_size, maze.cell_size) for _ in open_cells]
+    for rect, cell in zip(rects, open_cells):
+        rect.center = cell_center(maze, cell)
+    start = time.perf_counter()
+    for rect in rects:
+        maze.check_dot_collision(rect)
+    results['check_dot_collision'] = (time.perf_counter() - start) / len(rects)
+
+    times, state, world = time_ticks(layout, args.repeats * 200, args.seed)
+    world.close()
+    results['headless_tick'] = sum(times) / len(times)
+    return results
+
+def bench_suite(args):
+    """
+    Scaling suite over input/maze.txt and the --sizes generated mazes: Maze
+    construction, a search of every ghost type, check_dot_collision and
+    headless ticks. --save-baseline writes the results as JSON, and
+    --baseline compares a run against such a file.
+    """
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)['results']
+
+    results = {}
+    for name, layout in benchmark_mazes(args.sizes, args.seed, args.loop_density):
+        results[name] = measure_suite(name, layout, args)
+        print(f"{name}: {len(layout[0])}x{len(layout)} cells")
+        for metric, seconds in results[name].items():
+            line = f"  {metric:26s} {seconds * 1e3:12.4f} ms"
+            previous = baseline.get(name, {}).get(metric) if baseline else None
+            if previous:
+                line += f"   baseline {previous * 1e3:12.4f} ms   {seconds / previous:6.2f}x"
+            print(line)
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as file:
+            json.dump({
+                'settings': {
+                    'sizes': args.sizes,
+                    'loop_density': args.loop_density,
+                    'seed': args.seed,
+                    'repeats': args.repeats,
+                    'python': platform.python_version(),
+                },
+                'results': results,
+            }, file, indent=2)
+        print(f"saved baseline to {args.save_baseline}")
+
+# Available benchmarks by command line name
+BENCHMARKS = {
+    'collision': bench_collision,
+    'flowfield': bench_flowfield,
+    'pathtable': bench_pathtable,
+    'junction': bench_junction,
+    'jps': bench_jps,
+    'landmarks': bench_landmarks,
+    'gridbfs': bench_grid_bfs,
+    'incremental': bench_incremental,
+    'memory': bench_search_memory,
+    'render': bench_render,
+    'dots': bench_dots,
+    'walls': bench_walls,
+    'snapshot': bench_snapshot,
+    'mazefile': bench_maze_file,
+    'slicing': bench_slicing,
+    'planner': bench_planner,
+    'crowd': bench_crowd,
+    'suite': bench_suite,
+}
+
+def main():
+    parser = argparse.ArgumentParser(description="Pac-Man maze and pathfinding benchmarks")
+    parser.add_argument('benchmark', choices=sorted(BENCHMARKS), help="benchmark to run")
+    parser.add_argument('--sizes', nargs='*', default=DEFAULT_SIZES, help="generated maze sizes as COLSxROWS")
+    parser.add_argument('--loop-density', type=float, default=0.1, help="loop density of generated mazes")
+    parser.add_argument('--seed', type=int, default=0, help="seed for generated mazes and queries")
+    parser.add_argument('--repeats', type=int, default=5, help="repetitions per timed search")
+    parser.add_argument('--queries', type=int, default=20000, help="collision queries per maze")
+    parser.add_argument('--max-table-cells', type=int, default=4000, help="largest maze to build a path table for")
+    parser.add_argument('--node-budget', type=int, default=100, help="nodes per ghost per frame for time-sliced searches")
+    parser.add_argument('--workers', type=int, default=1, help="planner worker threads")
+    parser.add_argument('--crowd', type=int, nargs='*', default=[1, 25, 100, 250], help="ghosts per maze symbol for the crowd benchmark")
+    parser.add_argument('--landmarks', type=int, nargs='*', default=[4, 8, 16], help="landmark counts for the ALT heuristic")
+    parser.add_argument('--batch', type=int, nargs='*', default=[1, 4, 64], help="queries per call of the BFS kernel")
+    parser.add_argument('--baseline', default=None, help="suite results JSON to compare against")
+    parser.add_argument('--save-baseline', default=None, help="file to save the suite results to as JSON")
+    parser.add_argument('--ghosts', type=int, nargs='*', default=[4, 32], help="ghost counts to compare")
+    args = parser.parse_args()
+
+    init_headless_display()
+    BENCHMARKS[args.benchmark](args)
+
+if __name__ == "__main__":
+    main()
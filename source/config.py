@@ -4,7 +4,10 @@ from ghostImpl.organgeGhost import OrangeGhost
 from ghostImpl.blueGhost import BlueGhost
 from ghostImpl.redGhost import RedGhost
 from ghostImpl.pinkGhost import PinkGhost
+from ghostImpl.incrementalRedGhost import IncrementalRedGhost
+from ghostImpl.jumpPointRedGhost import JumpPointRedGhost
 from ghost import Ghost
+from mazeFile import MazeFile, is_maze_file
 
 # Screen Configuration
 SCREEN_WIDTH = 744
@@ -13,6 +16,9 @@ SCREEN_HEIGHT = 650
 # Maze Configuration
 MAZE_PATH = os.path.join(os.path.dirname(__file__), "..", "input", "maze.txt")
 
+# Directory for precomputed data such as all-pairs path tables
+CACHE_DIR = os.path.join(os.path.dirname(__file__), "..", "cache")
+
 # Colors
 COLORS = {
     'BLACK': (0, 0, 0),
@@ -28,14 +34,28 @@ COLORS = {
 
 # Game Settings
 FRAME_RATE = 60
+
+# Pre-render the walls once and only redraw the areas touched by moving
+# sprites, eaten dots and the score each frame, instead of the whole screen
+DIRTY_RECT_RENDERING = True
 CELL_SIZE = None  # Will be calculated dynamically based on screen and maze dimensions
 
+# Draw the walls as maximal rectangles of wall cells instead of one rect per cell
+MERGE_WALL_RECTS = True
+
+# Blit the walls from a layer rendered once instead of drawing every wall
+# rect, for frames that redraw the whole screen
+PRERENDER_WALLS = False
+
 # Asset Paths
 ASSETS = {
     'GAME_OVER': 'assets/game-over.png',
     'YOU_WIN': 'assets/you-win.jpg'
 }
 
+# Pack the scaled and rotated sprite images into one atlas surface
+ASSET_ATLAS = False
+
 # Text Configuration
 SCORE_FONT = {
     'SIZE': 40,
@@ -50,7 +70,40 @@ PACMAN_CONFIG = {
 GHOST_CONFIG = {
     # Global debug mode setting
     'DEBUG': False,
-    'SPEED': 1  # Speed of the ghosts
+    'SPEED': 1,  # Speed of the ghosts
+    # Share one BFS distance field from Pacman between all ghosts instead of
+    # running each ghost's own search algorithm
+    'FLOW_FIELD': False,
+    # Precompute an all-pairs path table (cached in CACHE_DIR) that answers
+    # BFS/UCS/A* queries without a search when no dynamic obstacle is in the way
+    'PATH_TABLE': False,
+    # Largest maze, in walkable cells, to build the path table for. The table
+    # grows with the square of the cell count (3308 cells take ~4 s to build
+    # and 41 MiB), so larger mazes fall back to live searches
+    'PATH_TABLE_MAX_CELLS': 3000,
+    # Record time, node counts and path length of every search and show
+    # rolling averages in an on-screen overlay
+    'INSTRUMENT': False,
+    # Also measure the peak allocation of every search with tracemalloc (slower)
+    'TRACE_SEARCH_MEMORY': False,
+    # Expand at most this many nodes per ghost per frame, spreading each
+    # search over several frames. None runs every search within one frame
+    'SEARCH_NODE_BUDGET': None,
+    # Number of ghosts allowed to start a new time-sliced search per frame
+    'SEARCH_STARTS_PER_TICK': 1,
+    # Run ghost searches on this many worker threads and deliver the paths
+    # in a later frame (takes precedence over the node budget). 0 searches
+    # on the game thread
+    'PLANNER_WORKERS': 0,
+    # Number of ghosts spawned for every ghost symbol of the maze, placed on
+    # the open cells nearest to the symbol (for stress tests with many ghosts)
+    'GHOSTS_PER_TYPE': 1,
+    # BFS, UCS and A* ghosts search a graph of junctions and corridors
+    # instead of single cells, finding paths of the same length
+    'JUNCTION_GRAPH': False,
+    # Number of landmarks for the ALT heuristic of the A* ghosts, with BFS
+    # distances from each computed at maze load. 0 uses the Manhattan distance
+    'LANDMARKS': 0
 }
 
 # Predefined Ghost Types
@@ -58,7 +111,17 @@ GHOST_TYPES = {
     'orange': OrangeGhost,
     'blue': BlueGhost,
     'pink': PinkGhost,
-    'red': RedGhost
+    'red': RedGhost,
+    'red-incremental': IncrementalRedGhost,
+    'red-jps': JumpPointRedGhost
+}
+
+# Ghost type spawned on each ghost symbol of the maze file
+GHOST_SPAWNS = {
+    'P': 'pink',
+    'R': 'red',
+    'O': 'orange',
+    'B': 'blue'
 }
 
 def calculate_cell_size(width, height, maze_layout):
@@ -77,12 +140,18 @@ def calculate_cell_size(width, height, maze_layout):
     cols = len(maze_layout[0])
     return min(width // cols, height // rows)
 
-def load_maze_layout():
+def load_maze_layout(path=MAZE_PATH):
     """
     Load maze layout from file
     
+    Args:
+        path (str): Maze file, defaults to MAZE_PATH. Binary maze files
+            (see mazeFile.py) are memory-mapped instead of read as text
+    
     Returns:
-        list: Maze layout as a list of strings
+        list: Maze layout as a list of strings, or a MazeFile
     """
-    with open(MAZE_PATH) as file:
+    if is_maze_file(path):
+        return MazeFile(path)
+    with open(path) as file:
         return [line.strip() for line in file.readlines()]
\ No newline at end of file
@@ -0,0 +1,4 @@
+# Neighbor directions in the order ghosts explore them: Up, Right, Down, Left.
+# Bit i of a cell's neighbor mask is set when DIRECTIONS[i] leads to an open cell.
+# Kept free of imports so maze.py, the path table and the ghosts can all use it.
+DIRECTIONS = [(0, -1), (1, 0), (0, 1), (-1, 0)]
@@ -0,0 +1,96 @@
+import config
+from simClock import SimClock
+
+class GameEngine:
+    """
+    Game stepping without rendering or input.
+
+    One step moves Pacman and the ghosts, eats dots and checks the win/lose
+    conditions. The windowed game loop in main.py and the headless runner
+    both drive the same engine.
+    """
+    RUNNING = 'running'
+    WON = 'won'
+    LOST = 'lost'
+
+    def __init__(self, maze, pacman, ghosts, scheduler=None, planner=None, clock=None):
+        self.maze = maze
+        self.pacman = pacman
+        self.ghosts = ghosts
+        self.scheduler = scheduler  # SearchScheduler of time-sliced ghost searches, if any
+        self.planner = planner  # PathPlanner running ghost searches on worker threads, if any
+
+        # Simulation clock, advanced once per step; the ghosts' timers read it
+        self.clock = clock if clock is not None else SimClock(config.FRAME_RATE)
+
+        self.score = 0
+        self.state = GameEngine.RUNNING
+        self.caught_by = None  # Ghost that caught Pacman, if any
+
+    @property
+    def ticks(self):
+        """Number of steps played, the simulation clock's time"""
+        return self.clock.ticks
+
+    @ticks.setter
+    def ticks(self, ticks):
+        self.clock.ticks = ticks
+
+    def snapshot(self):
+        """
+        Capture the score, tick count, outcome and the search scheduler's queue
+
+        Returns:
+            tuple: State accepted by restore, the catching ghost as an index into ghosts
+        """
+        caught_by = list(self.ghosts).index(self.caught_by) if self.caught_by is not None else None
+        queue = self.scheduler.snapshot(self.ghosts) if self.scheduler is not None else None
+        return (self.score, self.ticks, self.state, caught_by, queue)
+
+    def restore(self, state):
+        """Put the engine back in a state captured by snapshot"""
+        self.score, self.ticks, self.state, caught_by, queue = state
+        self.caught_by = list(self.ghosts)[caught_by] if caught_by is not None else None
+        if self.scheduler is not None:
+            self.scheduler.restore(queue, self.ghosts)
+        if self.planner is not None:
+            self.planner.reset()
+
+    def step(self):
+        """
+        Advance the game by one tick
+
+        Returns:
+            str: Game state after the tick (RUNNING, WON or LOST)
+        """
+        if self.state != GameEngine.RUNNING:
+            return self.state
+
+        # Hash the ghosts by cell for this tick, they keep it up to date as they move
+        self.ghosts.refresh()
+
+        # Update
+        if self.scheduler is not None:
+            self.scheduler.begin_tick()
+        if self.planner is not None:
+            self.planner.deliver()
+        self.pacman.update()
+        self.ghosts.update()
+        self.clock.advance()
+
+        # Check for dot collisions and update score
+        self.score += self.maze.check_dot_collision(self.pacman.rect)
+
+        # Check if all dots are eaten (win condition)
+        if self.maze.are_all_dots_eaten():
+            self.state = GameEngine.WON
+            return self.state
+
+        # Check for collisions with ghosts
+        for ghost in self.ghosts:
+            if ghost.check_collision_with_pacman():
+                self.state = GameEngine.LOST
+                self.caught_by = ghost
+                break
+
+        return self.state
@@ -0,0 +1,101 @@
+from collections import deque
+
+class FlowField:
+    """
+    Distance field from Pacman's cell shared by every ghost.
+
+    One BFS runs outward from Pacman whenever Pacman enters a new cell.
+    Each ghost then walks down the distance gradient from its own cell,
+    so the chase costs O(cells) per Pacman move no matter how many ghosts
+    read the field.
+    """
+    def __init__(self, maze, target):
+        self.maze = maze
+        self.target = target
+        self.target_cell = None
+
+        # BFS distance to the target per cell, -1 for unreachable cells
+        self.distances = [-1] * (maze.rows * maze.cols)
+        self.recomputations = 0
+
+    def get_target_cell(self):
+        """Grid cell currently occupied by the target"""
+        cell_size = self.maze.cell_size
+        return int(self.target.x // cell_size), int(self.target.y // cell_size)
+
+    def refresh(self):
+        """Recompute the field if the target has changed cell since the last BFS"""
+        target_cell = self.get_target_cell()
+        if target_cell != self.target_cell:
+            self.compute(target_cell)
+
+    def compute(self, source):
+        """
+        Run a BFS over the static maze adjacency from the source cell
+
+        Args:
+            source (tuple): Grid cell the distances are measured from
+        """
+        cols = self.maze.cols
+        distances = [-1] * (self.maze.rows * cols)
+        self.target_cell = source
+        self.recomputations += 1
+
+        if self.maze.is_inside(*source):
+            distances[source[1] * cols + source[0]] = 0
+            queue = deque([source])
+            while queue:
+                current = queue.popleft()
+                next_distance = distances[current[1] * cols + current[0]] + 1
+                for neighbor in self.maze.get_adjacent_cells(current[0], current[1]):
+                    index = neighbor[1] * cols + neighbor[0]
+                    if distances[index] < 0:
+                        distances[index] = next_distance
+                        queue.append(neighbor)
+
+        self.distances = distances
+
+    def get_distance(self, cell):
+        """Distance from a cell to the target, or None if it cannot reach the target"""
+        if not self.maze.is_inside(*cell):
+            return None
+        distance = self.distances[cell[1] * self.maze.cols + cell[0]]
+        return distance if distance >= 0 else None
+
+    def get_path(self, start, overlay=()):
+        """
+        Follow the gradient from start down to the target
+
+        Among equally good steps, cells in the overlay (other ghosts, blocked
+        cells) are avoided. The field itself ignores them, so when every
+        downhill step is occupied the ghost still takes one and relies on
+        collision avoidance.
+
+        Args:
+            start (tuple): Grid cell to start from
+            overlay (set): Cells to avoid when there is a choice
+
+        Returns:
+            list: Grid cells from start to the target, or [] if unreachable
+        """
+        self.refresh()
+        path = [start]
+        current = start
+        current_distance = self.get_distance(start)
+
+        while current_distance != 0:
+            best_cell = None
+            best_key = None
+            for neighbor in self.maze.get_adjacent_cells(current[0], current[1]):
+                distance = self.get_distance(neighbor)
+                if distance is None or (current_distance is not None and distance >= current_distance):
+                    continue
+                key = (distance, neighbor in overlay)
+                if best_key is None or key < best_key:
+                    best_cell, best_key = neighbor, key
+            if best_cell is None:
+                return []
+            path.append(best_cell)
+            current, current_distance = best_cell, best_key[0]
+
+        return path
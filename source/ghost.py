@@ -2,8 +2,11 @@ import pygame
 import math
 import os
 import config
+from assetManager import ASSETS
+from ghostGrid import GhostGrid
 from abc import ABC, abstractmethod
 from collections import defaultdict, deque
+import random
 import time
 
 class Ghost(pygame.sprite.Sprite, ABC):
@@ -12,20 +15,27 @@ class Ghost(pygame.sprite.Sprite, ABC):
     Can be extended with different pathfinding algorithms.
     Now inherits from pygame.sprite.Sprite for better game integration.
     """
-    all_ghosts = pygame.sprite.Group()
 
     def __init__(self, position, cell_size, maze, target=None, ghostType=None):
         pygame.sprite.Sprite.__init__(self)
         self.x, self.y = position
         self.cell_size = cell_size
         
-        # Cell visit tracking
+        # SimClock advanced by the game loop, set by World; update() needs it.
+        # A ghost without one (e.g. only searching) never blocks cells.
+        self.clock = None
+        self.last_update_tick = None  # Clock tick of the last update, to catch a stopped clock
+        
+        # Random generator of the ghost's decisions, World shares a seeded one
+        self.rng = random.Random(0)
+        
+        # Cell visit tracking, on the simulation clock
         self.cell_visit_count = defaultdict(list)
         self.max_visits_threshold = 3  # Maximum visits allowed in a short time
-        self.visit_time_window = 2.0  # Time window in seconds
+        self.visit_time_window = 2.0  # Time window in simulated seconds
         self.blocked_cells = set()  # Cells that are temporarily blocked
-        self.blocked_cell_timeout = 5.0  # Time to keep a cell blocked
-        self.blocked_cell_timers = {}  # Timers for blocked cells
+        self.blocked_cell_timeout = 5.0  # Simulated seconds to keep a cell blocked
+        self.blocked_cell_timers = {}  # Tick each blocked cell was blocked at
         
         # Rest of the initialization remains the same
         self.directional_images = self.load_ghost_images(ghostType, cell_size)
@@ -47,22 +57,71 @@ class Ghost(pygame.sprite.Sprite, ABC):
         self.current_path = []
         self.path_update_timer = 0
         self.path_update_delay = 30
+        self._last_target_pos = None  # Target position at the last path update
         
         self.explored_nodes = []
         self.debug_mode = False
         
-        Ghost.all_ghosts.add(self)
+        # Cells excluded from the current search, captured by begin_search
+        self.search_overlay = set()
+        
+        # Shared distance field from Pacman, replaces calculate_path when set
+        self.flow_field = None
+        
+        # Precomputed all-pairs table answering static queries without a search
+        self.path_table = None
+        
+        # Maze's JunctionGraph, BFS/UCS/A* search it instead of the cells when set
+        self.junction_graph = None
+        
+        # Landmarks of the maze, A*-style searches use their distance estimates when set
+        self.landmarks = None
+        
+        # Counters of the last search, reset by begin_search and filled in by calculate_path
+        self.expanded_nodes = 0
+        self.generated_nodes = 0
+        self.max_frontier = 0
+        
+        # SearchStats recording every search, None disables instrumentation
+        self.search_stats = None
+        
+        # Ghosts of the same game (World.ghosts), hashed by cell; a ghost on
+        # its own sees no others
+        self.peers = GhostGrid()
+        
+        # SearchScheduler of the game, set to run searches a few nodes per tick
+        self.scheduler = None
+        
+        # Search in progress when time-sliced: the search_steps generator,
+        # its start and goal cells, the last parent map it yielded, the time
+        # spent in it so far, the number of steps taken and the obstacles it
+        # captured (kept so restore can replay the search)
+        self.active_search = None
+        self.active_search_start = None
+        self.active_search_goal = None
+        self.active_search_parent = None
+        self.active_search_time = 0.0
+        self.active_search_steps = 0
+        self.active_search_obstacles = None
+
+        # PathPlanner running this ghost's searches on a worker thread, if any
+        self.planner = None
+
+        # Obstacles captured by the planner when the search was requested,
+        # used by begin_search instead of reading the other ghosts
+        self.planned_obstacles = None
 
     def track_cell_visit(self, grid_pos):
         """
         Track visits to a specific cell and block if visited too frequently
         """
-        current_time = time.time()
+        current_time = self.clock.ticks
+        window = self.clock.ticks_for(self.visit_time_window)
         
         # Remove old visit times outside the time window
         self.cell_visit_count[grid_pos] = [
             visit_time for visit_time in self.cell_visit_count[grid_pos] 
-            if current_time - visit_time <= self.visit_time_window
+            if current_time - visit_time <= window
         ]
         
         # Add current visit time
@@ -78,12 +137,15 @@ class Ghost(pygame.sprite.Sprite, ABC):
         """
         Unblock cells that have been blocked for too long
         """
-        current_time = time.time()
+        if not self.blocked_cell_timers:
+            return
+        current_time = self.clock.ticks
+        timeout = self.clock.ticks_for(self.blocked_cell_timeout)
         
         # Find cells to unblock
         cells_to_unblock = [
             cell for cell, block_time in self.blocked_cell_timers.items()
-            if current_time - block_time > self.blocked_cell_timeout
+            if current_time - block_time > timeout
         ]
         
         # Unblock these cells
@@ -91,14 +153,96 @@ class Ghost(pygame.sprite.Sprite, ABC):
             self.blocked_cells.discard(cell)
             del self.blocked_cell_timers[cell]
 
+    def snapshot(self):
+        """
+        Capture the ghost's mutable state: position, direction, path, the
+        cell visit/blocking timers and the time-sliced search in progress.
+        Images and maze data are not copied.
+        
+        A search generator cannot be copied, so the search is stored as its
+        start, goal, captured obstacles and number of steps taken, and
+        restore replays it to the same point.
+        
+        Returns:
+            dict: State accepted by restore
+        """
+        return {
+            'position': (self.x, self.y),
+            'direction': self.current_direction,
+            'path': list(self.current_path),
+            'path_update_timer': self.path_update_timer,
+            'last_target_pos': self._last_target_pos,
+            'cell_visits': {cell: list(times) for cell, times in self.cell_visit_count.items() if times},
+            'blocked_cell_timers': dict(self.blocked_cell_timers),
+            'search': self.snapshot_search(),
+        }
+
+    def snapshot_search(self):
+        """
+        Describe the active time-sliced search
+
+        Returns:
+            dict: Start, goal, obstacles and steps of the search, None if there is none
+        """
+        if self.active_search is None:
+            return None
+        obstacles = self.active_search_obstacles
+        return {
+            'start': self.active_search_start,
+            'goal': self.active_search_goal,
+            'obstacles': sorted(obstacles) if obstacles is not None else None,
+            'steps': self.active_search_steps,
+        }
+
+    def restore(self, state):
+        """Put the ghost back in a state captured by snapshot"""
+        self.x, self.y = state['position']
+        self.rect.center = (self.x, self.y)
+        self.current_direction = state['direction']
+        self.image = self.directional_images[self.current_direction]
+        self.current_path = list(state['path'])
+        self.path_update_timer = state['path_update_timer']
+        self._last_target_pos = state['last_target_pos']
+        self.cell_visit_count = defaultdict(list, {cell: list(times) for cell, times in state['cell_visits'].items()})
+        self.blocked_cell_timers = dict(state['blocked_cell_timers'])
+        self.blocked_cells = set(self.blocked_cell_timers)
+        self.last_update_tick = None  # The restored clock may be back at an updated tick
+        self.explored_nodes = []
+        self.restore_search(state['search'])
+        self.peers.move(self)
+
+    def restore_search(self, search):
+        """
+        Rebuild a time-sliced search captured by snapshot_search.
+
+        The search is started again from the same cells and stepped as many
+        times as before, with the obstacles it captured then instead of the
+        ones around the ghost now, so it reaches the same state.
+        """
+        if search is None:
+            self.active_search = None
+            return
+        self.begin_sliced_search(search['start'], search['goal'])
+        if not search['steps']:
+            return
+        planned = self.planned_obstacles
+        self.planned_obstacles = set(search['obstacles'])
+        try:
+            for _ in range(search['steps']):
+                self.active_search_parent = next(self.active_search)
+        finally:
+            self.planned_obstacles = planned
+        self.active_search_steps = search['steps']
+        self.active_search_obstacles = self.search_overlay
+
     def set_target(self, target):
         """Set the target (usually Pacman) for the ghost to chase"""
         self.target = target
 
     def get_grid_position(self, x, y):
         """Convert pixel coordinates to grid coordinates"""
-        grid_x = x // self.cell_size
-        grid_y = y // self.cell_size
+        grid_x = int(x // self.cell_size)
+        grid_y = int(y // self.cell_size)
         return grid_x, grid_y
 
     def get_pixel_position(self, grid_x, grid_y):
@@ -107,55 +251,124 @@ class Ghost(pygame.sprite.Sprite, ABC):
         pixel_y = grid_y * self.cell_size + self.cell_size // 2
         return pixel_x, pixel_y
 
-    def get_neighbors(self, grid_x, grid_y):
+    def begin_search(self):
         """
-        Get valid neighboring cells 
-        - Exclude maze walls
-        - Exclude cells occupied by other ghosts
-        - Exclude recently overused cells
+        Capture the dynamic obstacles once per search:
+        - Cells occupied by other ghosts
+        - Recently overused cells
+        Every calculate_path implementation calls this before expanding nodes.
+        It also resets the search counters. Searches run by the planner use
+        the obstacles captured when they were requested.
+        """
+        self.expanded_nodes = 0
+        self.generated_nodes = 0
+        self.max_frontier = 0
+        
+        overlay = self.planned_obstacles
+        if overlay is None:
+            overlay = self.capture_obstacles()
+        
+        self.search_overlay = overlay
+        return overlay
+
+    def capture_obstacles(self):
+        """
+        Collect the cells occupied by other ghosts and the blocked cells
+
+        Returns:
+            set: Grid cells the next search must avoid
         """
         # First, check and unblock any expired blocked cells
         self.check_and_unblock_cells()
         
-        directions = [(0, -1), (1, 0), (0, 1), (-1, 0)]  # Up, Right, Down, Left
-        neighbors = []
+        overlay = self.peers.occupied_cells(self)
+        overlay |= self.blocked_cells
+        return overlay
+
+    def reconstruct_path(self, parent, start, goal):
+        """
+        Rebuild a path by following parent pointers back from the goal
         
-        # Get all grid positions of other ghosts
-        ghost_positions = set()
-        for ghost in Ghost.all_ghosts:
-            if ghost != self:
-                grid_pos = self.get_grid_position(ghost.x, ghost.y)
-                ghost_positions.add(grid_pos)
+        Args:
+            parent (dict): Maps each reached cell to the cell it was reached from
+            start (tuple): Grid cell the search started from
+            goal (tuple): Grid cell to walk back from
         
-        for dx, dy in directions:
-            new_x, new_y = grid_x + dx, grid_y + dy
-            current_cell = (new_x, new_y)
-            
-            # Skip if cell is blocked
-            if current_cell in self.blocked_cells:
-                continue
+        Returns:
+            list: Grid cells from start to goal ([start] if the goal was not reached)
+        """
+        path = []
+        node = goal
+        
+        while node != start and node in parent:
+            path.append(node)
+            node = parent[node]
             
-            # Check if this cell is not occupied by another ghost
-            if current_cell not in ghost_positions:
-                # Create a temporary rect to check collision with walls
-                temp_pixel_x, temp_pixel_y = self.get_pixel_position(new_x, new_y)
-                temp_rect = pygame.Rect(
-                    temp_pixel_x - self.width // 2, 
-                    temp_pixel_y - self.height // 2,
-                    self.width, 
-                    self.height
-                )
-                
-                # Check if this position would collide with a wall
-                if not self.maze.check_collision(temp_rect):
-                    neighbors.append(current_cell)
+        path.append(start)
+        path.reverse()
         
-        return neighbors
+        return path
+
+    def lookup_static_path(self, start, goal):
+        """
+        Answer a path query from the precomputed path table.
+        
+        Returns None when no table is attached, when a cell is not in the
+        table, or when the table's path runs through a cell of the search
+        overlay. The caller then falls back to its live search, which takes
+        those dynamic obstacles into account.
+        """
+        if self.path_table is None:
+            return None
+        
+        path = self.path_table.get_path(start, goal)
+        if path is None or not self.search_overlay.isdisjoint(path[1:]):
+            return None
+        return path
+
+    def search_shortcuts(self, start, goal, heuristic=None, junctions=True):
+        """
+        Opening shared by the cell searches' search_steps, as a generator:
+        - Capture other ghosts and blocked cells once with begin_search
+        - Answer static queries from the path table when one is attached
+        - Search junctions and corridors instead of cells when enabled
+        The caller runs its own cell search when this returns None.
+        
+        Args:
+            start (tuple): Grid cell of the ghost
+            goal (tuple): Grid cell of the target
+            heuristic (callable): Distance estimate for A* on the junction graph, None runs Dijkstra
+            junctions (bool): Whether to try the junction graph
+        
+        Returns:
+            list: Grid cells from start to goal, empty if there is no path,
+            None if the caller has to search the cells
+        """
+        self.begin_search()
+        
+        path = self.lookup_static_path(start, goal)
+        if path is not None:
+            return path
+        
+        if junctions and self.junction_graph is not None:
+            return (yield from self.junction_graph.search_steps(self, start, goal, heuristic))
+        return None
+
+    def get_neighbors(self, grid_x, grid_y):
+        """
+        Get valid neighboring cells 
+        - Exclude maze walls (precomputed adjacency from the maze)
+        - Exclude cells in the overlay captured by begin_search
+        """
+        overlay = self.search_overlay
+        return [cell for cell in self.maze.get_adjacent_cells(grid_x, grid_y) if cell not in overlay]
 
     @classmethod
     def load_ghost_images(cls, ghost_type, cell_size):
         """
-        Load directional images for a specific ghost type
+        Load directional images for a specific ghost type.
+        Images come from the shared asset cache, so each file is decoded and
+        scaled once per process.
         
         Args:
             ghost_type (str): Color of the ghost ('red', 'blue', 'pink', 'orange')
@@ -178,20 +391,19 @@ class Ghost(pygame.sprite.Sprite, ABC):
                 # Construct full file path
                 file_path = os.path.join(base_path, f'{direction}.png')
                 
-                # Load image
-                original_image = pygame.image.load(file_path).convert_alpha()
-                
-                # Scale image to cell size
-                scaled_image = pygame.transform.scale(original_image, (cell_size, cell_size))
-                
-                # Store scaled image
-                images[direction] = scaled_image
+                # Load the image scaled to cell size
+                images[direction] = ASSETS.get_image(file_path, (cell_size, cell_size))
             
             return images
         except Exception as e:
             print(f"Error loading images for {ghost_type} ghost: {e}")
             return None
 
+    def load_images(self):
+        """Fetch the directional images again, e.g. after the asset atlas was packed"""
+        self.directional_images = self.load_ghost_images(self.ghostType, self.cell_size)
+        self.image = self.directional_images[self.current_direction]
+
     @abstractmethod
     def calculate_path(self):
         """
@@ -200,6 +412,214 @@ class Ghost(pygame.sprite.Sprite, ABC):
         """
         pass
 
+    def search_steps(self, start, goal):
+        """
+        Search from start to goal as a generator that yields once per
+        expanded node and returns the path when it is done.
+        
+        Each yield hands out the parent map built so far, so a time-sliced
+        search can stop after any node and follow a partial path. Ghosts
+        whose calculate_path does not expand nodes one by one keep this
+        default, which runs calculate_path in a single step.
+        
+        Args:
+            start (tuple): Grid cell of the ghost
+            goal (tuple): Grid cell of the target
+        
+        Returns:
+            list: Grid cells from start to goal, empty if there is no path
+        """
+        return self.calculate_path()
+        yield  # Makes this a generator
+
+    def run_search_steps(self):
+        """
+        Run search_steps to completion in one call
+
+        Returns:
+            list: Grid cells from the ghost to the target, empty if there is no path
+        """
+        if not self.target:
+            return []
+        
+        start = self.get_grid_position(self.x, self.y)
+        goal = self.get_grid_position(self.target.x, self.target.y)
+        return self.complete_search(start, goal)
+
+    def complete_search(self, start, goal):
+        """
+        Run search_steps from start to goal without stopping
+
+        Returns:
+            list: Grid cells from start to goal, empty if there is no path
+        """
+        steps = self.search_steps(start, goal)
+        try:
+            while True:
+                next(steps)
+        except StopIteration as stop:
+            return stop.value
+
+    def find_path(self):
+        """
+        Compute a new path to the target.
+        The search is measured by search_stats when instrumentation is enabled.
+        """
+        if self.search_stats is not None:
+            return self.search_stats.measure(self, self.run_search)
+        return self.run_search()
+
+    def run_search(self):
+        """
+        Reads the shared flow field when one is attached, otherwise runs the
+        ghost's own search algorithm through calculate_path.
+        """
+        if self.flow_field is not None:
+            self.begin_search()
+            start = self.get_grid_position(self.x, self.y)
+            return self.flow_field.get_path(start, self.search_overlay)
+        return self.calculate_path()
+
+    def start_search(self):
+        """Begin a time-sliced search from the ghost's cell to the target's cell"""
+        if not self.target:
+            self.active_search = None
+            return
+        start = self.get_grid_position(self.x, self.y)
+        goal = self.get_grid_position(self.target.x, self.target.y)
+        self.begin_sliced_search(start, goal)
+
+    def begin_sliced_search(self, start, goal):
+        """Make a new search_steps generator the active search"""
+        self.active_search_start = start
+        self.active_search_goal = goal
+        self.active_search = self.search_steps(start, goal)
+        self.active_search_parent = None
+        self.active_search_time = 0.0
+        self.active_search_steps = 0
+        self.active_search_obstacles = None
+
+    def advance_search(self, budget):
+        """
+        Expand up to budget nodes of the active search
+        
+        Args:
+            budget (int): Maximum number of nodes to expand
+        
+        Returns:
+            list: The path if the search finished, None if it is still running
+        """
+        started = time.perf_counter()
+        path = None
+        try:
+            for _ in range(budget):
+                self.active_search_parent = next(self.active_search)
+                self.active_search_steps += 1
+        except StopIteration as stop:
+            path = stop.value
+            self.active_search = None
+        if self.active_search_obstacles is None and self.active_search_steps:
+            # begin_search ran in the first step
+            self.active_search_obstacles = self.search_overlay
+        self.active_search_time += time.perf_counter() - started
+        
+        if path is not None and self.search_stats is not None:
+            self.search_stats.record_search(self, path, self.active_search_time)
+        return path
+
+    def get_partial_path(self):
+        """
+        Best path found so far by the active search: the way to the reached
+        cell closest to the goal (Manhattan distance)
+        
+        Returns:
+            list: Grid cells from the search start, None if nothing was expanded yet
+        """
+        parent = self.active_search_parent
+        if not parent:
+            return None
+        goal = self.active_search_goal
+        closest = min(parent, key=lambda cell: self.manhattan_distance(cell, goal))
+        return self.reconstruct_path(parent, self.active_search_start, closest)
+
+    def align_path(self, path):
+        """
+        Cut a path found by a time-sliced search so it starts at the ghost's
+        current cell; the ghost kept moving while the search ran.
+        
+        Args:
+            path (list): Grid cells from the cell the search started from
+        
+        Returns:
+            list: The remaining path, None if the ghost left the path
+        """
+        if not path:
+            return path
+        current = self.get_grid_position(self.x, self.y)
+        if current not in path:
+            return None
+        return path[path.index(current):]
+
+    def step_search(self):
+        """
+        Advance the active search by the scheduler's node budget.
+        
+        A finished path replaces the current one. While the search runs the
+        ghost keeps its old path, and switches to the best partial path once
+        the old one is used up. A finished path the ghost has moved off is
+        thrown away and searched again from where the ghost is now.
+        """
+        path = self.advance_search(self.scheduler.node_budget)
+        if path is not None:
+            path = self.align_path(path)
+            if path is None:
+                self.start_search()
+            else:
+                self.current_path = path
+        elif len(self.current_path) < 2:
+            partial = self.get_partial_path()
+            if partial is not None:
+                partial = self.align_path(partial)
+                if partial is not None:
+                    self.current_path = partial
+
+    def receive_path(self, path):
+        """
+        Adopt a path delivered by the planner
+
+        Args:
+            path (list): Grid cells from the cell the search started from
+
+        Returns:
+            bool: False if the ghost has moved off the path, which is then dropped
+        """
+        path = self.align_path(path)
+        if path is None:
+            return False
+        self.current_path = path
+        return True
+
+    def get_heuristic(self, goal):
+        """
+        Distance estimate for A*-style searches: the landmark (ALT) estimate
+        when landmarks are attached, the Manhattan distance otherwise
+        
+        Args:
+            goal (tuple): Goal cell of the search
+        
+        Returns:
+            callable: Takes a cell and returns a lower bound of its distance to the goal
+        """
+        if self.landmarks is not None:
+            return self.landmarks.get_heuristic(goal)
+        goal_x, goal_y = goal
+        return lambda cell: abs(cell[0] - goal_x) + abs(cell[1] - goal_y)
+
+    @staticmethod
+    def manhattan_distance(a, b):
+        """Manhattan distance between two grid cells"""
+        return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
     def update(self):
         """
         Update ghost position and path with comprehensive movement logic
@@ -210,6 +630,13 @@ class Ghost(pygame.sprite.Sprite, ABC):
         - Directional image updates
         - Collision avoidance
         """
+        # Cell visits and blocked cells are timed in ticks of the game's clock
+        if self.clock is None:
+            raise ValueError("Ghost.update needs a SimClock advanced by the game loop, see World")
+        if self.clock.ticks == self.last_update_tick:
+            raise RuntimeError(f"Simulation clock was not advanced since the last ghost update (tick {self.clock.ticks})")
+        self.last_update_tick = self.clock.ticks
+        
         # Increment path update timer
         self.path_update_timer += 1
         
@@ -220,17 +647,34 @@ class Ghost(pygame.sprite.Sprite, ABC):
         self.track_cell_visit(current_grid_pos)
 
         # Store the last known target position if not already stored
-        if not hasattr(self, '_last_target_pos'):
+        if self._last_target_pos is None:
             self._last_target_pos = (self.target.x, self.target.y)
         
         # Get current target position
         current_target_pos = (self.target.x, self.target.y)
         
         # Recalculate path if target has moved significantly and enough time has passed
-        if (current_target_pos != self._last_target_pos and 
-            self.path_update_timer >= self.path_update_delay):
+        recompute = (current_target_pos != self._last_target_pos and 
+                     self.path_update_timer >= self.path_update_delay)
+        if self.planner is not None and self.flow_field is None:
+            # The planner searches on a worker thread and delivers the path
+            # in a later tick, meanwhile the ghost follows its old path
+            if recompute:
+                self.planner.request(self)
+                self._last_target_pos = current_target_pos
+                self.path_update_timer = 0
+        elif self.scheduler is not None and self.flow_field is None:
+            # Time-sliced: start when the scheduler gives this ghost a turn,
+            # then expand a bounded number of nodes every tick
+            if recompute and self.active_search is None and self.scheduler.may_start(self):
+                self.start_search()
+                self._last_target_pos = current_target_pos
+                self.path_update_timer = 0
+            if self.active_search is not None:
+                self.step_search()
+        elif recompute:
             # Recalculate path to new target position
-            self.current_path = self.calculate_path()
+            self.current_path = self.find_path()
             self._last_target_pos = current_target_pos
             self.path_update_timer = 0
         
@@ -279,10 +723,11 @@ class Ghost(pygame.sprite.Sprite, ABC):
             abs(self.y - next_pixel_y) < self.speed):
             # Remove the reached position from the path
             self.current_path.pop(0)
+        self.peers.move(self)
         
-        # Collision avoidance with other ghosts
-        for ghost in Ghost.all_ghosts:
-            if ghost != self and self.check_collision_with_ghost(ghost):
+        # Collision avoidance with the ghosts in the surrounding cells
+        for ghost in self.peers.nearby(self):
+            if self.check_collision_with_ghost(ghost):
                 self.avoid_collision()
                 break
 
@@ -314,26 +759,14 @@ class Ghost(pygame.sprite.Sprite, ABC):
             return True
         return False
     
-    # def get_occupied_cells(self):
-    #     """
-    #     Returns a list of grid cells occupied by other ghosts
-    #     Ensures the current ghost doesn't count its own cell
-    #     """
-    #     occupied_cells = []
-    #     for ghost in Ghost.all_ghosts:
-    #         if ghost != self:  # Don't include self
-    #             grid_x, grid_y = self.get_grid_position(ghost.x, ghost.y)
-    #             occupied_cells.append((grid_x, grid_y))
-    #     return occupied_cells
-    
     def avoid_collision(self):
         """
         Enhanced collision avoidance strategy to separate overlapping ghosts
         """
         # Find all ghosts this ghost is colliding with
         colliding_ghosts = [
-            ghost for ghost in Ghost.all_ghosts 
-            if ghost != self and self.check_collision_with_ghost(ghost)
+            ghost for ghost in self.peers.nearby(self)
+            if self.check_collision_with_ghost(ghost)
         ]
         
         if not colliding_ghosts:
@@ -349,9 +782,8 @@ class Ghost(pygame.sprite.Sprite, ABC):
             distance = math.sqrt(dx**2 + dy**2)
             if distance == 0:
                 # If exactly on top of each other, add small random offset
-                import random
-                dx = random.choice([-1, 1]) * self.width
-                dy = random.choice([-1, 1]) * self.height
+                dx = self.rng.choice([-1, 1]) * self.width
+                dy = self.rng.choice([-1, 1]) * self.height
                 distance = math.sqrt(dx**2 + dy**2)
             
             # Separate ghosts by moving them apart
@@ -366,9 +798,18 @@ class Ghost(pygame.sprite.Sprite, ABC):
             
             # Update rect
             self.rect.center = (self.x, self.y)
+        self.peers.move(self)
         
         # Force path recalculation
-        self.current_path = self.calculate_path()
+        if self.planner is not None and self.flow_field is None:
+            self.planner.request(self)
+            self.current_path = []
+        elif self.scheduler is not None and self.flow_field is None:
+            # The old path no longer starts where the ghost is, wait for the new one
+            self.start_search()
+            self.current_path = []
+        else:
+            self.current_path = self.find_path()
         self.path_update_timer = self.path_update_delay
 
     def check_collision_with_ghost(self, other_ghost):
@@ -379,19 +820,4 @@ class Ghost(pygame.sprite.Sprite, ABC):
         x_overlap = (abs(self.x - other_ghost.x) * 2 < (self.width + other_ghost.width))
         y_overlap = (abs(self.y - other_ghost.y) * 2 < (self.height + other_ghost.height))
         
-        return x_overlap and y_overlap  
-
-    @classmethod
-    def update_all(cls):
-        """Update all ghosts in the group"""
-        cls.all_ghosts.update()
-        
-    @classmethod
-    def draw_all(cls, screen):
-        """Draw all ghosts in the group"""
-        cls.all_ghosts.draw(screen)
-        
-        # Draw debug info for each ghost
-        for ghost in cls.all_ghosts:
-            if ghost.debug_mode:
-                ghost.draw_debug(screen)
\ No newline at end of file
+        return x_overlap and y_overlap
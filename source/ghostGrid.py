@@ -0,0 +1,91 @@
+import pygame
+
+class GhostGrid(pygame.sprite.Group):
+    """
+    Sprite group of ghosts that also hashes them by grid cell.
+
+    Ghosts are one cell wide, so a ghost can only overlap ghosts in its own
+    or the eight surrounding cells; nearby() returns just those instead of
+    every ghost in the game. occupied_cells() gives the cells the other
+    ghosts stand on without looking at each of them.
+
+    The engine refreshes the hash at the start of every tick, and ghosts
+    call move() whenever they change position during the tick.
+    """
+    def __init__(self, *sprites):
+        self.cell_of = {}  # {ghost: cell}
+        self.buckets = {}  # {cell: [ghost, ...]}
+        self.order = {}  # {ghost: insertion index}, to keep results in group order
+        self.added = 0
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        self.order[sprite] = self.added
+        self.added += 1
+        self.place(sprite)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self.unplace(sprite)
+        del self.order[sprite]
+
+    def place(self, ghost):
+        """Put a ghost in the bucket of its current cell"""
+        cell = ghost.get_grid_position(ghost.x, ghost.y)
+        self.cell_of[ghost] = cell
+        self.buckets.setdefault(cell, []).append(ghost)
+
+    def unplace(self, ghost):
+        """Take a ghost out of its bucket"""
+        cell = self.cell_of.pop(ghost)
+        bucket = self.buckets[cell]
+        bucket.remove(ghost)
+        if not bucket:
+            del self.buckets[cell]
+
+    def move(self, ghost):
+        """Update the bucket of a ghost after it moved, ghosts outside the group are ignored"""
+        cell = self.cell_of.get(ghost)
+        if cell is not None and ghost.get_grid_position(ghost.x, ghost.y) != cell:
+            self.unplace(ghost)
+            self.place(ghost)
+
+    def refresh(self):
+        """Re-hash every ghost, e.g. after positions were set from outside"""
+        for ghost in self.sprites():
+            self.move(ghost)
+
+    def nearby(self, ghost):
+        """
+        Other ghosts close enough to overlap a ghost
+
+        Args:
+            ghost (Ghost): Ghost to look around, does not need to be in the group
+
+        Returns:
+            list: Ghosts in the 3x3 cells around the ghost's cell, in group order
+        """
+        grid_x, grid_y = ghost.get_grid_position(ghost.x, ghost.y)
+        found = []
+        for dy in (-1, 0, 1):
+            for dx in (-1, 0, 1):
+                bucket = self.buckets.get((grid_x + dx, grid_y + dy))
+                if bucket:
+                    found.extend(other for other in bucket if other is not ghost)
+        if len(found) > 1:
+            found.sort(key=self.order.__getitem__)
+        return found
+
+    def occupied_cells(self, ghost):
+        """
+        Cells holding at least one ghost other than the given one
+
+        Returns:
+            set: Grid cells
+        """
+        cells = set(self.buckets)
+        own_cell = self.cell_of.get(ghost)
+        if own_cell is not None and self.buckets[own_cell] == [ghost]:
+            cells.discard(own_cell)
+        return cells
@@ -8,26 +8,20 @@ class BlueGhost(Ghost):
     def __init__(self, position, cell_size, maze, target=None):
         # Call the parent constructor with blue color
         super().__init__(position, cell_size, maze, target, ghostType='blue')
-        
-        # BFS specific statistics
-        self.expanded_nodes = 0
-        self.search_time = 0
-        self.memory_usage = 0
 
     def calculate_path(self):
         """
         Implement BFS pathfinding algorithm to find path to Pacman.
         Overrides the abstract method from Ghost base class.
         """
-        if not self.target:
-            return []
-            
-        # Get current grid position of ghost and pacman
-        start = self.get_grid_position(self.x, self.y)
-        goal = self.get_grid_position(self.target.x, self.target.y)
-        
-        # Reset statistics for new search
-        self.expanded_nodes = 0
+        return self.run_search_steps()
+
+    def search_steps(self, start, goal):
+        """BFS from start to goal as a resumable generator, see Ghost.search_steps"""
+        path = yield from self.search_shortcuts(start, goal)
+        if path is not None:
+            # Like the cell search, an unreachable goal gives [start]
+            return path or [start]
         
         # BFS algorithm implementation
         queue = deque()
@@ -36,8 +30,11 @@ class BlueGhost(Ghost):
 
         queue.append(start)
         visited.add(start)
+        self.generated_nodes = 1
 
         while queue:
+            if len(queue) > self.max_frontier:
+                self.max_frontier = len(queue)
             current = queue.popleft()
             self.expanded_nodes += 1
 
@@ -52,20 +49,13 @@ class BlueGhost(Ghost):
                     queue.append(neighbor)
                     visited.add(neighbor)
                     parent[neighbor] = current
+                    self.generated_nodes += 1
+
+            yield parent
 
         # Store explored nodes for visualization
         if self.debug_mode:
             self.explored_nodes = [self.get_pixel_position(x, y) for x, y in visited]
 
         # Reconstruct path
-        path = []
-        node = goal
-        
-        while node != start and node in parent:
-            path.append(node)
-            node = parent[node]
-            
-        path.append(start)
-        path.reverse()
-        
-        return path
\ No newline at end of file
+        return self.reconstruct_path(parent, start, goal)
@@ -0,0 +1,215 @@
+import heapq
+from directions import DIRECTIONS
+from ghostImpl.redGhost import RedGhost
+
+INFINITY = float('inf')
+
+class IncrementalRedGhost(RedGhost):
+    """
+    Red Ghost variant that replans incrementally with Moving Target D* Lite.
+
+    The search tree is rooted at the ghost and kept between calls:
+    - When Pacman moves, the key modifier absorbs the heuristic change (as in D* Lite)
+    - When the ghost moves along its previous path, the subtree below its new
+      cell is kept and only the rest of the tree is deleted and repaired
+    - When cells enter or leave the search overlay, only those cells are updated
+
+    g and rhs values are stored relative to a moving offset so that moving the
+    root does not require rewriting the values of the kept subtree.
+    """
+    def __init__(self, position, cell_size, maze, target=None):
+        super().__init__(position, cell_size, maze, target)
+        self.reset_search()
+
+    def reset_search(self):
+        """Forget the previous search tree"""
+        self.g = {}
+        self.rhs = {}
+        self.parent = {}
+        self.open_heap = []
+        self.open_keys = {}  # {cell: key} for cells currently in the open list
+        self.key_modifier = 0
+        self.offset = 0
+        self.search_start = None
+        self.search_goal = None
+        self.search_excluded = set()
+        self.replans = 0
+
+    def restore(self, state):
+        """Restore the ghost and drop the search tree, which belongs to the old state"""
+        super().restore(state)
+        self.reset_search()
+
+    def calculate_key(self, cell):
+        """Priority of a cell in the open list"""
+        value = min(self.g.get(cell, INFINITY), self.rhs.get(cell, INFINITY))
+        return (value + self.manhattan_distance(cell, self.search_goal) + self.key_modifier, value)
+
+    def update_open(self, cell):
+        """Put a cell in the open list if it is inconsistent, remove it otherwise"""
+        if self.g.get(cell, INFINITY) != self.rhs.get(cell, INFINITY):
+            key = self.calculate_key(cell)
+            self.open_keys[cell] = key
+            heapq.heappush(self.open_heap, (key, cell))
+            self.generated_nodes += 1
+        else:
+            self.open_keys.pop(cell, None)
+
+    def update_state(self, cell):
+        """Recompute the rhs value of a cell from its predecessors"""
+        if cell != self.search_start:
+            best_value, best_parent = INFINITY, None
+            if (self.maze.is_inside(*cell) and not self.maze.is_wall(*cell)
+                    and cell not in self.search_excluded):
+                for dx, dy in DIRECTIONS:
+                    predecessor = (cell[0] + dx, cell[1] + dy)
+                    value = self.g.get(predecessor, INFINITY) + 1
+                    if value < best_value:
+                        best_value, best_parent = value, predecessor
+            if best_value == INFINITY:
+                # Unreachable cells are not stored, so the tree only holds live states
+                self.rhs.pop(cell, None)
+                self.parent.pop(cell, None)
+            else:
+                self.rhs[cell] = best_value
+                self.parent[cell] = best_parent
+        self.update_open(cell)
+
+    def top_key(self):
+        """Smallest valid key in the open list, dropping stale heap entries"""
+        while self.open_heap:
+            key, cell = self.open_heap[0]
+            if self.open_keys.get(cell) == key:
+                return key
+            heapq.heappop(self.open_heap)
+        return (INFINITY, INFINITY)
+
+    def compute_shortest_path(self):
+        """
+        Repair the search tree until the goal is consistent
+
+        Returns:
+            int: Number of expanded cells
+        """
+        expanded = 0
+        goal = self.search_goal
+        while (self.top_key() < self.calculate_key(goal)
+               or self.rhs.get(goal, INFINITY) != self.g.get(goal, INFINITY)):
+            if not self.open_heap:
+                break
+            if len(self.open_keys) > self.max_frontier:
+                self.max_frontier = len(self.open_keys)
+            old_key, cell = heapq.heappop(self.open_heap)
+            new_key = self.calculate_key(cell)
+            if old_key < new_key:
+                # Key grew because the goal moved, try again later
+                self.open_keys[cell] = new_key
+                heapq.heappush(self.open_heap, (new_key, cell))
+                continue
+
+            del self.open_keys[cell]
+            expanded += 1
+            if self.debug_mode:
+                self.explored_nodes.append(self.get_pixel_position(cell[0], cell[1]))
+
+            successors = self.maze.get_adjacent_cells(cell[0], cell[1])
+            if self.g.get(cell, INFINITY) > self.rhs.get(cell, INFINITY):
+                # Overconsistent: settle the cell
+                self.g[cell] = self.rhs[cell]
+                for successor in successors:
+                    self.update_state(successor)
+            else:
+                # Underconsistent: invalidate the cell and everything depending on it
+                self.g.pop(cell, None)
+                for successor in successors:
+                    self.update_state(successor)
+                self.update_state(cell)
+        return expanded
+
+    def move_start(self, new_start):
+        """
+        Re-root the search tree at the ghost's new cell.
+
+        If the new cell is in the previous tree, its subtree is still a valid
+        shortest path tree, so it is kept as is and the offset moves to the
+        new root's value. Every other cell is deleted and re-derived from its
+        neighbors. Otherwise the search starts over.
+        """
+        if self.rhs.get(new_start, INFINITY) == INFINITY:
+            goal, excluded = self.search_goal, self.search_excluded
+            self.reset_search()
+            self.search_goal, self.search_excluded = goal, excluded
+            self.search_start = new_start
+            self.rhs[new_start] = self.offset
+            self.update_open(new_start)
+            return
+
+        # Collect the subtree rooted at the new start
+        children = {}
+        for cell, parent in self.parent.items():
+            if parent is not None:
+                children.setdefault(parent, []).append(cell)
+        subtree = {new_start}
+        stack = [new_start]
+        while stack:
+            for child in children.get(stack.pop(), ()):
+                if child not in subtree:
+                    subtree.add(child)
+                    stack.append(child)
+
+        self.search_start = new_start
+        self.offset = self.rhs[new_start]
+        self.parent[new_start] = None
+
+        deleted = [cell for cell in self.rhs.keys() | self.g.keys() if cell not in subtree]
+        for cell in deleted:
+            self.g.pop(cell, None)
+            self.rhs.pop(cell, None)
+            self.parent.pop(cell, None)
+            self.open_keys.pop(cell, None)
+        for cell in deleted:
+            self.update_state(cell)
+        self.update_open(new_start)
+
+    def search_steps(self, start, goal):
+        """
+        Moving Target D* Lite from start to goal, reusing the previous search.
+        Replans are incremental and cheap, so unlike RedGhost's A* they run
+        in a single step when time-sliced.
+        """
+        # Capture other ghosts and blocked cells once for this search
+        excluded = self.begin_search()
+        self.explored_nodes = []
+
+        if self.search_start is None:
+            self.search_goal = goal
+            self.search_excluded = set(excluded)
+            self.search_start = start
+            self.rhs[start] = self.offset
+            self.update_open(start)
+        else:
+            if goal != self.search_goal:
+                self.key_modifier += self.manhattan_distance(self.search_goal, goal)
+                self.search_goal = goal
+            if start != self.search_start:
+                self.move_start(start)
+
+            # Only cells whose blocked/occupied status changed need an update
+            changed = self.search_excluded.symmetric_difference(excluded)
+            self.search_excluded = set(excluded)
+            for cell in changed:
+                self.update_state(cell)
+
+        self.expanded_nodes = self.compute_shortest_path()
+        self.replans += 1
+
+        if self.g.get(goal, INFINITY) == INFINITY:
+            return []
+
+        # Follow parent pointers back to the ghost
+        path = [goal]
+        while path[-1] != start and len(path) <= len(self.g):
+            path.append(self.parent[path[-1]])
+        path.reverse()
+        return path
+        yield  # Makes this a generator
@@ -0,0 +1,191 @@
+import heapq
+from ghostImpl.redGhost import RedGhost
+
+class JumpPointRedGhost(RedGhost):
+    """
+    Red Ghost variant that runs A* with Jump Point Search, adapted to
+    4-connected grids.
+
+    Among the shortest paths, only those that move horizontally as long as
+    possible and turn from vertical to horizontal only where a wall forces
+    it are considered:
+    - A horizontal move keeps going and may turn up or down at every cell,
+      so each horizontal step scans both vertical directions
+    - A vertical move keeps going, and turns sideways only at a forced
+      neighbor: an open cell beside it whose counterpart beside the
+      previous cell is blocked
+    A jump stops at the goal, at a forced neighbor, or (horizontally) where
+    a vertical scan finds one, so A* only expands those jump points and
+    the corridor cells in between are filled in when the path is rebuilt.
+    """
+    def search_steps(self, start, goal):
+        """A* over jump points from start to goal as a resumable generator, see Ghost.search_steps"""
+        # Jump points replace the junction graph, so only the path table applies
+        path = yield from self.search_shortcuts(start, goal, junctions=False)
+        if path is not None:
+            return path
+
+        if start == goal:
+            return [start]
+        if not self.maze.is_inside(*start) or not self.maze.is_inside(*goal):
+            return []
+
+        # Jumps run on cell indices of a grid padded with a blocked border
+        blocked, width = self.build_blocked_grid()
+        start_index = (start[1] + 1) * width + start[0] + 1
+        goal_index = (goal[1] + 1) * width + goal[0] + 1
+        heuristic = self.get_heuristic(goal)
+
+        # Priority queue for A*: (f_cost, g_cost, index, step it was reached with)
+        frontier = [(heuristic(start), 0, start_index, 0)]
+        self.generated_nodes = 1
+
+        g_costs = {start_index: 0}
+        parent = {}  # {jump point index: previous jump point index}
+
+        self.explored_nodes = []  # Reset for visualization
+
+        while frontier:
+            if len(frontier) > self.max_frontier:
+                self.max_frontier = len(frontier)
+            f_cost, g_cost, current, step = heapq.heappop(frontier)
+
+            # Skip stale entries, a cheaper path to this position was found later
+            if g_cost > g_costs[current]:
+                continue
+            self.expanded_nodes += 1
+            if self.debug_mode:
+                row, column = divmod(current, width)
+                self.explored_nodes.append(self.get_pixel_position(column - 1, row - 1))
+
+            if current == goal_index:
+                return self.fill_path(parent, start_index, goal_index, width)
+
+            for direction in self.prune_directions(current, step, blocked, width):
+                jump_point = self.jump(current, direction, goal_index, blocked, width)
+                if jump_point is None:
+                    continue
+                row, column = divmod(jump_point, width)
+                new_g = g_cost + abs(jump_point - current) // (1 if abs(direction) == 1 else width)
+                if new_g < g_costs.get(jump_point, float('inf')):
+                    g_costs[jump_point] = new_g
+                    parent[jump_point] = current
+                    h = heuristic((column - 1, row - 1))
+                    heapq.heappush(frontier, (new_g + h, new_g, jump_point, direction))
+                    self.generated_nodes += 1
+
+            # Jump points are not adjacent, so no parent map for partial paths
+            yield None
+
+        # No path found
+        return []
+
+    def build_blocked_grid(self):
+        """
+        Mark the search overlay on a copy of the maze's padded wall grid,
+        so jumps need no bounds checks. The walls are padded once per maze,
+        each search only copies them and marks its few overlay cells.
+
+        Returns:
+            tuple: (bytearray with 1 for blocked cells, width of a padded row)
+        """
+        maze = self.maze
+        width = maze.cols + 2
+        blocked = bytearray(maze.get_padded_wall_grid())
+        for grid_x, grid_y in self.search_overlay:
+            if 0 <= grid_x < maze.cols and 0 <= grid_y < maze.rows:
+                blocked[(grid_y + 1) * width + grid_x + 1] = 1
+        return blocked, width
+
+    @staticmethod
+    def prune_directions(index, step, blocked, width):
+        """
+        Directions worth jumping in from a jump point
+
+        Args:
+            index (int): Jump point being expanded
+            step (int): Index step it was reached with, 0 at the start
+            blocked (bytearray): Padded grid of blocked cells
+            width (int): Width of a padded row
+
+        Returns:
+            list: Index steps to jump along
+        """
+        if step == 0:
+            return [1, -1, -width, width]
+        if step == 1 or step == -1:
+            # Horizontal: ahead and both vertical directions are natural
+            return [step, -width, width]
+        # Vertical: ahead, plus the forced sideways neighbors
+        steps = [step]
+        behind = index - step
+        for side in (-1, 1):
+            if not blocked[index + side] and blocked[behind + side]:
+                steps.append(side)
+        return steps
+
+    @staticmethod
+    def jump(index, step, goal_index, blocked, width):
+        """
+        Move from a cell in one direction until reaching a jump point
+
+        Args:
+            index (int): Cell to jump from
+            step (int): Index step of the jump
+            goal_index (int): Goal cell
+            blocked (bytearray): Padded grid of blocked cells
+            width (int): Width of a padded row
+
+        Returns:
+            int: The jump point, None if the jump runs into a wall
+        """
+        if step == 1 or step == -1:
+            while True:
+                index += step
+                if blocked[index]:
+                    return None
+                if index == goal_index:
+                    return index
+                # A turn up or down from here may be needed: scan both ways
+                for vertical in (-width, width):
+                    cell = index
+                    while True:
+                        cell += vertical
+                        if blocked[cell]:
+                            break
+                        if (cell == goal_index
+                                or (not blocked[cell - 1] and blocked[cell - vertical - 1])
+                                or (not blocked[cell + 1] and blocked[cell - vertical + 1])):
+                            return index
+        while True:
+            index += step
+            if blocked[index]:
+                return None
+            # Goal, or a forced sideways neighbor: open beside this cell, blocked beside the previous one
+            if (index == goal_index
+                    or (not blocked[index - 1] and blocked[index - step - 1])
+                    or (not blocked[index + 1] and blocked[index - step + 1])):
+                return index
+
+    @staticmethod
+    def fill_path(parent, start_index, goal_index, width):
+        """Rebuild the cell path by walking the straight lines between jump points"""
+        jump_points = [goal_index]
+        while jump_points[-1] != start_index:
+            jump_points.append(parent[jump_points[-1]])
+        jump_points.reverse()
+
+        indices = [start_index]
+        for jump_point in jump_points[1:]:
+            last = indices[-1]
+            if jump_point // width == last // width:
+                step = 1 if jump_point > last else -1
+            else:
+                step = width if jump_point > last else -width
+            indices.extend(range(last + step, jump_point + step, step))
+
+        path = []
+        for index in indices:
+            row, column = divmod(index, width)
+            path.append((column - 1, row - 1))
+        return path
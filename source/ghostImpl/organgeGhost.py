@@ -11,24 +11,28 @@ class OrangeGhost(Ghost):
 
     def calculate_path(self):
         """Use Uniform Cost Search to find path to Pacman"""
-        if not self.target:
-            return []
-        
-        # Get grid positions
-        start_grid_x, start_grid_y = self.get_grid_position(self.x, self.y)
-        target_grid_x, target_grid_y = self.get_grid_position(self.target.x, self.target.y)
+        return self.run_search_steps()
+
+    def search_steps(self, start, goal):
+        """UCS from start to goal as a resumable generator, see Ghost.search_steps"""
+        path = yield from self.search_shortcuts(start, goal)
+        if path is not None:
+            return path
         
-        # Priority queue for UCS: (cost, position, path)
-        frontier = [(0, (start_grid_x, start_grid_y), [])]
-        heapq.heapify(frontier)
+        # Priority queue for UCS: (cost, position)
+        frontier = [(0, start)]
+        self.generated_nodes = 1
         
-        # Track visited nodes and their costs
-        visited = {}  # {position: cost}
+        # Best known cost and predecessor of every reached position
+        costs = {start: 0}  # {position: cost}
+        parent = {}  # {position: previous position}
         
         self.explored_nodes = []  # Reset explored nodes for visualization
         
         while frontier:
-            cost, current, path = heapq.heappop(frontier)
+            if len(frontier) > self.max_frontier:
+                self.max_frontier = len(frontier)
+            cost, current = heapq.heappop(frontier)
             current_x, current_y = current
             
             # Add to explored nodes for visualization
@@ -37,26 +41,28 @@ class OrangeGhost(Ghost):
                 self.explored_nodes.append((pixel_x, pixel_y))
             
             # Check if we've reached the target
-            if (current_x, current_y) == (target_grid_x, target_grid_y):
-                return path + [(current_x, current_y)]
+            if current == goal:
+                return self.reconstruct_path(parent, start, goal)
             
-            # Skip if we've already found a cheaper path to this position
-            if (current_x, current_y) in visited and visited[(current_x, current_y)] <= cost:
+            # Skip stale entries, a cheaper path to this position was found later
+            if cost > costs[current]:
                 continue
-                
-            # Mark as visited with current cost
-            visited[(current_x, current_y)] = cost
+            
+            self.expanded_nodes += 1
             
             # Check all neighbors
             for neighbor in self.get_neighbors(current_x, current_y):
-                new_x, new_y = neighbor
-                
                 # In UCS, all moves have equal cost (1)
                 new_cost = cost + 1
                 
                 # Add to frontier if unvisited or found a cheaper path
-                if neighbor not in visited or new_cost < visited[neighbor]:
-                    heapq.heappush(frontier, (new_cost, neighbor, path + [(current_x, current_y)]))
+                if neighbor not in costs or new_cost < costs[neighbor]:
+                    costs[neighbor] = new_cost
+                    parent[neighbor] = current
+                    heapq.heappush(frontier, (new_cost, neighbor))
+                    self.generated_nodes += 1
+            
+            yield parent
         
         # No path found
-        return []
\ No newline at end of file
+        return []
@@ -3,36 +3,40 @@ from ghost import Ghost
 class PinkGhost(Ghost):
     def __init__(self, position, cell_size, maze, target_ghost=None):
         super().__init__(position, cell_size, maze, target=target_ghost, ghostType='pink')
-        
     
     def calculate_path(self):
         """
         Implement Depth-First Search pathfinding algorithm to find path to Pacman.
         """
-        if not self.target:
-            return []
-        
-        # Get current grid position of ghost and Pacman
-        start = self.get_grid_position(self.x, self.y)
-        goal = self.get_grid_position(self.target.x, self.target.y)
+        return self.run_search_steps()
+
+    def search_steps(self, start, goal):
+        """DFS from start to goal as a resumable generator, see Ghost.search_steps"""
+        # Capture other ghosts and blocked cells once for this search
+        self.begin_search()
         
         # Reset explored nodes
         self.explored_nodes = []
         
         # DFS algorithm implementation
-        stack = [(start, [])]
+        stack = [start]
         visited = set([start])
+        parent = {}
+        self.generated_nodes = 1
 
         while stack:
-            current, path = stack.pop()
+            if len(stack) > self.max_frontier:
+                self.max_frontier = len(stack)
+            current = stack.pop()
             
             # Reached the goal
             if current == goal:
-                return path + [current]
+                return self.reconstruct_path(parent, start, goal)
             
             # Add to explored nodes for visualization
             pixel_pos = self.get_pixel_position(current[0], current[1])
             self.explored_nodes.append(pixel_pos)
+            self.expanded_nodes += 1
             
             # Get valid neighbors
             neighbors = self.get_neighbors(current[0], current[1])
@@ -41,9 +45,12 @@ class PinkGhost(Ghost):
             for neighbor in neighbors:
                 if neighbor not in visited:
                     visited.add(neighbor)
-                    # Track the full path to this neighbor
-                    new_path = path + [current]
-                    stack.append((neighbor, new_path))
+                    # Remember where we came from instead of copying the path
+                    parent[neighbor] = current
+                    stack.append(neighbor)
+                    self.generated_nodes += 1
+            
+            yield parent
         
         # If no path found, return to start
         return [start]
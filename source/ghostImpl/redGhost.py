@@ -10,8 +10,6 @@ class RedGhost(Ghost):
         # Call the parent constructor with red color
         super().__init__(position, cell_size, maze, target, ghostType='red')
         
-        # A* specific statistics
-        self.expanded_nodes = 0
         self.last_pos = None
 
     def manhattan_distance(self, start, end):
@@ -20,24 +18,32 @@ class RedGhost(Ghost):
 
     def calculate_path(self):
         """Use A* Search to find path to Pacman"""
-        if not self.target:
-            return []
+        self.current_path = self.run_search_steps()
+        return self.current_path
+
+    def search_steps(self, start, goal):
+        """A* from start to goal as a resumable generator, see Ghost.search_steps"""
+        # Manhattan distance, or the landmark estimate when landmarks are attached
+        heuristic = self.get_heuristic(goal)
         
-        # Get grid positions
-        start = self.get_grid_position(self.x, self.y)
-        goal = self.get_grid_position(self.target.x, self.target.y)
+        path = yield from self.search_shortcuts(start, goal, heuristic)
+        if path is not None:
+            return path
         
-        # Priority queue for A*: (f_cost, g_cost, position, path)
-        frontier = [(self.manhattan_distance(start, goal), 0, start, [])]
-        heapq.heapify(frontier)
+        # Priority queue for A*: (f_cost, g_cost, position)
+        frontier = [(heuristic(start), 0, start)]
+        self.generated_nodes = 1
         
-        # Track visited nodes and their g_costs
-        visited = {}  # {position: g_cost}
+        # Best known g_cost and predecessor of every reached position
+        g_costs = {start: 0}  # {position: g_cost}
+        parent = {}  # {position: previous position}
         
         self.explored_nodes = []  # Reset for visualization
         
         while frontier:
-            f_cost, g_cost, current, path = heapq.heappop(frontier)
+            if len(frontier) > self.max_frontier:
+                self.max_frontier = len(frontier)
+            f_cost, g_cost, current = heapq.heappop(frontier)
             current_x, current_y = current
             
             # Add to explored nodes for visualization
@@ -47,22 +53,24 @@ class RedGhost(Ghost):
             
             # Reached the goal
             if current == goal:
-                self.current_path = path + [current]
-                return self.current_path
+                return self.reconstruct_path(parent, start, goal)
             
-            # Skip if we’ve already visited with a cheaper cost
-            if current in visited and visited[current] <= g_cost:
+            # Skip stale entries, a cheaper path to this position was found later
+            if g_cost > g_costs[current]:
                 continue
             
-            visited[current] = g_cost
+            self.expanded_nodes += 1
             
             for neighbor in self.get_neighbors(current_x, current_y):
                 new_g = g_cost + 1
-                if neighbor not in visited or new_g < visited[neighbor]:
-                    h = self.manhattan_distance(neighbor, goal)
-                    new_f = new_g + h
-                    heapq.heappush(frontier, (new_f, new_g, neighbor, path + [current]))
+                if new_g < g_costs.get(neighbor, float('inf')):
+                    g_costs[neighbor] = new_g
+                    parent[neighbor] = current
+                    h = heuristic(neighbor)
+                    heapq.heappush(frontier, (new_g + h, new_g, neighbor))
+                    self.generated_nodes += 1
+            
+            yield parent
         
         # No path found
-        self.current_path = []
         return []
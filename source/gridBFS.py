@@ -0,0 +1,228 @@
+import numpy as np
+
+# Cells packed per word of the bit grids
+WORD_BITS = 64
+
+ONE = np.uint64(1)
+LAST_BIT = np.uint64(WORD_BITS - 1)
+
+class GridBFS:
+    """
+    Level-synchronous BFS over a bit-packed grid with NumPy, for many
+    (start, goal) queries at once.
+
+    Every grid row is packed into 64-bit words, cell x at bit x + 1, with
+    the bits before and after the row left closed so that no move wraps to
+    another row. A query is one such bit grid, and a batch of queries is a
+    2D array with one bit grid per row. One BFS level grows all frontiers
+    at once with four shifts: one bit left and right (with the carry from
+    the neighboring word) and one row of words up and down. Masking with
+    the open cells and the cells not yet reached leaves the next frontier,
+    so a level costs a handful of array operations over cells / 64 words
+    per query instead of a Python loop over the frontier cells. A BFS moves
+    at most one row per level, so each level only works on the rows between
+    the start rows minus and plus the level.
+
+    The kernel pays off for batches: PathTable.build_table runs its
+    all-pairs BFS through distance_fields. A single query is slower than
+    the ghosts' own BFS, which is why the ghosts do not use it.
+    """
+    def __init__(self, maze):
+        """
+        Args:
+            maze (Maze): Maze whose walls close the grid
+        """
+        self.cols = maze.cols
+        self.rows = maze.rows
+        self.row_words = (maze.cols + 2 + WORD_BITS - 1) // WORD_BITS
+        self.words = self.rows * self.row_words
+
+        walls = np.frombuffer(bytes(maze.wall_grid), dtype=np.uint8).reshape(maze.rows, maze.cols)
+        self.open_cells = self.pack(walls == 0)
+
+        # Bit position of every grid index in an unpacked bit grid
+        grid_y, grid_x = np.divmod(np.arange(self.rows * self.cols), self.cols)
+        self.cell_bits = grid_y * self.row_words * WORD_BITS + grid_x + 1
+
+    def pack(self, cells):
+        """
+        Pack a boolean (rows, cols) grid into bit grid words
+
+        Returns:
+            numpy.ndarray: uint64 array of rows * row_words words
+        """
+        bits = np.zeros((self.rows, self.row_words * WORD_BITS), dtype=bool)
+        bits[:, 1:self.cols + 1] = cells
+        return np.packbits(bits, axis=1, bitorder='little').view('<u8').astype(np.uint64).ravel()
+
+    def locate(self, cell):
+        """
+        Word and bit of a grid cell
+
+        Returns:
+            tuple: (word index, bit index), None if the cell is outside the grid
+        """
+        grid_x, grid_y = cell
+        if not (0 <= grid_x < self.cols and 0 <= grid_y < self.rows):
+            return None
+        return grid_y * self.row_words + (grid_x + 1) // WORD_BITS, (grid_x + 1) % WORD_BITS
+
+    def grow(self, frontier):
+        """
+        Cells next to a batch of frontiers, walls not excluded yet
+
+        Args:
+            frontier (numpy.ndarray): (queries, words) bit grids
+
+        Returns:
+            numpy.ndarray: Bit grids of every cell one step from a frontier cell
+        """
+        row_words = self.row_words
+        grown = frontier << ONE
+        grown[:, 1:] |= frontier[:, :-1] >> LAST_BIT
+        grown |= frontier >> ONE
+        grown[:, :-1] |= frontier[:, 1:] << LAST_BIT
+        grown[:, row_words:] |= frontier[:, :-row_words]
+        grown[:, :-row_words] |= frontier[:, row_words:]
+        return grown
+
+    def unpack(self, words):
+        """
+        Unpack a batch of bit grids into one value per grid index
+
+        Args:
+            words (numpy.ndarray): (queries, words) bit grids
+
+        Returns:
+            numpy.ndarray: (queries, rows * cols) array of 0 and 1
+        """
+        bits = np.unpackbits(words.view(np.uint8), axis=1, bitorder='little')
+        return bits[:, self.cell_bits]
+
+    def distance_fields(self, sources):
+        """
+        BFS distances from a batch of source cells to every grid cell
+
+        Rather than unpacking every level's frontier, the levels are counted
+        in bit planes: each level adds one, in binary, to the counter bits of
+        every cell reached before it, so a cell reached at level L ends up
+        counting levels - L.
+
+        Args:
+            sources (list): Grid cells to measure from
+
+        Returns:
+            numpy.ndarray: (sources, rows * cols) int32 distances, -1 where unreachable
+        """
+        reached = np.zeros((len(sources), self.words), dtype=np.uint64)
+        low_row, high_row = self.rows, 0  # Rows holding a source, as [low, high)
+        for index, source in enumerate(sources):
+            place = self.locate(source)
+            if place is None:
+                continue
+            reached[index, place[0]] |= ONE << np.uint64(place[1])
+            low_row, high_row = min(low_row, source[1]), max(high_row, source[1] + 1)
+
+        frontier = reached.copy()
+        planes = []  # Bits of the level counters, lowest first
+        levels = 0
+        while low_row < high_row:
+            low_row, high_row = max(low_row - 1, 0), min(high_row + 1, self.rows)
+            window = slice(low_row * self.row_words, high_row * self.row_words)
+            grown = self.grow(frontier[:, window]) & self.open_cells[window] & ~reached[:, window]
+            if not grown.any():
+                break
+            levels += 1
+
+            # Add one to the counters of the cells reached so far
+            carry = reached[:, window]
+            for plane in planes:
+                plane[:, window], carry = plane[:, window] ^ carry, plane[:, window] & carry
+                if not carry.any():
+                    break
+            else:
+                # Some counters carry into a bit no counter used yet
+                plane = np.zeros_like(reached)
+                plane[:, window] = carry
+                planes.append(plane)
+
+            frontier[:, window] = grown
+            reached[:, window] |= grown
+
+        counts = np.zeros((len(sources), self.rows * self.cols), dtype=np.int32)
+        for bit, plane in enumerate(planes):
+            counts |= self.unpack(plane).astype(np.int32) << bit
+        return np.where(self.unpack(reached).astype(bool), levels - counts, -1)
+
+    def path_lengths(self, queries, overlays=None):
+        """
+        Shortest path lengths of a batch of queries
+
+        Like the ghosts' BFS, a start cell inside a wall or an overlay still
+        expands to its open neighbors, while a goal in a wall or an overlay
+        is unreachable.
+
+        Args:
+            queries (list): (start, goal) grid cell pairs
+            overlays (list): Cells to treat as walls per query (e.g. other
+                ghosts), None for none
+
+        Returns:
+            list: Number of steps per query, -1 if the goal cannot be reached
+        """
+        lengths = [-1] * len(queries)
+        open_cells = np.tile(self.open_cells, (len(queries), 1))
+        reached = np.zeros((len(queries), self.words), dtype=np.uint64)
+        pending = []  # (query index, goal word, goal bit) still searching
+        low_row, high_row = self.rows, 0  # Rows holding a start, as [low, high)
+
+        for index, (start, goal) in enumerate(queries):
+            start_place, goal_place = self.locate(start), self.locate(goal)
+            if start == goal:
+                lengths[index] = 0
+                continue
+            if start_place is None or goal_place is None:
+                continue
+            if overlays is not None:
+                for cell in overlays[index]:
+                    place = self.locate(cell)
+                    if place is not None:
+                        open_cells[index, place[0]] &= ~(ONE << np.uint64(place[1]))
+            reached[index, start_place[0]] |= ONE << np.uint64(start_place[1])
+            low_row, high_row = min(low_row, start[1]), max(high_row, start[1] + 1)
+            pending.append((index, goal_place[0], goal_place[1]))
+
+        if not pending:
+            return lengths
+
+        # Only the searching queries take part in the levels
+        query_index = np.array([index for index, _, _ in pending])
+        goal_words = np.array([word for _, word, _ in pending])
+        goal_bits = np.array([bit for _, _, bit in pending], dtype=np.uint64)
+        open_cells = open_cells[query_index]
+        reached = reached[query_index]
+        frontier = reached.copy()
+        rows = np.arange(len(pending))
+
+        level = 0
+        while len(rows):
+            level += 1
+            low_row, high_row = max(low_row - 1, 0), min(high_row + 1, self.rows)
+            window = slice(low_row * self.row_words, high_row * self.row_words)
+            grown = self.grow(frontier[:, window]) & open_cells[:, window] & ~reached[:, window]
+            frontier[:, window] = grown
+            reached[:, window] |= grown
+
+            found = (frontier[rows, goal_words] >> goal_bits) & ONE
+            for row in np.flatnonzero(found):
+                lengths[query_index[row]] = level
+            alive = (found == 0) & grown.any(axis=1)
+
+            # Drop finished queries so later levels only touch live ones
+            if not alive.all():
+                keep = np.flatnonzero(alive)
+                query_index, goal_words, goal_bits = query_index[keep], goal_words[keep], goal_bits[keep]
+                open_cells, reached, frontier = open_cells[keep], reached[keep], frontier[keep]
+                rows = np.arange(len(keep))
+
+        return lengths
@@ -0,0 +1,255 @@
+"""
+Headless simulation: runs games with no display, no rendering and no frame cap.
+
+Run from the repository root, for example:
+    python source/headless.py --games 5 --max-ticks 20000
+    python source/headless.py --policy nearest-dot --check-clear 24 20 29
+"""
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import argparse
+import hashlib
+import random
+import time
+from collections import deque
+import pygame
+import config
+from engine import GameEngine
+from world import World
+
+DIRECTION_NAMES = ['up', 'down', 'left', 'right']
+
+# Pacman direction name for each grid step
+STEP_DIRECTIONS = {(0, -1): 'up', (1, 0): 'right', (0, 1): 'down', (-1, 0): 'left'}
+
+def init_headless_display():
+    """Initialize pygame with a tiny hidden display so images can be converted"""
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+class RandomPacmanPolicy:
+    """Pacman policy that queues a random direction every few ticks"""
+    def __init__(self, seed=None, turn_interval=20):
+        self.rng = random.Random(seed)
+        self.turn_interval = turn_interval
+
+    def act(self, pacman, tick):
+        """Steer Pacman for the given tick"""
+        pacman.frozen = False
+        if tick % self.turn_interval == 0:
+            pacman.change_direction(self.rng.choice(DIRECTION_NAMES))
+
+class NearestDotPacmanPolicy:
+    """
+    Scripted Pacman policy that heads for the closest remaining dot.
+    A BFS over the maze picks the first step whenever Pacman is within one
+    step of a cell center, where it can turn, or runs into a wall.
+    """
+    def act(self, pacman, tick):
+        """Steer Pacman for the given tick"""
+        pacman.frozen = False
+        maze = pacman.maze
+        start = pacman.get_grid_position()
+        center_x, center_y = maze.get_cell_center(*start)
+        near_center = abs(pacman.x - center_x) < pacman.speed and abs(pacman.y - center_y) < pacman.speed
+        if not near_center and not pacman.is_blocked(pacman.direction):
+            return
+
+        first_steps = {start: None}
+        queue = deque([start])
+        while queue:
+            current = queue.popleft()
+            if maze.has_dot(*current) and first_steps[current] is not None:
+                step = first_steps[current]
+                pacman.change_direction(STEP_DIRECTIONS[(step[0] - start[0], step[1] - start[1])])
+                return
+            for neighbor in maze.get_adjacent_cells(current[0], current[1]):
+                if neighbor not in first_steps:
+                    first_steps[neighbor] = first_steps[current] or neighbor
+                    queue.append(neighbor)
+
+# Pacman policies by command line name
+PACMAN_POLICIES = {
+    'random': lambda seed: RandomPacmanPolicy(seed=seed),
+    'nearest-dot': lambda seed: NearestDotPacmanPolicy(),
+}
+
+def create_world(maze_layout, cell_size=None, ghost_spawns=None, seed=0):
+    """
+    Build a fresh game ready to be stepped headlessly
+
+    Args:
+        maze_layout (list): Maze layout as a list of strings
+        cell_size (int): Cell size in pixels, defaults to the windowed game's
+        ghost_spawns (dict): Ghost type per maze symbol, defaults to config.GHOST_SPAWNS
+        seed (int): Seed of the ghosts' random generator
+
+    Returns:
+        World: World owning the new maze, Pacman, ghosts and engine
+    """
+    if cell_size is None:
+        cell_size = config.calculate_cell_size(config.SCREEN_WIDTH, config.SCREEN_HEIGHT, maze_layout)
+
+    return World(maze_layout, cell_size, ghost_spawns, seed=seed)
+
+def create_engine(maze_layout, cell_size=None, ghost_spawns=None, seed=0):
+    """Build a fresh game and return its engine, see create_world"""
+    return create_world(maze_layout, cell_size, ghost_spawns, seed).engine
+
+def run_engine(engine, policy, max_ticks):
+    """
+    Step a game as fast as possible until it ends or hits the tick limit
+
+    Args:
+        engine (GameEngine): Game to play
+        policy: Object with an act(pacman, tick) method steering Pacman
+        max_ticks (int): Stop the game after this many ticks
+
+    Returns:
+        dict: Outcome, score, ticks, elapsed seconds and ticks per second
+    """
+    start = time.perf_counter()
+    while engine.ticks < max_ticks:
+        policy.act(engine.pacman, engine.ticks)
+        if engine.step() != GameEngine.RUNNING:
+            break
+    elapsed = time.perf_counter() - start
+
+    return {
+        'state': engine.state,
+        'caught_by': engine.caught_by.ghostType if engine.caught_by else None,
+        'score': engine.score,
+        'ticks': engine.ticks,
+        'elapsed': elapsed,
+        'ticks_per_second': engine.ticks / elapsed if elapsed > 0 else float('inf'),
+    }
+
+def run_game(maze_layout, policy, max_ticks, cell_size=None, ghost_spawns=None, seed=0):
+    """Create a game and play it headlessly, see create_world and run_engine"""
+    world = create_world(maze_layout, cell_size, ghost_spawns, seed)
+    try:
+        return run_engine(world.engine, policy, max_ticks)
+    finally:
+        world.close()
+
+def get_state_hash(world):
+    """Hash of a World's snapshot, equal for identical game states"""
+    return hashlib.sha1(repr(world.snapshot()).encode('utf-8')).hexdigest()
+
+def check_determinism(maze_layout, policy_name, seed, max_ticks):
+    """
+    Play the same game twice, each in a fresh World with the same seeds,
+    and compare the state hash after every tick
+
+    Args:
+        maze_layout (list): Maze layout as a list of strings
+        policy_name (str): Pacman policy, see PACMAN_POLICIES
+        seed (int): Seed of the Pacman policy and the ghosts
+        max_ticks (int): Stop the games after this many ticks
+
+    Returns:
+        tuple: (hashes of the first run, tick of the first differing state or None)
+    """
+    runs = []
+    for _ in range(2):
+        world = create_world(maze_layout, seed=seed)
+        policy = PACMAN_POLICIES[policy_name](seed)
+        hashes = [get_state_hash(world)]
+        while world.engine.ticks < max_ticks:
+            policy.act(world.pacman, world.engine.ticks)
+            state = world.engine.step()
+            hashes.append(get_state_hash(world))
+            if state != GameEngine.RUNNING:
+                break
+        world.close()
+        runs.append(hashes)
+
+    first, second = runs
+    for tick, (first_hash, second_hash) in enumerate(zip(first, second)):
+        if first_hash != second_hash:
+            return first, tick
+    if len(first) != len(second):
+        return first, min(len(first), len(second))
+    return first, None
+
+def check_clear(maze_layout, policy_name, seed, max_ticks, cell_size):
+    """
+    Play a game without ghosts and check that the policy eats every dot.
+    Pacman moves a fixed number of pixels per tick, so cell sizes that are
+    not a multiple of its speed test that it can still turn everywhere.
+
+    Args:
+        maze_layout (list): Maze layout as a list of strings
+        policy_name (str): Pacman policy, see PACMAN_POLICIES
+        seed (int): Seed of the Pacman policy
+        max_ticks (int): Stop the game after this many ticks
+        cell_size (int): Cell size in pixels
+
+    Returns:
+        tuple: (True if the game was won, run_engine result, dots left)
+    """
+    world = create_world(maze_layout, cell_size, ghost_spawns={}, seed=seed)
+    try:
+        result = run_engine(world.engine, PACMAN_POLICIES[policy_name](seed), max_ticks)
+        return result['state'] == GameEngine.WON, result, world.maze.dots_remaining
+    finally:
+        world.close()
+
+def main():
+    parser = argparse.ArgumentParser(description="Run Pac-Man games without a display")
+    parser.add_argument('--maze', default=config.MAZE_PATH, help="maze file to play")
+    parser.add_argument('--games', type=int, default=1, help="number of games to play")
+    parser.add_argument('--max-ticks', type=int, default=10000, help="tick limit per game")
+    parser.add_argument('--seed', type=int, default=0, help="seed for the random Pacman policy")
+    parser.add_argument('--policy', choices=sorted(PACMAN_POLICIES), default='random', help="Pacman policy")
+    parser.add_argument('--check-determinism', action='store_true',
+                        help="play every game twice and compare the state after each tick")
+    parser.add_argument('--check-clear', type=int, nargs='+', metavar='CELL_SIZE',
+                        help="play without ghosts at each cell size and fail unless Pacman eats every dot")
+    args = parser.parse_args()
+
+    init_headless_display()
+    maze_layout = config.load_maze_layout(args.maze)
+
+    if args.check_clear:
+        failed = 0
+        for cell_size in args.check_clear:
+            cleared, result, dots_left = check_clear(maze_layout, args.policy, args.seed, args.max_ticks, cell_size)
+            if cleared:
+                print(f"cell size {cell_size}: cleared in {result['ticks']} ticks")
+            else:
+                failed += 1
+                print(f"cell size {cell_size}: {dots_left} dots left after {result['ticks']} ticks")
+        if failed:
+            raise SystemExit(1)
+        return
+
+    if args.check_determinism:
+        diverged = 0
+        for game in range(args.games):
+            hashes, tick = check_determinism(maze_layout, args.policy, args.seed + game, args.max_ticks)
+            if tick is None:
+                print(f"game {game}: identical over {len(hashes) - 1} ticks, final state {hashes[-1][:12]}")
+            else:
+                diverged += 1
+                print(f"game {game}: states differ from tick {tick}")
+        if diverged:
+            raise SystemExit(1)
+        return
+
+    total_ticks = 0
+    total_elapsed = 0.0
+    for game in range(args.games):
+        result = run_game(maze_layout, PACMAN_POLICIES[args.policy](args.seed + game), args.max_ticks,
+                          seed=args.seed + game)
+        total_ticks += result['ticks']
+        total_elapsed += result['elapsed']
+        print(f"game {game}: {result['state']:7s} score {result['score']:4d}"
+              f" ticks {result['ticks']:6d}   {result['ticks_per_second']:10.0f} ticks/s")
+
+    if total_elapsed > 0:
+        print(f"total: {total_ticks} ticks in {total_elapsed:.3f} s, {total_ticks / total_elapsed:.0f} ticks/s")
+
+if __name__ == "__main__":
+    main()
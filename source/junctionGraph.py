@@ -0,0 +1,216 @@
+import heapq
+
+INFINITY = float('inf')
+
+class JunctionGraph:
+    """
+    Corridor-compressed graph of a maze.
+
+    Nodes are the walkable cells that do not have exactly two walkable
+    neighbors (junctions and dead ends), plus one cell of every loop without
+    any junction. Edges are the corridors between them, weighted by their
+    number of steps, and remember the cells they run through. A search on
+    this graph expands only the nodes instead of every corridor cell and
+    turns the result back into a cell path of the same length as a
+    cell-level shortest path.
+
+    Cells occupied by dynamic obstacles close the corridor they lie in, or
+    remove the node they are. Start and goal cells in the middle of a
+    corridor are linked to the corridor's ends for the one search.
+    """
+    def __init__(self, maze):
+        """
+        Args:
+            maze (Maze): Maze to compress
+        """
+        self.maze = maze
+        self.nodes = set()
+        self.edges = {}  # {node: [(neighbor, length, corridor index, cells from node to neighbor)]}
+        self.corridors = []  # [(node, node, cells between them)]
+        self.corridor_of = {}  # {corridor cell: (corridor index, position in the corridor)}
+        self.build()
+
+    def build(self):
+        """Find the nodes and walk every corridor once"""
+        maze = self.maze
+        walkable = [(grid_x, grid_y) for grid_y in range(maze.rows) for grid_x in range(maze.cols)
+                    if not maze.is_wall(grid_x, grid_y)]
+        self.nodes = {cell for cell in walkable if len(maze.get_adjacent_cells(*cell)) != 2}
+        for node in self.nodes:
+            self.edges[node] = []
+
+        walked = set()  # (node, first cell) pairs already followed
+        for node in list(self.nodes):
+            self.walk_from(node, walked)
+
+        # Loops without any junction get one of their cells as a node
+        for cell in walkable:
+            if cell not in self.nodes and cell not in self.corridor_of:
+                self.nodes.add(cell)
+                self.edges[cell] = []
+                self.walk_from(cell, walked)
+
+    def walk_from(self, node, walked):
+        """Follow every corridor leaving a node that was not walked yet"""
+        for first in self.maze.get_adjacent_cells(*node):
+            if (node, first) in walked:
+                continue
+            previous, current = node, first
+            cells = []
+            while current not in self.nodes:
+                cells.append(current)
+                previous, current = current, next(
+                    cell for cell in self.maze.get_adjacent_cells(*current) if cell != previous)
+            walked.add((node, first))
+            walked.add((current, previous))
+            self.add_corridor(node, current, cells)
+
+    def add_corridor(self, start, end, cells):
+        """Add the edge between two nodes through the given cells"""
+        index = len(self.corridors)
+        self.corridors.append((start, end, tuple(cells)))
+        for position, cell in enumerate(cells):
+            self.corridor_of[cell] = (index, position)
+        if start == end:
+            # A loop back to the same node never shortens a path
+            return
+        length = len(cells) + 1
+        self.edges[start].append((end, length, index, tuple(cells)))
+        self.edges[end].append((start, length, index, tuple(reversed(cells))))
+
+    def link_to_ends(self, cell, blocked):
+        """
+        Links between a mid-corridor cell and its corridor's ends
+
+        Args:
+            cell (tuple): Corridor cell
+            blocked (dict): Obstacle positions per corridor index
+
+        Returns:
+            list: (end node, length, cells from the cell to the end) for every
+            end reachable without crossing an obstacle
+        """
+        index, position = self.corridor_of[cell]
+        start, end, cells = self.corridors[index]
+        obstacles = blocked.get(index, ())
+        links = []
+        if not any(obstacle < position for obstacle in obstacles):
+            links.append((start, position + 1, cells[position - 1::-1] if position else ()))
+        if not any(obstacle > position for obstacle in obstacles):
+            links.append((end, len(cells) - position, cells[position + 1:]))
+        return links
+
+    def search_steps(self, ghost, start, goal, heuristic=None):
+        """
+        Shortest path search on the graph as a generator that yields once per
+        expanded node, see Ghost.search_steps. Unlike the cell searches it
+        yields no parent map, so time-sliced searches get no partial path.
+
+        Args:
+            ghost (Ghost): Searching ghost, for its search overlay and counters
+            start (tuple): Start cell
+            goal (tuple): Goal cell
+            heuristic (callable): Distance estimate of a cell to the goal for A*, None runs Dijkstra
+
+        Returns:
+            list: Grid cells from start to goal, empty if there is no path,
+            None if start or goal is not a walkable cell
+        """
+        if start == goal:
+            return [start]
+        if not self.contains(start) or not self.contains(goal):
+            return None
+        overlay = ghost.search_overlay
+        if goal in overlay:
+            return []
+
+        # Obstacles on corridors close them, obstacles on nodes remove them
+        blocked = {}
+        for cell in overlay:
+            place = self.corridor_of.get(cell)
+            if place is not None:
+                blocked.setdefault(place[0], []).append(place[1])
+
+        # Temporary links of a start or goal in the middle of a corridor
+        start_links = None
+        if start not in self.nodes:
+            start_links = [(end, length, cells) for end, length, cells in self.link_to_ends(start, blocked)
+                           if end not in overlay]
+            same_corridor = goal in self.corridor_of and self.corridor_of[goal][0] == self.corridor_of[start][0]
+            if same_corridor:
+                index, start_position = self.corridor_of[start]
+                goal_position = self.corridor_of[goal][1]
+                low, high = sorted((start_position, goal_position))
+                if not any(low < obstacle < high for obstacle in blocked.get(index, ())):
+                    cells = self.corridors[index][2]
+                    between = cells[start_position + 1:goal_position] if start_position < goal_position \
+                        else cells[start_position - 1:goal_position:-1]
+                    start_links.append((goal, high - low, between))
+        goal_links = {}
+        if goal not in self.nodes:
+            for end, length, cells in self.link_to_ends(goal, blocked):
+                if end not in goal_links or length < goal_links[end][0]:
+                    goal_links[end] = (length, tuple(reversed(cells)))
+
+        estimate = heuristic if heuristic is not None else lambda cell: 0
+
+        costs = {start: 0}
+        parent = {start: None}  # {node: (previous node, cells between them)}
+        frontier = [(estimate(start), 0, start)]
+        ghost.generated_nodes = 1
+        explored = []
+
+        while frontier:
+            if len(frontier) > ghost.max_frontier:
+                ghost.max_frontier = len(frontier)
+            _, cost, node = heapq.heappop(frontier)
+
+            # Skip stale entries, a cheaper path to this node was found later
+            if cost > costs[node]:
+                continue
+            ghost.expanded_nodes += 1
+            if ghost.debug_mode:
+                explored.append(ghost.get_pixel_position(node[0], node[1]))
+
+            if node == goal:
+                ghost.explored_nodes = explored
+                return self.expand_path(parent, goal)
+
+            if node == start and start_links is not None:
+                links = start_links
+            else:
+                links = [(neighbor, length, cells) for neighbor, length, index, cells in self.edges[node]
+                         if index not in blocked and neighbor not in overlay]
+                if node in goal_links:
+                    length, cells = goal_links[node]
+                    links.append((goal, length, cells))
+
+            for neighbor, length, cells in links:
+                new_cost = cost + length
+                if new_cost < costs.get(neighbor, INFINITY):
+                    costs[neighbor] = new_cost
+                    parent[neighbor] = (node, cells)
+                    heapq.heappush(frontier, (new_cost + estimate(neighbor), new_cost, neighbor))
+                    ghost.generated_nodes += 1
+
+            yield None
+
+        ghost.explored_nodes = explored
+        return []
+
+    def contains(self, cell):
+        """Whether a cell is a node or lies on a corridor"""
+        return cell in self.nodes or cell in self.corridor_of
+
+    @staticmethod
+    def expand_path(parent, goal):
+        """Turn a chain of nodes back into the cells it runs through"""
+        path = [goal]
+        node = goal
+        while parent[node] is not None:
+            previous, cells = parent[node]
+            path.extend(reversed(cells))
+            path.append(previous)
+            node = previous
+        path.reverse()
+        return path
@@ -0,0 +1,128 @@
+import threading
+import numpy as np
+from flowField import FlowField
+
+# Goals whose heuristic field is kept, all ghosts usually chase the same cell
+HEURISTIC_CACHE_SIZE = 16
+
+class Landmarks:
+    """
+    ALT (A*, landmarks, triangle inequality) distance estimates.
+
+    BFS distances from a few landmark cells are computed once per maze.
+    For any landmark L, |d(L, a) - d(L, b)| never exceeds the true distance
+    between a and b, so the maximum over the landmarks (and the Manhattan
+    distance) is an admissible and consistent A* heuristic. Cells occupied
+    by ghosts only make true distances longer, so it stays admissible with
+    dynamic obstacles.
+
+    Landmarks are picked by farthest-point selection: each one is the cell
+    farthest from the landmarks chosen before it, which places them at the
+    ends of the maze where the estimates are tightest.
+    """
+    def __init__(self, maze, count=8):
+        """
+        Args:
+            maze (Maze): Maze to compute the distances in
+            count (int): Number of landmarks
+        """
+        self.maze = maze
+        self.cols = maze.cols
+        self.rows = maze.rows
+        self.landmarks = []  # Grid cells
+
+        # distances[i, y * cols + x] is the BFS distance from landmark i, -1 if unreachable
+        self.distances = np.empty((0, self.rows * self.cols), dtype=np.int32)
+
+        # Coordinates of every grid index, for the vectorized Manhattan distance
+        grid_y, grid_x = np.divmod(np.arange(self.rows * self.cols), self.cols)
+        self.grid_x = grid_x.astype(np.int32)
+        self.grid_y = grid_y.astype(np.int32)
+
+        self.heuristics = {}  # {goal: heuristic per grid index as a list}
+        # Planner worker threads share the cache, so lookups and evictions hold this
+        self.heuristics_lock = threading.Lock()
+        self.select(count)
+
+    def compute_distances(self, cell):
+        """BFS distances from a cell to every grid cell, -1 where unreachable"""
+        field = FlowField(self.maze, None)
+        field.compute(cell)
+        return np.array(field.distances, dtype=np.int32)
+
+    def select(self, count):
+        """Pick the landmarks by farthest-point selection and store their distances"""
+        walls = np.frombuffer(bytes(self.maze.wall_grid), dtype=np.uint8)
+        walkable = np.flatnonzero(walls == 0)
+        if count <= 0 or len(walkable) == 0:
+            return
+
+        # The first landmark is the cell farthest from an arbitrary walkable cell
+        first = int(walkable[0])
+        candidate = int(np.argmax(self.compute_distances((first % self.cols, first // self.cols))))
+        rows = []
+        closest = None  # Distance to the nearest landmark so far, -1 if none reaches the cell
+        while len(rows) < count:
+            cell = (candidate % self.cols, candidate // self.cols)
+            distances = self.compute_distances(cell)
+            self.landmarks.append(cell)
+            rows.append(distances)
+
+            if closest is None:
+                closest = distances
+            else:
+                both = (closest >= 0) & (distances >= 0)
+                closest = np.where(both, np.minimum(closest, distances), np.maximum(closest, distances))
+            candidate = int(np.argmax(closest))
+            if closest[candidate] <= 0:
+                break  # Every reachable cell is a landmark
+
+        self.distances = np.stack(rows)
+
+    def get_heuristic(self, goal):
+        """
+        Distance estimate to a goal for A*
+
+        Args:
+            goal (tuple): Goal cell
+
+        Returns:
+            callable: Takes a cell and returns a lower bound of its distance to the goal
+        """
+        goal_x, goal_y = goal
+        if not (0 <= goal_x < self.cols and 0 <= goal_y < self.rows):
+            return lambda cell: abs(cell[0] - goal_x) + abs(cell[1] - goal_y)
+
+        with self.heuristics_lock:
+            estimates = self.heuristics.get(goal)
+            if estimates is None:
+                estimates = self.compute_heuristic(goal)
+                if len(self.heuristics) >= HEURISTIC_CACHE_SIZE:
+                    del self.heuristics[next(iter(self.heuristics))]
+                self.heuristics[goal] = estimates
+
+        cols, rows = self.cols, self.rows
+
+        def heuristic(cell):
+            grid_x, grid_y = cell
+            if 0 <= grid_x < cols and 0 <= grid_y < rows:
+                return estimates[grid_y * cols + grid_x]
+            return abs(grid_x - goal_x) + abs(grid_y - goal_y)
+        return heuristic
+
+    def compute_heuristic(self, goal):
+        """
+        max(|d(L, cell) - d(L, goal)| over the landmarks, Manhattan distance)
+        for every grid cell at once
+
+        Returns:
+            list: Estimate per grid index
+        """
+        goal_x, goal_y = goal
+        estimates = np.abs(self.grid_x - goal_x) + np.abs(self.grid_y - goal_y)
+        if len(self.distances):
+            goal_distances = self.distances[:, goal_y * self.cols + goal_x][:, None]
+            valid = (self.distances >= 0) & (goal_distances >= 0)
+            landmark_estimates = np.where(valid, np.abs(self.distances - goal_distances), 0).max(axis=0)
+            estimates = np.maximum(estimates, landmark_estimates)
+        return estimates.tolist()
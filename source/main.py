@@ -1,24 +1,29 @@
 import pygame
 import config
-from pacman import Pacman
-from maze import Maze
-from ghost import Ghost
+from world import World
+from engine import GameEngine
+from searchStats import draw_search_overlay
+from assetManager import ASSETS
 from datetime import datetime
 
+# Top left corner of the score text
+SCORE_POSITION = (10, 610)
+
 def handle_game_end(screen, score, is_win=False):
-    # Load appropriate image based on game outcome
+    # Load appropriate image based on game outcome, decoded once per process
     if is_win:
-        end_image = pygame.image.load(config.ASSETS['YOU_WIN']).convert_alpha()
+        image_path = config.ASSETS['YOU_WIN']
     else:
-        end_image = pygame.image.load(config.ASSETS['GAME_OVER']).convert_alpha()
+        image_path = config.ASSETS['GAME_OVER']
+    end_image = ASSETS.load(image_path)
     
     # Screen dimensions
     screen_width = screen.get_width()
     aspect_ratio = end_image.get_width() / end_image.get_height()
     scaled_height = int(screen_width / aspect_ratio)
     
-    # Scale image
-    end_image = pygame.transform.scale(end_image, (screen_width, scaled_height))
+    # Scale image (the scaled variant is cached too)
+    end_image = ASSETS.get_image(image_path, (screen_width, scaled_height))
     
     # Display end image
     screen.blit(end_image, (0, (screen.get_height() - end_image.get_height()) // 2))
@@ -39,33 +44,62 @@ def handle_game_end(screen, score, is_win=False):
     
     return False
 
-def initialize_game_objects(width, height, maze_layout, cell_size):
-    # Initialize maze
-    maze = Maze(cell_size, maze_layout)
+def draw_full_frame(screen, world, score_text, stats_font=None):
+    """
+    Redraw the whole screen and flip it: walls and dots, sprites, ghost
+    debug info, the search statistics overlay and the score.
+    """
+    screen.fill(config.COLORS['BLACK'])
 
-    # Get initial entity positions
-    initial_positions = maze.get_initial_entity_positions()
+    # Draw the maze, Pacman, and Ghosts
+    world.maze.draw(screen)
+    world.all_sprites.draw(screen)
+    
+    # Draw debug info for ghosts if enabled
+    for ghost in world.ghosts:
+        if hasattr(ghost, 'debug_mode') and ghost.debug_mode:
+            ghost.draw_debug(screen)
 
-    # Initialize Pacman
-    pacman_pos = initial_positions.get('M', (width // 2, (height - 50) // 2))
-    pacman = Pacman(pacman_pos, cell_size, maze)
+    # Search statistics overlay if instrumentation is enabled
+    if stats_font is not None:
+        draw_search_overlay(screen, world.ghosts, stats_font)
 
-    # Initialize Sprites
-    all_sprites = pygame.sprite.Group()
-    all_sprites.add(pacman)
+    # Score display
+    screen.blit(score_text, SCORE_POSITION)
 
-    # Initialize Ghosts using initial positions and configuration
-    ghost_types = ['P', 'R', 'O', 'B']
-    for ghost_type in ghost_types:
-        if ghost_type in initial_positions:
-            ghost_class = config.GHOST_TYPES.get(ghost_type.lower().replace('p', 'pink').replace('r', 'red').replace('o', 'orange').replace('b', 'blue'))
-            
-            if ghost_class:
-                ghost = ghost_class(initial_positions[ghost_type], cell_size, maze, pacman)
-                ghost.debug_mode = config.GHOST_CONFIG['DEBUG']
-                all_sprites.add(ghost)
+    # Update the screen display
+    pygame.display.flip()
 
-    return maze, pacman, all_sprites
+def draw_dirty_frame(screen, world, score_text, score_rect):
+    """
+    Redraw only what changed since the previous frame on top of the maze's
+    cached background, and push just those rects to the display.
+    
+    Args:
+        screen (pygame.Surface): Display surface, showing the previous frame
+        world (World): Game whose maze has a rendered background
+        score_text (pygame.Surface): Rendered score
+        score_rect (pygame.Rect): Where the previous frame's score was drawn
+    
+    Returns:
+        pygame.Rect: Where this frame's score was drawn
+    """
+    maze, all_sprites = world.maze, world.all_sprites
+    background = maze.background
+
+    # Erase the sprites and the score of the previous frame, and eaten dots
+    all_sprites.clear(screen, background)
+    screen.blit(background, score_rect, score_rect)
+    dirty_rects = maze.draw_dirty(screen)
+    dirty_rects.append(score_rect)
+
+    # RenderUpdates returns the old and new rect of every sprite
+    dirty_rects.extend(all_sprites.draw(screen))
+    score_rect = screen.blit(score_text, SCORE_POSITION)
+    dirty_rects.append(score_rect)
+
+    pygame.display.update(dirty_rects)
+    return score_rect
 
 def main():
     pygame.init()
@@ -77,28 +111,42 @@ def main():
     # Define maze dimensions and cell size
     CELL_SIZE = config.calculate_cell_size(WIDTH, HEIGHT, MAZE)
 
-    # Use colors from config
-    BLACK = config.COLORS['BLACK']
-
     # Initialize game
     screen = pygame.display.set_mode((WIDTH, HEIGHT))
     pygame.display.set_caption("Pac-Man")
+    score_font = pygame.font.SysFont(None, config.SCORE_FONT['SIZE'])
+
+    # Debug drawing and the statistics overlay are not tracked as dirty rects
+    dirty_rendering = (config.DIRTY_RECT_RENDERING and not config.GHOST_CONFIG['DEBUG']
+                       and not config.GHOST_CONFIG['INSTRUMENT'])
+
+    # The world is built once and reset in place for every new game
+    world = World(MAZE, CELL_SIZE, width=WIDTH, height=HEIGHT)
 
     # Game loop
     running = True
     while running:
         # Initialize game objects
-        maze, pacman, all_sprites = initialize_game_objects(WIDTH, HEIGHT, MAZE, CELL_SIZE)
+        engine = world.reset()
+        pacman = world.pacman
         
-        # Reset score
-        score = 0
         clock = pygame.time.Clock()
+        stats_font = pygame.font.SysFont(None, 18) if config.GHOST_CONFIG['INSTRUMENT'] else None
+
+        if dirty_rendering:
+            # Walls and dots are drawn once, later frames only patch changes.
+            # The background is kept across restarts, reset patches its dots.
+            if world.maze.background is None:
+                world.maze.render_background(screen.get_size())
+            screen.blit(world.maze.background, (0, 0))
+            pygame.display.flip()
+        score_rect = pygame.Rect(SCORE_POSITION, (0, 0))
+        score_text = None
+        shown_score = None
 
         # Inner game loop
         game_active = True
         while game_active:
-            screen.fill(BLACK)
-
             # Handle user input events
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
@@ -107,52 +155,32 @@ def main():
                     break
                 pacman.handle_event(event)
 
-            # Update
-            pacman.update()
-            Ghost.update_all()
-            
-            # Check for dot collisions and update score
-            score += maze.check_dot_collision(pacman.rect)
-
-            # Check if all dots are eaten (win condition)
-            if maze.are_all_dots_eaten():
-                # print("Congratulations! You ate all the dots!")
-                game_active = handle_game_end(screen, score, is_win=True)
-                break
-
-            # Check for collisions with ghosts
-            for ghost in Ghost.all_ghosts:
-                if ghost.check_collision_with_pacman():
-                    # Game over if any ghost catches Pacman
-                    # print(f"Game Over! {ghost.__class__.__name__} caught you!")
-                    game_active = handle_game_end(screen, score, is_win=False)
-                    break
+            # Update Pacman and the ghosts, eat dots, check win/lose
+            state = engine.step()
+            score = engine.score
 
-            if not game_active:
-                running = False
+            if state != GameEngine.RUNNING:
+                # Win if all dots are eaten, game over if any ghost catches Pacman.
+                # Any key on the end screen restarts, ESC quits.
+                if not handle_game_end(screen, score, is_win=(state == GameEngine.WON)):
+                    running = False
                 break
 
-            # Draw the maze, Pacman, and Ghosts
-            maze.draw(screen)
-            all_sprites.draw(screen)
-            
-            # Draw debug info for ghosts if enabled
-            for ghost in Ghost.all_ghosts:
-                if hasattr(ghost, 'debug_mode') and ghost.debug_mode:
-                    ghost.draw_debug(screen)
-
-            # Score display
-            font = pygame.font.SysFont(None, config.SCORE_FONT['SIZE'])
-            score_text = font.render(f"Score: {score}", True, config.SCORE_FONT['COLOR'])
-            screen.blit(score_text, (10, 610))
-
-            # Update the screen display
-            pygame.display.flip()
+            # Score text is only rendered again when the score changes
+            if score != shown_score:
+                score_text = score_font.render(f"Score: {score}", True, config.SCORE_FONT['COLOR'])
+                shown_score = score
+
+            if dirty_rendering:
+                score_rect = draw_dirty_frame(screen, world, score_text, score_rect)
+            else:
+                draw_full_frame(screen, world, score_text, stats_font)
 
             # Control the frame rate
             clock.tick(config.FRAME_RATE)
 
     # Quit the game
+    world.close()
     pygame.quit()
 
 if __name__ == "__main__":
@@ -1,16 +1,27 @@
 import pygame
 import config
+from directions import DIRECTIONS
+from junctionGraph import JunctionGraph
+from mazeFile import MazeFile, WALL_TABLE, DOT_TABLE
 
 class Maze:
     def __init__(self, CELL_SIZE, maze, offset_x=0, offset_y=0):
+        """
+        Args:
+            CELL_SIZE (int): Cell size in pixels
+            maze (list): Maze layout as a list of strings, or a MazeFile
+            offset_x (int): Horizontal pixel offset of the maze
+            offset_y (int): Vertical pixel offset of the maze
+        """
         self.cell_size = CELL_SIZE
         self.layout = maze  # Use layout instead of maze for consistency
         self.offset_x = offset_x
         self.offset_y = offset_y
 
-        self.walls = []
-        self.dots = []
-        
+        # Wall rects for drawing, built on first use, see the walls property
+        self.wall_rects = None
+        self.wall_layer = None  # Walls rendered once, see get_wall_layer
+
         # Store initial entity positions
         self.initial_positions = {
             'M': None,  # Pacman
@@ -20,30 +31,232 @@ class Maze:
             'B': None   # Blue Ghost
         }
 
-        self.initialize_game_objects()
+        if isinstance(maze, MazeFile):
+            self.initialize_from_file(maze)
+        else:
+            # Static occupancy grid: one byte per cell, 1 where the cell is a wall
+            self.rows = len(self.layout)
+            self.cols = max((len(row) for row in self.layout), default=0)
+            self.wall_grid = bytearray(self.rows * self.cols)
+
+            # Dot store: one byte per cell, 1 while the cell still holds a dot
+            self.dot_grid = bytearray(self.rows * self.cols)
+
+            self.initialize_game_objects()
+
+            # Static adjacency: a 4-bit direction mask per cell, expanded lazily
+            # into neighbor tuples the first time a search visits the cell
+            self.neighbor_masks = self.build_neighbor_masks()
+
+        # Cells that started with a dot, the only ones restore_dots may refill
+        self.initial_dot_grid = bytes(self.dot_grid)
         self.dots_remaining = self.count_dots()
+        self.adjacent_cells = [None] * (self.rows * self.cols)
+
+        # Corridor-compressed graph, built by get_junction_graph on first use
+        self.junction_graph = None
+
+        # Wall grid with a wall border, built by get_padded_wall_grid on first use
+        self.padded_wall_grid = None
+
+        # Cached walls and dots for dirty-rect rendering, see render_background
+        self.background = None
+        self.dirty_rects = []  # Background areas changed since the last draw_dirty
 
     def initialize_game_objects(self):
         for y, row in enumerate(self.layout):
             for x, cell in enumerate(row):
-                cell_x = x * self.cell_size + self.offset_x
-                cell_y = y * self.cell_size + self.offset_y
-
                 if cell == '#':
                     # Walls
-                    self.walls.append(pygame.Rect(cell_x, cell_y, self.cell_size, self.cell_size))
+                    self.wall_grid[y * self.cols + x] = 1
                 elif cell == '.':
                     # Dots
-                    self.dots.append(pygame.Rect(
-                        cell_x + self.cell_size // 2 - 2,
-                        cell_y + self.cell_size // 2 - 2,
-                        4, 4
-                    ))
+                    self.dot_grid[y * self.cols + x] = 1
                 elif cell in ['M', 'P', 'R', 'O', 'B']:
                     # Store initial positions for special entities
-                    entity_pixel_x = cell_x + self.cell_size // 2
-                    entity_pixel_y = cell_y + self.cell_size // 2
-                    self.initial_positions[cell] = (entity_pixel_x, entity_pixel_y)
+                    self.initial_positions[cell] = self.get_cell_center(x, y)
+
+    def initialize_from_file(self, maze_file):
+        """
+        Take the grids from a memory-mapped binary maze instead of parsing text.
+        The neighbor masks are used straight from the file when it stores them.
+
+        Args:
+            maze_file (MazeFile): Loaded binary maze
+        """
+        self.rows = maze_file.rows
+        self.cols = maze_file.cols
+        cells = bytes(maze_file.cells)
+        self.wall_grid = bytearray(cells.translate(WALL_TABLE))
+        self.dot_grid = bytearray(cells.translate(DOT_TABLE))
+        for symbol, (x, y) in maze_file.spawns.items():
+            if symbol in self.initial_positions:
+                self.initial_positions[symbol] = self.get_cell_center(x, y)
+        if maze_file.neighbor_masks is not None:
+            self.neighbor_masks = maze_file.neighbor_masks
+        else:
+            self.neighbor_masks = self.build_neighbor_masks()
+
+    def get_cell_center(self, grid_x, grid_y):
+        """Pixel position of the center of a grid cell"""
+        return (grid_x * self.cell_size + self.offset_x + self.cell_size // 2,
+                grid_y * self.cell_size + self.offset_y + self.cell_size // 2)
+
+    @property
+    def walls(self):
+        """
+        Rects covering the wall cells, built the first time they are needed
+        (usually the first draw). With config.MERGE_WALL_RECTS they are
+        merged into maximal rectangles, otherwise there is one per wall cell.
+        """
+        if self.wall_rects is None:
+            if config.MERGE_WALL_RECTS:
+                self.wall_rects = [self.get_cells_rect(x, y, width, height)
+                                   for x, y, width, height in self.merge_walls()]
+            else:
+                self.wall_rects = [self.get_cells_rect(index % self.cols, index // self.cols, 1, 1)
+                                   for index in self.iter_set_indices(self.wall_grid)]
+        return self.wall_rects
+
+    def merge_walls(self):
+        """
+        Cover the wall cells with rectangles by greedy meshing: take the first
+        uncovered wall cell in row order, extend it along the row as far as
+        the walls go, then downwards while the rows below have walls under
+        the whole run. Every wall cell ends up in exactly one rectangle.
+
+        Returns:
+            list: (grid_x, grid_y, width, height) rectangles in cells
+        """
+        cols, rows = self.cols, self.rows
+        pending = bytearray(self.wall_grid)  # Wall cells not covered yet
+        cells = []
+        start = pending.find(1)
+        while start != -1:
+            grid_y, grid_x = divmod(start, cols)
+            row_end = (grid_y + 1) * cols
+            end = pending.find(0, start, row_end)
+            if end == -1:
+                end = row_end
+            width = end - start
+
+            height = 1
+            while grid_y + height < rows:
+                below = start + height * cols
+                if pending.find(0, below, below + width) != -1:
+                    break
+                height += 1
+
+            for row in range(height):
+                first = start + row * cols
+                pending[first:first + width] = bytes(width)
+            cells.append((grid_x, grid_y, width, height))
+            start = pending.find(1, end)
+        return cells
+
+    def get_cells_rect(self, grid_x, grid_y, width, height):
+        """Pixel rect covering width x height cells from a grid cell"""
+        return pygame.Rect(grid_x * self.cell_size + self.offset_x, grid_y * self.cell_size + self.offset_y,
+                           width * self.cell_size, height * self.cell_size)
+
+    def get_wall_layer(self):
+        """
+        Surface with the walls drawn once, black elsewhere and transparent
+        through its color key, built on first use
+
+        Returns:
+            pygame.Surface: Wall layer covering the whole maze from the origin
+        """
+        if self.wall_layer is None:
+            size = (self.cols * self.cell_size + self.offset_x, self.rows * self.cell_size + self.offset_y)
+            self.wall_layer = pygame.Surface(size).convert()
+            self.wall_layer.fill(config.COLORS['BLACK'])
+            for wall in self.walls:
+                pygame.draw.rect(self.wall_layer, config.COLORS['WALL'], wall)
+            self.wall_layer.set_colorkey(config.COLORS['BLACK'])
+        return self.wall_layer
+
+    def get_dot_rect(self, index):
+        """Rect of the dot drawn in the cell at a grid index"""
+        cell_x = (index % self.cols) * self.cell_size + self.offset_x
+        cell_y = (index // self.cols) * self.cell_size + self.offset_y
+        return pygame.Rect(cell_x + self.cell_size // 2 - 2, cell_y + self.cell_size // 2 - 2, 4, 4)
+
+    @staticmethod
+    def iter_set_indices(grid):
+        """Yield the indices of the non-zero bytes of a grid"""
+        index = grid.find(1)
+        while index != -1:
+            yield index
+            index = grid.find(1, index + 1)
+
+    def build_neighbor_masks(self):
+        """
+        Build the direction mask of every cell (walls included, so a ghost
+        pushed into a wall can still find its way out).
+
+        Returns:
+            bytearray: One mask per cell, indexed by grid_y * cols + grid_x
+        """
+        masks = bytearray(self.rows * self.cols)
+        for grid_y in range(self.rows):
+            for grid_x in range(self.cols):
+                mask = 0
+                for bit, (dx, dy) in enumerate(DIRECTIONS):
+                    new_x, new_y = grid_x + dx, grid_y + dy
+                    if (0 <= new_x < self.cols and 0 <= new_y < self.rows
+                            and not self.wall_grid[new_y * self.cols + new_x]):
+                        mask |= 1 << bit
+                masks[grid_y * self.cols + grid_x] = mask
+        return masks
+
+    def get_adjacent_cells(self, grid_x, grid_y):
+        """
+        Get the open cells next to a grid cell, in DIRECTIONS order.
+        Cells outside the layout have no neighbors.
+        """
+        if not self.is_inside(grid_x, grid_y):
+            return ()
+        grid_x, grid_y = int(grid_x), int(grid_y)
+        index = grid_y * self.cols + grid_x
+        cells = self.adjacent_cells[index]
+        if cells is None:
+            mask = self.neighbor_masks[index]
+            cells = tuple(
+                (grid_x + dx, grid_y + dy)
+                for bit, (dx, dy) in enumerate(DIRECTIONS)
+                if mask & (1 << bit)
+            )
+            self.adjacent_cells[index] = cells
+        return cells
+
+    def get_junction_graph(self):
+        """
+        Get the maze's junction graph, building it on first use
+
+        Returns:
+            JunctionGraph: Graph of junctions, dead ends and the corridors between them
+        """
+        if self.junction_graph is None:
+            self.junction_graph = JunctionGraph(self)
+        return self.junction_graph
+
+    def get_padded_wall_grid(self):
+        """
+        Get the wall grid surrounded by a one cell wall border, building it
+        on first use. A row of the padded grid is cols + 2 cells wide.
+
+        Returns:
+            bytes: One byte per padded cell, 1 where the cell is a wall
+        """
+        if self.padded_wall_grid is None:
+            width = self.cols + 2
+            padded = bytearray(b'\x01') * (width * (self.rows + 2))
+            for grid_y in range(self.rows):
+                row_start = (grid_y + 1) * width + 1
+                padded[row_start:row_start + self.cols] = self.wall_grid[grid_y * self.cols:(grid_y + 1) * self.cols]
+            self.padded_wall_grid = bytes(padded)
+        return self.padded_wall_grid
 
     def get_initial_entity_positions(self):
         """
@@ -53,29 +266,163 @@ class Maze:
         return {k: v for k, v in self.initial_positions.items() if v is not None}
 
     def count_dots(self):
-        return sum(row.count('.') for row in self.layout)
+        return self.dot_grid.count(1)
+
+    def is_inside(self, grid_x, grid_y):
+        """Check whether a grid cell lies within the layout"""
+        return 0 <= grid_x < self.cols and 0 <= grid_y < self.rows
+
+    def is_wall(self, grid_x, grid_y):
+        """
+        Check whether a grid cell is a wall.
+        Cells outside the layout are treated as open, like the old rect scan did.
+        """
+        if self.is_inside(grid_x, grid_y):
+            return self.wall_grid[int(grid_y) * self.cols + int(grid_x)] == 1
+        return False
+
+    def get_cell_range(self, rect):
+        """
+        Range of grid cells covered by a rect, clipped to the layout
+        
+        Returns:
+            tuple: (first_x, last_x, first_y, last_y), or None for an empty rect
+        """
+        if rect.width < 0 or rect.height < 0:
+            rect = rect.copy()
+            rect.normalize()
+        if rect.width == 0 or rect.height == 0:
+            return None
+
+        first_x = max((rect.left - self.offset_x) // self.cell_size, 0)
+        last_x = min((rect.right - 1 - self.offset_x) // self.cell_size, self.cols - 1)
+        first_y = max((rect.top - self.offset_y) // self.cell_size, 0)
+        last_y = min((rect.bottom - 1 - self.offset_y) // self.cell_size, self.rows - 1)
+        return first_x, last_x, first_y, last_y
 
     def check_collision(self, rect):
-        for wall in self.walls:
-            if rect.colliderect(wall):
-                return True
+        """
+        Check whether a rect overlaps any wall.
+        Only the grid cells covered by the rect are looked up, so the cost
+        depends on the rect size instead of the number of walls.
+        """
+        cell_range = self.get_cell_range(rect)
+        if cell_range is None:
+            return False
+        first_x, last_x, first_y, last_y = cell_range
+
+        wall_grid = self.wall_grid
+        for grid_y in range(first_y, last_y + 1):
+            row_start = grid_y * self.cols
+            for grid_x in range(first_x, last_x + 1):
+                if wall_grid[row_start + grid_x]:
+                    return True
         return False
 
+    def has_dot(self, grid_x, grid_y):
+        """Check whether a grid cell still holds a dot"""
+        return self.is_inside(grid_x, grid_y) and self.dot_grid[int(grid_y) * self.cols + int(grid_x)] == 1
+
+    def iter_dot_cells(self):
+        """Yield the grid cells that still hold a dot, row by row"""
+        dot_grid = self.dot_grid
+        index = dot_grid.find(1)
+        while index != -1:
+            yield index % self.cols, index // self.cols
+            index = dot_grid.find(1, index + 1)
+
     def check_dot_collision(self, rect):
+        """
+        Eat the dots that overlap a rect.
+        Each dot lies inside its cell, so only the cells covered by the rect
+        are looked up.
+        
+        Returns:
+            int: Number of dots eaten
+        """
+        cell_range = self.get_cell_range(rect)
+        if cell_range is None:
+            return 0
+        first_x, last_x, first_y, last_y = cell_range
+
         dots_eaten = 0
-        for dot in self.dots[:]:  # Make a copy while iterating
-            if rect.colliderect(dot):
-                self.dots.remove(dot)
-                dots_eaten += 1
-                self.dots_remaining -= 1
+        dot_grid = self.dot_grid
+        for grid_y in range(first_y, last_y + 1):
+            row_start = grid_y * self.cols
+            for grid_x in range(first_x, last_x + 1):
+                if not dot_grid[row_start + grid_x]:
+                    continue
+                dot = self.get_dot_rect(row_start + grid_x)
+                if rect.colliderect(dot):
+                    dot_grid[row_start + grid_x] = 0
+                    dots_eaten += 1
+                    self.dots_remaining -= 1
+                    if self.background is not None:
+                        # Erase the dot from the cached background
+                        self.background.fill(config.COLORS['BLACK'], dot)
+                        self.dirty_rects.append(dot)
         return dots_eaten
 
+    def restore_dots(self, dot_grid):
+        """
+        Replace the remaining dots, patching the cached background if there is one
+        
+        Args:
+            dot_grid (bytes): Dot store captured from dot_grid
+        """
+        if self.background is not None and self.dot_grid != dot_grid:
+            for index in self.iter_set_indices(self.initial_dot_grid):
+                if self.dot_grid[index] != dot_grid[index]:
+                    dot = self.get_dot_rect(index)
+                    color = config.COLORS['DOT'] if dot_grid[index] else config.COLORS['BLACK']
+                    self.background.fill(color, dot)
+                    self.dirty_rects.append(dot)
+        self.dot_grid[:] = dot_grid
+        self.dots_remaining = self.dot_grid.count(1)
+
+    def get_dot_cells(self):
+        """Grid cells that still hold a dot"""
+        return set(self.iter_dot_cells())
+
     def are_all_dots_eaten(self):
         return self.dots_remaining <= 0
 
+    def render_background(self, size):
+        """
+        Pre-render the walls and the remaining dots once to a background surface.
+        Dots eaten afterwards are erased from it by check_dot_collision.
+        
+        Args:
+            size (tuple): Size of the surface, usually the screen size
+        
+        Returns:
+            pygame.Surface: The cached background
+        """
+        self.background = pygame.Surface(size).convert()
+        self.background.fill(config.COLORS['BLACK'])
+        self.draw(self.background)
+        self.dirty_rects = []
+        return self.background
+
+    def draw_dirty(self, screen):
+        """
+        Copy the background areas that changed since the last call (eaten dots) to screen
+        
+        Returns:
+            list: The rects that were redrawn
+        """
+        rects = self.dirty_rects
+        for rect in rects:
+            screen.blit(self.background, rect, rect)
+        self.dirty_rects = []
+        return rects
+
     def draw(self, screen):
-        for wall in self.walls:
-            pygame.draw.rect(screen, config.COLORS['WALL'], wall)
+        if config.PRERENDER_WALLS:
+            screen.blit(self.get_wall_layer(), (0, 0))
+        else:
+            for wall in self.walls:
+                pygame.draw.rect(screen, config.COLORS['WALL'], wall)
 
-        for dot in self.dots:
-            pygame.draw.rect(screen, config.COLORS['DOT'], dot)
\ No newline at end of file
+        for index in self.iter_set_indices(self.dot_grid):
+            pygame.draw.rect(screen, config.COLORS['DOT'], self.get_dot_rect(index))
\ No newline at end of file
@@ -0,0 +1,251 @@
+"""
+Compiled binary maze files, memory-mapped when loaded.
+
+Convert a text maze and check the result from the repository root:
+    python source/mazeFile.py compile input/maze.txt input/maze.maze
+    python source/mazeFile.py validate input/maze.maze --text input/maze.txt
+
+Layout of a file, little-endian:
+    header      magic, version, flags, cols, rows, spawn count, reserved
+    spawns      (symbol, x, y) per entity, see SPAWN_FORMAT
+    cells       one cell type byte per cell, row by row
+    adjacency   one neighbor mask byte per cell, as Maze.build_neighbor_masks
+                makes them, when FLAG_ADJACENCY is set
+"""
+import argparse
+import mmap
+import struct
+import numpy as np
+from directions import DIRECTIONS
+
+MAGIC = b'PMAZ'
+VERSION = 1
+
+HEADER_FORMAT = '<4sHHIIII'
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+SPAWN_FORMAT = '<c3xII'
+SPAWN_SIZE = struct.calcsize(SPAWN_FORMAT)
+
+# Header flags
+FLAG_ADJACENCY = 1
+
+# Cell types. Entity cells are empty cells with an entry in the spawn table,
+# and so are characters Maze ignores and the missing end of short rows.
+EMPTY = 0
+WALL = 1
+DOT = 2
+
+ENTITY_SYMBOLS = 'MPROB'
+
+# Text characters per cell type, for turning rows back into layout strings
+CELL_CHARACTERS = {EMPTY: ' ', WALL: '#', DOT: '.'}
+
+# bytes.translate tables picking one cell type out of the cell grid
+WALL_TABLE = bytes(1 if code == WALL else 0 for code in range(256))
+DOT_TABLE = bytes(1 if code == DOT else 0 for code in range(256))
+TEXT_TABLE = bytes(ord(CELL_CHARACTERS.get(code, '?')) for code in range(256))
+
+def compile_layout(layout):
+    """
+    Turn a text layout into cell types and spawns
+
+    Args:
+        layout (list): Maze layout as a list of strings
+
+    Returns:
+        tuple: (cols, rows, cell type bytearray, {symbol: (grid_x, grid_y)})
+    """
+    rows = len(layout)
+    cols = max((len(row) for row in layout), default=0)
+    cells = bytearray(rows * cols)
+    spawns = {}
+    for y, row in enumerate(layout):
+        for x, cell in enumerate(row):
+            if cell == '#':
+                cells[y * cols + x] = WALL
+            elif cell == '.':
+                cells[y * cols + x] = DOT
+            elif cell in ENTITY_SYMBOLS:
+                # Like Maze, the last occurrence of a symbol wins
+                spawns[cell] = (x, y)
+    return cols, rows, cells, spawns
+
+def compute_neighbor_masks(cells, cols, rows):
+    """
+    Neighbor masks of every cell, bit i set when DIRECTIONS[i] leads to an
+    open cell inside the grid
+
+    Returns:
+        bytes: One mask per cell
+    """
+    walls = np.frombuffer(bytes(cells), dtype=np.uint8).reshape(rows, cols) == WALL
+    padded = np.ones((rows + 2, cols + 2), dtype=bool)
+    padded[1:-1, 1:-1] = walls
+    masks = np.zeros((rows, cols), dtype=np.uint8)
+    for bit, (dx, dy) in enumerate(DIRECTIONS):
+        neighbor_walls = padded[1 + dy:rows + 1 + dy, 1 + dx:cols + 1 + dx]
+        masks |= np.where(neighbor_walls, 0, 1 << bit).astype(np.uint8)
+    return masks.tobytes()
+
+def write_maze_file(layout, path, adjacency=True):
+    """
+    Convert a text layout to a binary maze file
+
+    Args:
+        layout (list): Maze layout as a list of strings
+        path (str): File to write
+        adjacency (bool): Also store the precomputed neighbor masks
+    """
+    cols, rows, cells, spawns = compile_layout(layout)
+    flags = FLAG_ADJACENCY if adjacency else 0
+    with open(path, 'wb') as file:
+        file.write(struct.pack(HEADER_FORMAT, MAGIC, VERSION, flags, cols, rows, len(spawns), 0))
+        for symbol, (x, y) in spawns.items():
+            file.write(struct.pack(SPAWN_FORMAT, symbol.encode('ascii'), x, y))
+        file.write(cells)
+        if adjacency:
+            file.write(compute_neighbor_masks(cells, cols, rows))
+
+def is_maze_file(path):
+    """Whether a file starts with the binary maze magic"""
+    with open(path, 'rb') as file:
+        return file.read(len(MAGIC)) == MAGIC
+
+class MazeFile:
+    """
+    Binary maze file mapped into memory.
+
+    The cell grid and the neighbor masks are memoryviews into the mapping,
+    so loading does not read or parse the maze; the OS pages it in as the
+    game touches it. Maze builds its wall and dot grids from the cell grid
+    with a single translate each and uses the stored neighbor masks as they
+    are.
+
+    A MazeFile also reads like a text layout (len() and indexing give rows
+    as strings), so it can be passed wherever a layout is expected.
+    """
+    def __init__(self, path):
+        """
+        Args:
+            path (str): Binary maze file written by write_maze_file
+        """
+        self.path = path
+        with open(path, 'rb') as file:
+            self.buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self.buffer)
+
+        if len(view) < HEADER_SIZE:
+            raise ValueError(f"{path}: file too short for a maze header")
+        magic, version, self.flags, self.cols, self.rows, spawn_count, _ = struct.unpack_from(HEADER_FORMAT, view)
+        if magic != MAGIC:
+            raise ValueError(f"{path}: not a binary maze file")
+        if version != VERSION:
+            raise ValueError(f"{path}: unsupported maze file version {version}")
+
+        size = self.cols * self.rows
+        cells_offset = HEADER_SIZE + spawn_count * SPAWN_SIZE
+        masks_offset = cells_offset + size
+        end = masks_offset + (size if self.flags & FLAG_ADJACENCY else 0)
+        if len(view) != end:
+            raise ValueError(f"{path}: expected {end} bytes, found {len(view)}")
+
+        self.spawns = {}  # {symbol: (grid_x, grid_y)}
+        for index in range(spawn_count):
+            symbol, x, y = struct.unpack_from(SPAWN_FORMAT, view, HEADER_SIZE + index * SPAWN_SIZE)
+            self.spawns[symbol.decode('ascii')] = (x, y)
+
+        self.cells = view[cells_offset:masks_offset]
+        self.neighbor_masks = view[masks_offset:end] if self.flags & FLAG_ADJACENCY else None
+
+    def __len__(self):
+        return self.rows
+
+    def __getitem__(self, row):
+        """Row of the maze as a text layout string"""
+        if not 0 <= row < self.rows:
+            raise IndexError(row)
+        characters = bytearray(bytes(self.cells[row * self.cols:(row + 1) * self.cols]).translate(TEXT_TABLE))
+        for symbol, (x, y) in self.spawns.items():
+            if y == row:
+                characters[x] = ord(symbol)
+        return characters.decode('ascii')
+
+def validate_maze_file(path, layout=None):
+    """
+    Check a binary maze file for consistency
+
+    Args:
+        path (str): Binary maze file
+        layout (list): Text layout the file should match, None to skip
+
+    Returns:
+        list: Problems found, empty if the file is valid
+    """
+    try:
+        maze_file = MazeFile(path)
+    except ValueError as error:
+        return [str(error)]
+
+    problems = []
+    cols, rows = maze_file.cols, maze_file.rows
+    cells = bytes(maze_file.cells)
+    codes = np.frombuffer(cells, dtype=np.uint8)
+    invalid = np.flatnonzero(codes > DOT)
+    if len(invalid):
+        index = int(invalid[0])
+        problems.append(f"{len(invalid)} unknown cell types, first {codes[index]} at {(index % cols, index // cols)}")
+
+    for symbol, (x, y) in maze_file.spawns.items():
+        if symbol not in ENTITY_SYMBOLS:
+            problems.append(f"unknown spawn symbol {symbol!r}")
+        if not (0 <= x < cols and 0 <= y < rows):
+            problems.append(f"spawn {symbol} at {(x, y)} is outside the {cols}x{rows} maze")
+        elif cells[y * cols + x] != EMPTY:
+            problems.append(f"spawn {symbol} at {(x, y)} is not on an empty cell")
+
+    if maze_file.neighbor_masks is not None:
+        expected = compute_neighbor_masks(cells, cols, rows)
+        if bytes(maze_file.neighbor_masks) != expected:
+            problems.append("stored neighbor masks do not match the cell grid")
+
+    if layout is not None:
+        layout_cols, layout_rows, layout_cells, layout_spawns = compile_layout(layout)
+        if (layout_cols, layout_rows) != (cols, rows):
+            problems.append(f"size {cols}x{rows} differs from the text maze's {layout_cols}x{layout_rows}")
+        elif layout_cells != cells:
+            problems.append("cells differ from the text maze")
+        if layout_spawns != maze_file.spawns:
+            problems.append("spawns differ from the text maze")
+
+    return problems
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert and check binary maze files")
+    commands = parser.add_subparsers(dest='command', required=True)
+    compile_parser = commands.add_parser('compile', help="convert a text maze to a binary maze file")
+    compile_parser.add_argument('text', help="text maze to read")
+    compile_parser.add_argument('output', help="binary maze file to write")
+    compile_parser.add_argument('--no-adjacency', action='store_true', help="leave out the neighbor masks")
+    validate_parser = commands.add_parser('validate', help="check a binary maze file")
+    validate_parser.add_argument('file', help="binary maze file to check")
+    validate_parser.add_argument('--text', default=None, help="text maze the file should match")
+    args = parser.parse_args()
+
+    # Read text mazes the same way as the game
+    import config
+
+    if args.command == 'compile':
+        write_maze_file(config.load_maze_layout(args.text), args.output, adjacency=not args.no_adjacency)
+        print(f"wrote {args.output}")
+        return
+
+    layout = config.load_maze_layout(args.text) if args.text else None
+    problems = validate_maze_file(args.file, layout)
+    for problem in problems:
+        print(f"{args.file}: {problem}")
+    if problems:
+        raise SystemExit(1)
+    print(f"{args.file}: ok")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Seeded random maze generator.
+
+Write a maze file from the repository root, for example:
+    python source/mazeGenerator.py --size 161x121 --seed 3 --loop-density 0.2 --output input/maze-161x121.txt
+"""
+import argparse
+import random
+
+# Pacman's symbol and the ghost symbols, in the order ghosts are placed
+PACMAN_SYMBOL = 'M'
+GHOST_SYMBOLS = ['P', 'R', 'O', 'B']
+
+# Entities placed on every generated maze by default: Pacman and the four ghosts
+ENTITY_SYMBOLS = [PACMAN_SYMBOL] + GHOST_SYMBOLS
+
+def generate_maze(cols, rows, seed=None, loop_density=0.1, ghosts=len(GHOST_SYMBOLS)):
+    """
+    Generate a random maze layout in the same format as input/maze.txt
+
+    The maze is carved with an iterative depth-first backtracker, then a share
+    of the inner walls is knocked down so the maze has loops like the
+    hand-made one instead of being a perfect tree.
+
+    Args:
+        cols (int): Number of columns (rounded up to an odd number)
+        rows (int): Number of rows (rounded up to an odd number)
+        seed (int): Seed for the random generator, the same seed gives the same maze
+        loop_density (float): Probability of removing each inner wall between two passages
+        ghosts (int): Number of ghost spawns, taken from GHOST_SYMBOLS in order
+
+    Returns:
+        list: Maze layout as a list of strings
+    """
+    if not 0 <= ghosts <= len(GHOST_SYMBOLS):
+        raise ValueError(f"ghosts must be between 0 and {len(GHOST_SYMBOLS)}, got {ghosts}")
+    rng = random.Random(seed)
+    cols = max(cols | 1, 5)
+    rows = max(rows | 1, 5)
+    grid = [['#'] * cols for _ in range(rows)]
+
+    # Carve passages between odd cells
+    start = (1, 1)
+    grid[1][1] = '.'
+    stack = [start]
+    while stack:
+        x, y = stack[-1]
+        candidates = [
+            (x + dx, y + dy, dx, dy)
+            for dx, dy in ((0, -2), (2, 0), (0, 2), (-2, 0))
+            if 0 < x + dx < cols - 1 and 0 < y + dy < rows - 1 and grid[y + dy][x + dx] == '#'
+        ]
+        if not candidates:
+            stack.pop()
+            continue
+        next_x, next_y, dx, dy = rng.choice(candidates)
+        grid[y + dy // 2][x + dx // 2] = '.'
+        grid[next_y][next_x] = '.'
+        stack.append((next_x, next_y))
+
+    # Knock down walls that separate two passages to create loops
+    for y in range(1, rows - 1):
+        for x in range(1, cols - 1):
+            if grid[y][x] != '#' or (x % 2 == 1 and y % 2 == 1):
+                continue
+            horizontal = grid[y][x - 1] == '.' and grid[y][x + 1] == '.'
+            vertical = grid[y - 1][x] == '.' and grid[y + 1][x] == '.'
+            if (horizontal or vertical) and rng.random() < loop_density:
+                grid[y][x] = '.'
+
+    # Place Pacman and the ghosts on distinct passage cells
+    symbols = ENTITY_SYMBOLS[:ghosts + 1]
+    passages = [(x, y) for y in range(rows) for x in range(cols) if grid[y][x] == '.']
+    for symbol, (x, y) in zip(symbols, rng.sample(passages, len(symbols))):
+        grid[y][x] = symbol
+
+    return [''.join(row) for row in grid]
+
+def write_maze(layout, path):
+    """
+    Save a maze layout in the format read by config.load_maze_layout
+
+    Args:
+        layout (list): Maze layout as a list of strings
+        path (str): File to write
+    """
+    with open(path, 'w') as file:
+        file.write('\n'.join(layout) + '\n')
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a random Pac-Man maze")
+    parser.add_argument('--size', default='31x25', help="maze size as COLSxROWS, rounded up to odd numbers")
+    parser.add_argument('--seed', type=int, default=None, help="seed for the generator, random if omitted")
+    parser.add_argument('--loop-density', type=float, default=0.1, help="probability of removing each inner wall")
+    parser.add_argument('--ghosts', type=int, default=len(GHOST_SYMBOLS), help="number of ghost spawns")
+    parser.add_argument('--output', default=None, help="file to write, prints the maze if omitted")
+    args = parser.parse_args()
+
+    cols, rows = (int(value) for value in args.size.lower().split('x'))
+    layout = generate_maze(cols, rows, seed=args.seed, loop_density=args.loop_density, ghosts=args.ghosts)
+    if args.output is None:
+        print('\n'.join(layout))
+    else:
+        write_maze(layout, args.output)
+        print(f"wrote {len(layout[0])}x{len(layout)} maze to {args.output}")
+
+if __name__ == "__main__":
+    main()
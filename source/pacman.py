@@ -2,6 +2,10 @@ import pygame
 import math
 import os
 import config
+from assetManager import ASSETS
+
+# Pixel step direction of each direction name
+DIRECTION_STEPS = {'up': (0, -1), 'down': (0, 1), 'left': (-1, 0), 'right': (1, 0)}
 
 class Pacman(pygame.sprite.Sprite):
     def __init__(self, position, cell_size, maze):
@@ -11,6 +15,7 @@ class Pacman(pygame.sprite.Sprite):
         self.cell_size = cell_size
         
         # Load base Pacman images
+        self.frame_paths = self.get_frame_paths()
         self.base_images = self.load_pacman_images(cell_size)
         
         # Scale speed relative to cell size
@@ -41,18 +46,32 @@ class Pacman(pygame.sprite.Sprite):
 
     def create_rotated_images(self):
         """
-        Create rotated images for each direction based on base images
+        Create rotated images for each direction based on base images.
+        Frames loaded from files come from the shared asset cache, which
+        rotates each of them once per process.
         """
         rotated_images = {}
         for direction, angle in self.rotation_angles.items():
-            direction_images = []
-            for base_image in self.base_images:
-                # Rotate the base image
-                rotated_image = pygame.transform.rotate(base_image, angle)
-                direction_images.append(rotated_image)
-            rotated_images[direction] = direction_images
+            if self.frame_paths:
+                size = (self.cell_size, self.cell_size)
+                rotated_images[direction] = [ASSETS.get_image(path, size, angle) for path in self.frame_paths]
+            else:
+                # Rotate the fallback images
+                rotated_images[direction] = [pygame.transform.rotate(image, angle) for image in self.base_images]
         return rotated_images
 
+    def load_images(self):
+        """Fetch the images again, e.g. after the asset atlas was packed"""
+        self.base_images = self.load_pacman_images(self.cell_size)
+        self.directional_images = self.create_rotated_images()
+        self.image = self.directional_images[self.direction][self.mouth_state]
+
+    @classmethod
+    def get_frame_paths(cls):
+        """Files of the three mouth frames, or None if any of them is missing"""
+        paths = [os.path.join('assets', 'pacman', name) for name in ['1.png', '2.png', '3.png']]
+        return paths if all(os.path.exists(path) for path in paths) else None
+
     @classmethod
     def load_pacman_images(cls, cell_size):
         """
@@ -65,31 +84,10 @@ class Pacman(pygame.sprite.Sprite):
             list: List of mouth state images
         """
         try:
-            # Try multiple possible base paths
-            base_paths = [
-                os.path.join('assets', 'pacman'),
-                'assets/pacman'
-            ]
-            
-            for base_path in base_paths:
-                mouth_states = ['1.png', '2.png', '3.png']
-                images = []
-                
-                for mouth_image in mouth_states:
-                    file_path = os.path.join(base_path, mouth_image)
-                    
-                    if os.path.exists(file_path):
-                        # Load image
-                        original_image = pygame.image.load(file_path).convert_alpha()
-                        
-                        # Scale image to cell size
-                        scaled_image = pygame.transform.scale(original_image, (cell_size, cell_size))
-                        
-                        images.append(scaled_image)
-                
-                # If we found all 3 images, return them
-                if len(images) == 3:
-                    return images
+            # Mouth frames from the shared asset cache, scaled to cell size
+            frame_paths = cls.get_frame_paths()
+            if frame_paths:
+                return [ASSETS.get_image(path, (cell_size, cell_size)) for path in frame_paths]
             
             # If no images found, create fallback images
             print("Creating fallback Pacman images")
@@ -128,6 +126,23 @@ class Pacman(pygame.sprite.Sprite):
             print(f"Error loading Pacman images: {e}")
             return None
 
+    def snapshot(self):
+        """
+        Capture Pacman's mutable state (position, directions, animation, frozen)
+        
+        Returns:
+            tuple: State accepted by restore
+        """
+        return (self.x, self.y, self.direction, self.next_direction,
+                self.animation_count, self.mouth_state, self.frozen)
+
+    def restore(self, state):
+        """Put Pacman back in a state captured by snapshot"""
+        (self.x, self.y, self.direction, self.next_direction,
+         self.animation_count, self.mouth_state, self.frozen) = state
+        self.rect.center = (self.x, self.y)
+        self.image = self.directional_images[self.direction][self.mouth_state]
+
     def change_direction(self, new_direction):
         # Store next direction, will change when possible
         self.next_direction = new_direction
@@ -157,6 +172,8 @@ class Pacman(pygame.sprite.Sprite):
             if not self.maze.check_collision(temp_rect):
                 self.direction = self.next_direction
                 self.next_direction = None
+            else:
+                self.corner()
         
         # Move in current direction if possible
         temp_x, temp_y = self.x, self.y
@@ -187,6 +204,45 @@ class Pacman(pygame.sprite.Sprite):
         # Update the sprite image with current direction and mouth state
         self.image = self.directional_images[self.direction][self.mouth_state]
 
+    def get_grid_position(self):
+        """Grid cell holding Pacman's center"""
+        return (int(self.x - self.maze.offset_x) // self.cell_size,
+                int(self.y - self.maze.offset_y) // self.cell_size)
+
+    def is_blocked(self, direction, position=None):
+        """
+        Check whether a wall stops a step in a direction
+
+        Args:
+            direction (str): 'up', 'down', 'left' or 'right'
+            position (tuple): Pixel position to step from, Pacman's by default
+
+        Returns:
+            bool: True if the step would overlap a wall
+        """
+        x, y = (self.x, self.y) if position is None else position
+        step_x, step_y = DIRECTION_STEPS[direction]
+        rect = pygame.Rect(0, 0, self.radius * 2, self.radius * 2)
+        rect.center = (x + step_x * self.speed, y + step_y * self.speed)
+        return self.maze.check_collision(rect)
+
+    def corner(self):
+        """
+        Take the queued turn from the center of the current cell when Pacman
+        is less than one step away from it.
+        Pacman only lands exactly on cell centers when the cell size is a
+        multiple of its speed; on other cell sizes it would pass most
+        junctions without ever being able to turn into them.
+        """
+        center_x, center_y = self.maze.get_cell_center(*self.get_grid_position())
+        if abs(self.x - center_x) >= self.speed or abs(self.y - center_y) >= self.speed:
+            return
+        if self.is_blocked(self.next_direction, (center_x, center_y)):
+            return
+        self.x, self.y = center_x, center_y
+        self.direction = self.next_direction
+        self.next_direction = None
+
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN:
             # press any key to unfreeze Pacman
@@ -0,0 +1,113 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+class PathPlanner:
+    """
+    Runs ghost searches on a pool of worker threads.
+
+    A request holds the ghost's start cell, the goal cell and the obstacles
+    (other ghosts, blocked cells) captured on the game thread when the
+    search was asked for. The workers run the ghost's own search_steps with
+    those obstacles, and deliver() hands the finished paths back to the
+    ghosts on the game thread. A result whose goal is no longer the
+    target's cell is discarded and requested again.
+
+    Each ghost has at most one search running: a request made while one is
+    running waits, and a newer request replaces it.
+    """
+    def __init__(self, workers=1):
+        """
+        Args:
+            workers (int): Number of worker threads
+        """
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='path-planner')
+        self.running = {}  # {ghost: (request, future)}
+        self.waiting = {}  # {ghost: request} latest request waiting for the running one
+        self.delivered = 0
+        self.discarded = 0
+
+    def request(self, ghost):
+        """
+        Ask for a new path from the ghost's cell to its target's cell
+
+        Args:
+            ghost (Ghost): Ghost to plan for, must have a target
+        """
+        request = {
+            'start': ghost.get_grid_position(ghost.x, ghost.y),
+            'goal': ghost.get_grid_position(ghost.target.x, ghost.target.y),
+            'obstacles': frozenset(ghost.capture_obstacles()),
+        }
+        if ghost in self.running:
+            self.waiting[ghost] = request
+        else:
+            self.submit(ghost, request)
+
+    def submit(self, ghost, request):
+        """Start a request on a worker"""
+        future = self.executor.submit(run_request, ghost, request)
+        self.running[ghost] = (request, future)
+
+    def deliver(self):
+        """
+        Hand finished paths to their ghosts, called once per tick on the game thread
+
+        Returns:
+            int: Number of paths delivered
+        """
+        delivered = 0
+        for ghost, (request, future) in list(self.running.items()):
+            if not future.done():
+                continue
+            del self.running[ghost]
+            path, elapsed = future.result()
+
+            if ghost in self.waiting:
+                # A newer request supersedes this result
+                self.discarded += 1
+                self.submit(ghost, self.waiting.pop(ghost))
+                continue
+
+            goal = ghost.get_grid_position(ghost.target.x, ghost.target.y)
+            if goal != request['goal'] or not ghost.receive_path(path):
+                # The target or the ghost moved on, plan again from here
+                self.discarded += 1
+                self.request(ghost)
+                continue
+
+            if ghost.search_stats is not None:
+                ghost.search_stats.record_search(ghost, path, elapsed)
+            self.delivered += 1
+            delivered += 1
+        return delivered
+
+    def reset(self):
+        """
+        Drop every request, e.g. when a game is restored. Searches already
+        running are waited for, since they use the ghosts' search state.
+        """
+        self.waiting.clear()
+        for request, future in self.running.values():
+            if not future.cancel():
+                future.exception()  # Wait for it to finish
+        self.running.clear()
+
+    def shutdown(self):
+        """Stop the worker threads"""
+        self.reset()
+        self.executor.shutdown()
+
+def run_request(ghost, request):
+    """
+    Run one request on a worker thread
+
+    Returns:
+        tuple: (path, search time in seconds)
+    """
+    ghost.planned_obstacles = request['obstacles']
+    try:
+        start = time.perf_counter()
+        path = ghost.complete_search(request['start'], request['goal'])
+        return path, time.perf_counter() - start
+    finally:
+        ghost.planned_obstacles = None
@@ -0,0 +1,167 @@
+import hashlib
+import os
+import numpy as np
+from directions import DIRECTIONS
+from gridBFS import GridBFS
+
+# Bump when the on-disk layout of the table changes
+CACHE_VERSION = 1
+
+# Sources per batch of the bit-packed BFS that fills the distances
+BFS_BATCH = 64
+
+class PathTable:
+    """
+    All-pairs shortest path table over the walkable cells of a static maze.
+
+    distances[i, j] is the number of steps from walkable cell i to cell j
+    (-1 when unreachable) and next_hops[i, j] is the index of the first cell
+    after i on a shortest path to j. A static query is answered by following
+    next hops, in O(path length) and without any search.
+    """
+    def __init__(self, maze, table):
+        self.cols = maze.cols
+        self.rows = maze.rows
+
+        # Walkable cells in row-major order and the reverse lookup
+        walls = np.frombuffer(bytes(maze.wall_grid), dtype=np.uint8)
+        self.cells = np.flatnonzero(walls == 0)
+        self.cell_index = np.full(maze.rows * maze.cols, -1, dtype=np.int32)
+        self.cell_index[self.cells] = np.arange(len(self.cells), dtype=np.int32)
+
+        # table[0] holds the distances, table[1] the next hops
+        self.table = table
+        self.distances = table[0]
+        self.next_hops = table[1]
+
+    @staticmethod
+    def get_maze_key(maze):
+        """Hash of the maze text, used to name the cache file"""
+        text = '\n'.join(maze.layout)
+        return hashlib.sha1(f'{CACHE_VERSION}:{text}'.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def count_cells(maze):
+        """Number of walkable cells of a maze, the side of the table"""
+        return int(np.count_nonzero(np.frombuffer(bytes(maze.wall_grid), dtype=np.uint8) == 0))
+
+    @classmethod
+    def load_or_build(cls, maze, cache_dir, max_cells=None):
+        """
+        Load the table for a maze from the cache directory, building and
+        saving it first if it is not cached yet. The cached file is
+        memory-mapped, so later startups do not read it into memory up front.
+
+        Args:
+            maze (Maze): Maze to build the table for
+            cache_dir (str): Directory holding cached tables
+            max_cells (int): Largest number of walkable cells to build a
+                table for, None for no limit
+
+        Returns:
+            PathTable: Table for the maze, None if the maze is over max_cells
+        """
+        if max_cells is not None and cls.count_cells(maze) > max_cells:
+            return None
+
+        cache_path = os.path.join(cache_dir, f'pathTable-{cls.get_maze_key(maze)}.npy')
+        if not os.path.exists(cache_path):
+            table = cls.build_table(maze)
+            os.makedirs(cache_dir, exist_ok=True)
+            # Write to a temporary file first so a crash never leaves a broken cache
+            temp_path = f'{cache_path}.{os.getpid()}.tmp'
+            with open(temp_path, 'wb') as file:
+                np.save(file, table)
+            os.replace(temp_path, cache_path)
+
+        table = np.load(cache_path, mmap_mode='r')
+        path_table = cls(maze, table)
+        if table.shape[1] != len(path_table.cells):
+            raise ValueError(f"Cached path table {cache_path} does not match the maze")
+        return path_table
+
+    @classmethod
+    def build_table(cls, maze):
+        """
+        Run a BFS from every walkable cell with NumPy.
+
+        The distances come from the bit-packed GridBFS, BFS_BATCH sources at
+        a time. Next hops are then the neighbor with the smallest distance
+        to the goal, taking the first one in DIRECTIONS order on ties.
+
+        Returns:
+            numpy.ndarray: Array of shape (2, cells, cells) with distances and next hops
+        """
+        walls = np.frombuffer(bytes(maze.wall_grid), dtype=np.uint8).reshape(maze.rows, maze.cols)
+        cells = np.flatnonzero(walls.ravel() == 0)
+        count = len(cells)
+        dtype = np.int16 if count < np.iinfo(np.int16).max else np.int32
+
+        cell_index = np.full(maze.rows * maze.cols, -1, dtype=np.int64)
+        cell_index[cells] = np.arange(count)
+
+        # Neighbor indices per cell, with `count` as a sentinel for "no neighbor"
+        grid_y, grid_x = np.divmod(cells, maze.cols)
+        neighbors = np.full((count, len(DIRECTIONS)), count, dtype=np.int64)
+        for direction, (dx, dy) in enumerate(DIRECTIONS):
+            new_x, new_y = grid_x + dx, grid_y + dy
+            inside = (new_x >= 0) & (new_x < maze.cols) & (new_y >= 0) & (new_y < maze.rows)
+            target = np.where(inside, new_y * maze.cols + new_x, 0)
+            neighbor = np.where(inside, cell_index[target], -1)
+            neighbors[:, direction] = np.where(neighbor >= 0, neighbor, count)
+
+        # BFS from every source: rows are sources, columns cells
+        kernel = GridBFS(maze)
+        sources = [(int(x), int(y)) for x, y in zip(grid_x, grid_y)]
+        distances = np.empty((count, count), dtype=dtype)
+        for first in range(0, count, BFS_BATCH):
+            fields = kernel.distance_fields(sources[first:first + BFS_BATCH])
+            distances[first:first + BFS_BATCH] = fields[:, cells]
+
+        # Next hop from cell i towards cell j
+        unreachable = np.iinfo(dtype).max
+        padded = np.vstack([distances, np.full((1, count), -1, dtype=dtype)])
+        padded[padded < 0] = unreachable
+        best = np.full((count, count), unreachable, dtype=dtype)
+        next_hops = np.arange(count, dtype=dtype)[:, None].repeat(count, axis=1)
+        for direction in range(len(DIRECTIONS)):
+            candidate = padded[neighbors[:, direction]]
+            better = candidate < best
+            best[better] = candidate[better]
+            next_hops = np.where(better, neighbors[:, direction][:, None].astype(dtype), next_hops)
+
+        return np.stack([distances, next_hops])
+
+    def get_index(self, cell):
+        """Table index of a grid cell, or -1 if the cell is not walkable"""
+        grid_x, grid_y = cell
+        if not (0 <= grid_x < self.cols and 0 <= grid_y < self.rows):
+            return -1
+        return int(self.cell_index[grid_y * self.cols + grid_x])
+
+    def get_distance(self, start, goal):
+        """Shortest path length between two cells, or None if there is none"""
+        start_index, goal_index = self.get_index(start), self.get_index(goal)
+        if start_index < 0 or goal_index < 0:
+            return None
+        distance = int(self.distances[start_index, goal_index])
+        return distance if distance >= 0 else None
+
+    def get_path(self, start, goal):
+        """
+        Follow next hops from start to goal
+
+        Returns:
+            list: Grid cells from start to goal, or None if either cell is not
+            walkable or the goal cannot be reached
+        """
+        if self.get_distance(start, goal) is None:
+            return None
+
+        index, goal_index = self.get_index(start), self.get_index(goal)
+        path = [start]
+        while index != goal_index:
+            index = int(self.next_hops[index, goal_index])
+            grid_y, grid_x = divmod(int(self.cells[index]), self.cols)
+            path.append((grid_x, grid_y))
+        return path
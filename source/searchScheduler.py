@@ -0,0 +1,76 @@
+from collections import deque
+
+class SearchScheduler:
+    """
+    Spreads ghost searches over frames.
+
+    Every ghost expands at most node_budget nodes of its search per frame,
+    and at most starts_per_tick ghosts may start a new search in the same
+    frame. Ghosts asking to start wait in a FIFO queue, so recomputes that
+    fall due together are staggered over consecutive frames instead of all
+    running in one. A ghost that stops asking (its recompute is no longer
+    due) leaves the queue at the next frame.
+    """
+    def __init__(self, node_budget, starts_per_tick=1):
+        """
+        Args:
+            node_budget (int): Nodes each ghost may expand per frame
+            starts_per_tick (int): Searches that may start per frame
+        """
+        self.node_budget = node_budget
+        self.starts_per_tick = starts_per_tick
+        self.waiting = deque()  # Ghosts waiting to start a search, oldest first
+        self.started = 0  # Searches started in the current frame
+        self.asked = set()  # Ghosts that asked in the current frame
+
+    def begin_tick(self):
+        """Start a new frame, called by the engine before the ghosts update"""
+        self.waiting = deque(ghost for ghost in self.waiting if ghost in self.asked)
+        self.asked.clear()
+        self.started = 0
+
+    def may_start(self, ghost):
+        """
+        Ask whether a ghost may start its search in this frame
+
+        Args:
+            ghost (Ghost): Ghost whose path is due for a recompute
+
+        Returns:
+            bool: True if the ghost should start now, otherwise it stays queued
+        """
+        self.asked.add(ghost)
+        if ghost not in self.waiting:
+            self.waiting.append(ghost)
+        if self.started >= self.starts_per_tick or self.waiting[0] is not ghost:
+            return False
+        self.waiting.popleft()
+        self.started += 1
+        return True
+
+    def snapshot(self, ghosts):
+        """
+        Capture the queue between two frames. Only the ghosts that asked in
+        the last frame stay queued into the next one.
+
+        Args:
+            ghosts (list): Ghosts of the game, to store the queue as indices
+
+        Returns:
+            list: Indices of the queued ghosts, oldest first
+        """
+        ghosts = list(ghosts)
+        return [ghosts.index(ghost) for ghost in self.waiting if ghost in self.asked]
+
+    def restore(self, state, ghosts):
+        """Put the queue back in a state captured by snapshot"""
+        ghosts = list(ghosts)
+        self.waiting = deque(ghosts[index] for index in state)
+        self.asked = set(self.waiting)
+        self.started = 0
+
+    def reset(self):
+        """Forget queued ghosts"""
+        self.waiting.clear()
+        self.asked.clear()
+        self.started = 0
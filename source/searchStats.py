@@ -0,0 +1,129 @@
+import time
+import tracemalloc
+from collections import deque
+import pygame
+
+# Measurements recorded for every search
+SEARCH_FIELDS = ['time', 'expanded', 'generated', 'max_frontier', 'path_length', 'peak_memory']
+
+class SearchStats:
+    """
+    Per-ghost search instrumentation.
+
+    Ghost.find_path runs every search through measure() when a SearchStats is
+    attached to the ghost, and skips it entirely otherwise. The counters
+    (expanded, generated, max_frontier) are filled in by the ghost's
+    calculate_path; time, path length and peak memory are measured here.
+    """
+    def __init__(self, window=60, trace_memory=False):
+        """
+        Args:
+            window (int): Number of recent searches kept for the rolling means
+            trace_memory (bool): Measure the peak allocation of each search with tracemalloc
+        """
+        self.trace_memory = trace_memory
+        self.count = 0
+        self.totals = dict.fromkeys(SEARCH_FIELDS, 0)
+        self.maxima = dict.fromkeys(SEARCH_FIELDS, 0)
+        self.recent = deque(maxlen=window)
+        self.last = None
+
+    def measure(self, ghost, search):
+        """
+        Run one search and record its measurements
+
+        Args:
+            ghost (Ghost): Ghost running the search, read for its node counters
+            search (callable): Search to run, returns the path
+
+        Returns:
+            list: The path returned by the search
+        """
+        if self.trace_memory:
+            # Trace only while the search runs, unless the caller already traces
+            started_tracing = not tracemalloc.is_tracing()
+            if started_tracing:
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+            base_memory = tracemalloc.get_traced_memory()[0]
+
+        start = time.perf_counter()
+        path = search()
+        elapsed = time.perf_counter() - start
+
+        peak_memory = 0
+        if self.trace_memory:
+            peak_memory = tracemalloc.get_traced_memory()[1] - base_memory
+            if started_tracing:
+                tracemalloc.stop()
+
+        self.record_search(ghost, path, elapsed, peak_memory)
+        return path
+
+    def record_search(self, ghost, path, elapsed, peak_memory=0):
+        """
+        Record a finished search: its time and path, and the ghost's node counters
+
+        Time-sliced searches call this directly with the time summed over
+        their slices, and the planner with the time spent on its worker.
+        Neither is measured for memory.
+        """
+        self.record({
+            'time': elapsed,
+            'expanded': ghost.expanded_nodes,
+            'generated': ghost.generated_nodes,
+            'max_frontier': ghost.max_frontier,
+            'path_length': len(path),
+            'peak_memory': peak_memory,
+        })
+
+    def record(self, sample):
+        """Add one search's measurements (a dict with SEARCH_FIELDS keys) to the aggregates"""
+        self.count += 1
+        for field in SEARCH_FIELDS:
+            self.totals[field] += sample[field]
+            if sample[field] > self.maxima[field]:
+                self.maxima[field] = sample[field]
+        self.recent.append(sample)
+        self.last = sample
+
+    def mean(self, field):
+        """Mean of a field over all recorded searches"""
+        return self.totals[field] / self.count if self.count else 0
+
+    def recent_mean(self, field):
+        """Mean of a field over the rolling window of recent searches"""
+        if not self.recent:
+            return 0
+        return sum(sample[field] for sample in self.recent) / len(self.recent)
+
+def draw_search_overlay(screen, ghosts, font, position=(4, 4)):
+    """
+    Draw one line of rolling search statistics per instrumented ghost
+
+    Args:
+        screen (pygame.Surface): Surface to draw on
+        ghosts (iterable): Ghosts whose search_stats are shown
+        font (pygame.font.Font): Font for the overlay text
+        position (tuple): Top left corner of the overlay
+    """
+    x, y = position
+    for ghost in ghosts:
+        stats = ghost.search_stats
+        if stats is None or stats.last is None:
+            continue
+        text = (f"{type(ghost).__name__:20s} {stats.count:5d} searches"
+                f"  {stats.recent_mean('time') * 1e3:6.2f} ms"
+                f"  exp {stats.recent_mean('expanded'):6.0f}"
+                f"  gen {stats.recent_mean('generated'):6.0f}"
+                f"  frontier {stats.last['max_frontier']:4d}"
+                f"  len {stats.last['path_length']:3d}")
+        if stats.trace_memory:
+            text += f"  peak {stats.maxima['peak_memory'] / 1024:6.1f} KiB"
+
+        label = font.render(text, True, ghost.color)
+        background = pygame.Surface(label.get_size(), pygame.SRCALPHA)
+        background.fill((0, 0, 0, 180))
+        screen.blit(background, (x, y))
+        screen.blit(label, (x, y))
+        y += label.get_height()
@@ -0,0 +1,29 @@
+class SimClock:
+    """
+    Fixed-timestep simulation clock.
+
+    The game loop advances it once per engine tick, and game logic measures
+    time in ticks instead of reading the wall clock, so a game plays out the
+    same whether it runs at the windowed frame rate or headless thousands
+    of ticks per second. seconds() and ticks_for() convert between ticks
+    and the simulated time at the frame rate the game was designed for.
+    """
+    def __init__(self, tick_rate):
+        """
+        Args:
+            tick_rate (int): Ticks per simulated second, usually config.FRAME_RATE
+        """
+        self.tick_rate = tick_rate
+        self.ticks = 0
+
+    def advance(self):
+        """Move the clock forward by one tick"""
+        self.ticks += 1
+
+    def seconds(self):
+        """Simulated time since tick 0, in seconds"""
+        return self.ticks / self.tick_rate
+
+    def ticks_for(self, seconds):
+        """Number of ticks in a simulated duration"""
+        return round(seconds * self.tick_rate)
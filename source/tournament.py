@@ -0,0 +1,163 @@
+"""
+Tournament runner: plays many headless games per ghost type and maze in a
+process pool and aggregates how well each pathfinding algorithm hunts.
+
+Every game puts the ghost type under test on all ghost spawns of the maze.
+Game i of every ghost type uses the same Pacman seed, so the algorithms are
+compared on the same Pacman behaviour.
+
+Run from the repository root, for example:
+    python source/tournament.py --mazes input/maze.txt --games 20 --json results.json
+"""
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import argparse
+import csv
+import json
+from concurrent.futures import ProcessPoolExecutor
+import config
+from headless import init_headless_display, create_world, run_engine, PACMAN_POLICIES
+from searchStats import SearchStats
+
+# Columns of the per-game CSV output
+GAME_FIELDS = [
+    'maze', 'ghost_type', 'game', 'policy', 'seed', 'state', 'captured', 'capture_ticks',
+    'score', 'ticks', 'searches', 'nodes_expanded', 'nodes_generated', 'max_frontier', 'search_time',
+    'peak_search_memory', 'elapsed',
+]
+
+def play_match(job):
+    """
+    Play one tournament game in a worker process
+
+    Args:
+        job (dict): maze, ghost_type, game, policy, seed, max_ticks and trace_memory
+
+    Returns:
+        dict: One row of results, see GAME_FIELDS
+    """
+    maze_layout = config.load_maze_layout(job['maze'])
+    ghost_spawns = {symbol: job['ghost_type'] for symbol in config.GHOST_SPAWNS}
+    world = create_world(maze_layout, ghost_spawns=ghost_spawns)
+    engine = world.engine
+
+    for ghost in engine.ghosts:
+        ghost.search_stats = SearchStats(trace_memory=job['trace_memory'])
+
+    try:
+        result = run_engine(engine, PACMAN_POLICIES[job['policy']](job['seed']), job['max_ticks'])
+    finally:
+        # Stops the planner's worker threads, the pool process plays more games
+        world.close()
+
+    all_stats = [ghost.search_stats for ghost in engine.ghosts]
+
+    captured = result['state'] == engine.LOST
+    return {
+        'maze': job['maze'],
+        'ghost_type': job['ghost_type'],
+        'game': job['game'],
+        'policy': job['policy'],
+        'seed': job['seed'],
+        'state': result['state'],
+        'captured': captured,
+        'capture_ticks': result['ticks'] if captured else None,
+        'score': result['score'],
+        'ticks': result['ticks'],
+        'elapsed': result['elapsed'],
+        'searches': sum(stats.count for stats in all_stats),
+        'nodes_expanded': sum(stats.totals['expanded'] for stats in all_stats),
+        'nodes_generated': sum(stats.totals['generated'] for stats in all_stats),
+        'max_frontier': max((stats.maxima['max_frontier'] for stats in all_stats), default=0),
+        'search_time': sum(stats.totals['time'] for stats in all_stats),
+        'peak_search_memory': max((stats.maxima['peak_memory'] for stats in all_stats), default=0),
+    }
+
+def summarize(rows):
+    """
+    Aggregate game rows per (maze, ghost type)
+
+    Returns:
+        list: One summary dict per maze and ghost type
+    """
+    groups = {}
+    for row in rows:
+        groups.setdefault((row['maze'], row['ghost_type']), []).append(row)
+
+    summary = []
+    for (maze, ghost_type), games in sorted(groups.items()):
+        captures = [game['capture_ticks'] for game in games if game['captured']]
+        searches = sum(game['searches'] for game in games)
+        summary.append({
+            'maze': maze,
+            'ghost_type': ghost_type,
+            'games': len(games),
+            'capture_rate': len(captures) / len(games),
+            'mean_capture_ticks': sum(captures) / len(captures) if captures else None,
+            'mean_capture_seconds': sum(captures) / len(captures) / config.FRAME_RATE if captures else None,
+            'mean_score': sum(game['score'] for game in games) / len(games),
+            'searches': searches,
+            'mean_nodes_expanded': sum(game['nodes_expanded'] for game in games) / searches if searches else 0,
+            'mean_nodes_generated': sum(game['nodes_generated'] for game in games) / searches if searches else 0,
+            'max_frontier': max(game['max_frontier'] for game in games),
+            'mean_search_ms': sum(game['search_time'] for game in games) / searches * 1e3 if searches else 0,
+            'peak_search_memory': max(game['peak_search_memory'] for game in games),
+        })
+    return summary
+
+def print_summary(summary):
+    """Print the aggregated results as a table"""
+    print(f"{'maze':24s} {'ghost':16s} {'games':>5s} {'caught':>7s} {'ticks':>8s}"
+          f" {'nodes':>9s} {'generated':>9s} {'frontier':>8s} {'search ms':>10s} {'peak KiB':>9s}")
+    for entry in summary:
+        mean_ticks = entry['mean_capture_ticks']
+        print(f"{os.path.basename(entry['maze']):24s} {entry['ghost_type']:16s} {entry['games']:5d}"
+              f" {entry['capture_rate']:7.0%} {mean_ticks if mean_ticks is not None else float('nan'):8.0f}"
+              f" {entry['mean_nodes_expanded']:9.1f} {entry['mean_nodes_generated']:9.1f}"
+              f" {entry['max_frontier']:8d} {entry['mean_search_ms']:10.3f}"
+              f" {entry['peak_search_memory'] / 1024:9.1f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Play headless tournaments between the ghost algorithms")
+    parser.add_argument('--mazes', nargs='+', default=[config.MAZE_PATH], help="maze files to play on")
+    parser.add_argument('--ghosts', nargs='+', default=sorted(config.GHOST_TYPES),
+                        choices=sorted(config.GHOST_TYPES), help="ghost types (config.GHOST_TYPES keys)")
+    parser.add_argument('--games', type=int, default=10, help="games per maze and ghost type")
+    parser.add_argument('--policy', choices=sorted(PACMAN_POLICIES), default='random', help="Pacman policy")
+    parser.add_argument('--seed', type=int, default=0, help="seed of the first game's Pacman policy")
+    parser.add_argument('--max-ticks', type=int, default=20000, help="tick limit per game")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument('--trace-memory', action=argparse.BooleanOptionalAction, default=True,
+                        help="measure peak search memory with tracemalloc (slower)")
+    parser.add_argument('--csv', help="write per-game results to this CSV file")
+    parser.add_argument('--json', help="write per-game results and the summary to this JSON file")
+    args = parser.parse_args()
+
+    jobs = [
+        {
+            'maze': maze, 'ghost_type': ghost_type, 'game': game, 'policy': args.policy,
+            'seed': args.seed + game, 'max_ticks': args.max_ticks, 'trace_memory': args.trace_memory,
+        }
+        for maze in args.mazes
+        for ghost_type in args.ghosts
+        for game in range(args.games)
+    ]
+
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=init_headless_display) as executor:
+        rows = list(executor.map(play_match, jobs))
+
+    summary = summarize(rows)
+    print_summary(summary)
+
+    if args.csv:
+        with open(args.csv, 'w', newline='') as file:
+            writer = csv.DictWriter(file, fieldnames=GAME_FIELDS)
+            writer.writeheader()
+            writer.writerows(rows)
+    if args.json:
+        with open(args.json, 'w') as file:
+            json.dump({'games': rows, 'summary': summary}, file, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+import pygame
+import random
+import config
+from collections import deque
+from pacman import Pacman
+from maze import Maze
+from flowField import FlowField
+from pathTable import PathTable
+from landmarks import Landmarks
+from searchStats import SearchStats
+from searchScheduler import SearchScheduler
+from pathPlanner import PathPlanner
+from engine import GameEngine
+from ghostGrid import GhostGrid
+from simClock import SimClock
+from assetManager import ASSETS
+
+class World:
+    """
+    One game session: owns the maze, Pacman, the ghost registry and the
+    engine stepping them.
+
+    Ghosts only see the ghosts of their own world (through ghost.peers), so
+    several worlds can run side by side in one process. The entities are
+    created once; reset() and restore() put snapshots of their state back
+    instead of rebuilding the maze and reloading images.
+    """
+    def __init__(self, maze_layout, cell_size, ghost_spawns=None,
+                 width=config.SCREEN_WIDTH, height=config.SCREEN_HEIGHT, seed=0):
+        """
+        Args:
+            maze_layout (list): Maze layout as a list of strings
+            cell_size (int): Cell size in pixels
+            ghost_spawns (dict): Ghost type per maze symbol, defaults to config.GHOST_SPAWNS
+            width (int): Screen width, used to place Pacman if the maze has no 'M'
+            height (int): Screen height, used to place Pacman if the maze has no 'M'
+            seed (int): Seed of the random generator shared by the ghosts
+        """
+        self.cell_size = cell_size
+        self.ghost_spawns = config.GHOST_SPAWNS if ghost_spawns is None else ghost_spawns
+        self.width = width
+        self.height = height
+
+        # Simulation time and randomness: the engine advances the clock every
+        # tick, and both are part of the snapshot, so a game replays exactly
+        self.clock = SimClock(config.FRAME_RATE)
+        self.rng = random.Random(seed)
+
+        # The static maze and its caches are built once and kept across resets
+        self.maze = Maze(cell_size, maze_layout)
+
+        # All-pairs path table, loaded from the cache when enabled. Mazes
+        # too large for a table (None) keep searching live
+        self.path_table = None
+        if config.GHOST_CONFIG['PATH_TABLE']:
+            self.path_table = PathTable.load_or_build(self.maze, config.CACHE_DIR, config.GHOST_CONFIG['PATH_TABLE_MAX_CELLS'])
+
+        # Landmark distances for the ALT heuristic, when enabled
+        landmark_count = config.GHOST_CONFIG['LANDMARKS']
+        self.landmarks = Landmarks(self.maze, landmark_count) if landmark_count else None
+
+        # Registries, filled once by build
+        self.ghosts = GhostGrid()  # Also hashes the ghosts by cell for collisions and obstacles
+        self.all_sprites = pygame.sprite.RenderUpdates()  # Also reports the rects it drew
+
+        self.build()
+
+        if config.ASSET_ATLAS:
+            # Pack every sprite image loaded by build into one surface and
+            # point the sprites at their regions of it
+            ASSETS.pack_atlas()
+            for sprite in self.all_sprites:
+                sprite.load_images()
+
+        # Restoring this snapshot starts a new game without creating anything
+        self.initial_state = self.snapshot()
+
+    def build(self):
+        """Create Pacman, the ghosts and the engine of the first game"""
+        # Get initial entity positions
+        initial_positions = self.maze.get_initial_entity_positions()
+
+        # Initialize Pacman
+        pacman_pos = initial_positions.get('M', (self.width // 2, (self.height - 50) // 2))
+        self.pacman = Pacman(pacman_pos, self.cell_size, self.maze)
+        self.all_sprites.add(self.pacman)
+
+        # Shared distance field, only used when flow field mode is enabled
+        flow_field = FlowField(self.maze, self.pacman) if config.GHOST_CONFIG['FLOW_FIELD'] else None
+
+        # Spreads searches over frames, only when a node budget is configured
+        node_budget = config.GHOST_CONFIG['SEARCH_NODE_BUDGET']
+        scheduler = SearchScheduler(node_budget, config.GHOST_CONFIG['SEARCH_STARTS_PER_TICK']) if node_budget else None
+
+        # Searches on worker threads, only when workers are configured
+        workers = config.GHOST_CONFIG['PLANNER_WORKERS']
+        self.planner = PathPlanner(workers) if workers else None
+
+        # Corridor-compressed search graph, shared by the ghosts
+        junction_graph = self.maze.get_junction_graph() if config.GHOST_CONFIG['JUNCTION_GRAPH'] else None
+
+        # Initialize Ghosts using initial positions and configuration
+        ghosts_per_type = config.GHOST_CONFIG['GHOSTS_PER_TYPE']
+        for ghost_symbol, ghost_type in self.ghost_spawns.items():
+            if ghost_symbol in initial_positions:
+                ghost_class = config.GHOST_TYPES.get(ghost_type)
+
+                if not ghost_class:
+                    continue
+                for position in self.get_spawn_positions(initial_positions[ghost_symbol], ghosts_per_type):
+                    ghost = ghost_class(position, self.cell_size, self.maze, self.pacman)
+                    ghost.debug_mode = config.GHOST_CONFIG['DEBUG']
+                    ghost.flow_field = flow_field
+                    ghost.path_table = self.path_table
+                    ghost.junction_graph = junction_graph
+                    ghost.landmarks = self.landmarks
+                    ghost.scheduler = scheduler
+                    ghost.planner = self.planner
+                    ghost.clock = self.clock
+                    ghost.rng = self.rng
+                    if config.GHOST_CONFIG['INSTRUMENT']:
+                        ghost.search_stats = SearchStats(trace_memory=config.GHOST_CONFIG['TRACE_SEARCH_MEMORY'])
+                    ghost.peers = self.ghosts
+                    self.ghosts.add(ghost)
+                    self.all_sprites.add(ghost)
+
+        self.engine = GameEngine(self.maze, self.pacman, self.ghosts, scheduler, self.planner, self.clock)
+
+    def get_spawn_positions(self, position, count):
+        """
+        Spread several ghosts of one spawn over the open cells nearest to it
+
+        Args:
+            position (tuple): Pixel position of the spawn
+            count (int): Number of ghosts to place
+
+        Returns:
+            list: Pixel positions, the spawn itself first. Positions repeat
+            when the spawn's area has fewer open cells than ghosts.
+        """
+        if count <= 1:
+            return [position][:count]
+
+        # Breadth-first over the open cells, so the ghosts stay near the spawn
+        cell_size = self.cell_size
+        start = (int(position[0] // cell_size), int(position[1] // cell_size))
+        cells = [start]
+        seen = {start}
+        queue = deque([start])
+        while queue and len(cells) < count:
+            for neighbor in self.maze.get_adjacent_cells(*queue.popleft()):
+                if neighbor not in seen:
+                    seen.add(neighbor)
+                    cells.append(neighbor)
+                    queue.append(neighbor)
+
+        positions = [position]
+        for index in range(1, count):
+            grid_x, grid_y = cells[index % len(cells)]
+            positions.append((grid_x * cell_size + cell_size // 2, grid_y * cell_size + cell_size // 2))
+        return positions
+
+    def snapshot(self):
+        """
+        Capture the state of the game: engine (including the clock), the
+        random generator, remaining dots, Pacman and every ghost. The
+        snapshot only holds plain values (no sprites or surfaces), so it can
+        be copied, kept for a rewind or restored into any World built from
+        the same maze and spawns.
+
+        Returns:
+            dict: State accepted by restore
+        """
+        return {
+            'engine': self.engine.snapshot(),
+            'rng': self.rng.getstate(),
+            'dots': bytes(self.maze.dot_grid),
+            'pacman': self.pacman.snapshot(),
+            'ghosts': [ghost.snapshot() for ghost in self.ghosts],
+        }
+
+    def restore(self, state):
+        """
+        Put the game back in a state captured by snapshot, reusing the
+        existing maze, sprites and images
+        """
+        self.engine.restore(state['engine'])
+        self.rng.setstate(state['rng'])
+        self.maze.restore_dots(state['dots'])
+        self.pacman.restore(state['pacman'])
+        for ghost, ghost_state in zip(self.ghosts, state['ghosts']):
+            ghost.restore(ghost_state)
+
+    def reset(self):
+        """
+        Start a new game in place by restoring the initial snapshot
+
+        Returns:
+            GameEngine: Engine of the game, ready to step
+        """
+        self.restore(self.initial_state)
+        return self.engine
+
+    def close(self):
+        """Stop the planner's worker threads, if any"""
+        if self.planner is not None:
+            self.planner.shutdown()